@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class BicepVariableRenderer(VariableRenderer["BicepLocalGraph"]):
+    SUPPORTS_PARALLEL_RENDERING = True
+
     def __init__(self, local_graph: BicepLocalGraph) -> None:
         super().__init__(local_graph)
 
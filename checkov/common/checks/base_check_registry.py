@@ -13,6 +13,7 @@ from typing import Generator, Tuple, Dict, List, Optional, Any, TYPE_CHECKING
 
 from checkov.common.models.enums import CheckResult
 from checkov.common.typing import _SkippedCheck, _CheckResult
+from checkov.common.util.suppression_index import SuppressionIndex
 from checkov.runner_filter import RunnerFilter
 
 if TYPE_CHECKING:
@@ -118,11 +119,9 @@ class BaseCheckRegistry:
             return results
 
         checks = self.get_checks(entity_type)
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info: _SkippedCheck = {}
-            if skipped_checks:
-                if check.id in [x["id"] for x in skipped_checks]:
-                    skip_info = [x for x in skipped_checks if x["id"] == check.id][0]
+            skip_info = suppressions.get(check.id)
 
             if runner_filter.should_run_check(
                     check,
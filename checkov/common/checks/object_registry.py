@@ -6,6 +6,7 @@ from checkov.common.checks.base_check_registry import BaseCheckRegistry
 from checkov.common.models.enums import CheckResult
 from checkov.common.checks.enums import BlockType
 from checkov.common.typing import _SkippedCheck, _ScannerCallableAlias
+from checkov.common.util.suppression_index import SuppressionIndex
 
 if TYPE_CHECKING:
     from checkov.common.checks.base_check import BaseCheck
@@ -104,8 +105,9 @@ class Registry(BaseCheckRegistry):
         entity_type: str,
         results: dict[str, Any],
     ) -> None:
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info = ([x for x in skipped_checks if x["id"] == check.id] or [{}])[0]
+            skip_info = suppressions.get(check.id)
 
             if runner_filter.should_run_check(check=check, report_type=self.report_type):
                 scanner = self._scanner.get(check.block_type, self._scan_document)
@@ -256,9 +256,14 @@ class GraphCheckParser(BaseGraphCheckParser):
         else:
             solver = check.operator
 
-        return operators_to_attributes_solver_classes.get(solver, lambda *args: None)(
+        attribute_solver = operators_to_attributes_solver_classes.get(solver, lambda *args: None)(
             check.resource_types, check.attribute, check.attribute_value, check.is_jsonpath_check
         )
+        if attribute_solver:
+            # compile the regex and jsonpath expressions once instead of on every evaluated vertex
+            attribute_solver.compile_expressions()
+
+        return attribute_solver
 
     def get_check_solver(self, check: BaseGraphCheck) -> BaseSolver:
         sub_solvers: List[BaseSolver] = []
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING, Union
+
+from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver import (
+    BaseAttributeSolver,
+    shared_vertex_values,
+)
+from checkov.common.checks_infra.solvers.complex_solvers.base_complex_solver import BaseComplexSolver
+from checkov.common.graph.checks_infra.base_check import BaseGraphCheck
+from checkov.common.graph.db_connectors.graph_index import GraphIndex, get_graph_index
+
+if TYPE_CHECKING:
+    from checkov.common.typing import LibraryGraph
+
+RESULT_PASSED = 0
+RESULT_FAILED = 1
+RESULT_UNKNOWN = 2
+
+# check index, vertex index, result
+_VertexResult = Tuple[int, int, int]
+_CheckResults = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]
+
+
+class GraphChecksPlan:
+    """
+    Evaluates all vertex based graph checks in a single pass over the graph vertices.
+
+    Attribute and complex solvers decide on every vertex on its own, therefore their checks are grouped by
+    the resource types they are interested in and each vertex is only evaluated by the checks matching its type.
+    All other checks, like connection checks, still need to be run on their own.
+    """
+
+    def __init__(self, checks: List[BaseGraphCheck]) -> None:
+        self.vertex_checks: List[BaseGraphCheck] = []
+        self.other_checks: List[BaseGraphCheck] = []
+
+        for check in checks:
+            if self.is_vertex_check(check):
+                self.vertex_checks.append(check)
+            else:
+                self.other_checks.append(check)
+
+        self._solvers: List[Union[BaseAttributeSolver, BaseComplexSolver]] = [
+            check.solver for check in self.vertex_checks  # type:ignore[misc]  # is checked in is_vertex_check()
+        ]
+        self._checks_by_resource_type: Dict[Optional[str], List[int]] = {}
+        self._checks_without_resource_type: List[int] = []
+        self._block_types: List[Optional[Set[str]]] = []
+        self._vertex_types_checks: Dict[Tuple[Optional[str], Optional[str]], Tuple[int, ...]] = {}
+        self._graph_index: Optional[GraphIndex] = None
+
+    @staticmethod
+    def is_vertex_check(check: BaseGraphCheck) -> bool:
+        # checks or solvers with a custom run logic can't be evaluated vertex by vertex
+        return (
+            type(check).run is BaseGraphCheck.run
+            and isinstance(check.solver, (BaseAttributeSolver, BaseComplexSolver))
+            and type(check.solver).run in (BaseAttributeSolver.run, BaseComplexSolver.run)
+        )
+
+    def run(self, graph_connector: LibraryGraph) -> Dict[BaseGraphCheck, _CheckResults]:
+        """Runs all vertex based checks and returns their passed, failed and unknown vertices"""
+
+        if not self.vertex_checks:
+            return self.get_results(())
+
+        vertices_count = self.compile(graph_connector)
+        return self.get_results((self.evaluate_vertices(range(vertices_count)),))
+
+    def compile(self, graph_connector: LibraryGraph) -> int:
+        """Groups the checks by their resource types, which depend on the used graph library
+
+        Returns the amount of vertices, which can be evaluated by evaluate_vertices().
+        """
+
+        self._graph_index = get_graph_index(graph_connector) or GraphIndex(graph_connector)
+        self._checks_by_resource_type = {}
+        self._checks_without_resource_type = []
+        self._block_types = []
+        self._vertex_types_checks = {}
+
+        for check_idx, solver in enumerate(self._solvers):
+            resource_types, block_types = solver.get_candidate_types(graph_connector)
+            self._block_types.append(block_types)
+
+            if resource_types is None:
+                self._checks_without_resource_type.append(check_idx)
+                continue
+            for resource_type in set(resource_types):
+                self._checks_by_resource_type.setdefault(resource_type, []).append(check_idx)
+
+        return len(self._graph_index.vertices)
+
+    def get_results(
+        self, vertices_results: Iterable[Optional[List[_VertexResult]]]
+    ) -> Dict[BaseGraphCheck, _CheckResults]:
+        """Resolves the compact results of evaluate_vertices() to the passed, failed and unknown vertices of each check
+
+        A result of None stands for vertices, which failed to be evaluated in another process and is skipped.
+        """
+
+        results: Dict[BaseGraphCheck, _CheckResults] = {check: ([], [], []) for check in self.vertex_checks}
+        for vertex_results in vertices_results:
+            if vertex_results is None:
+                continue
+            for check_idx, vertex_idx, result in vertex_results:
+                results[self.vertex_checks[check_idx]][result].append(
+                    self._graph_index.vertices[vertex_idx]  # type:ignore[union-attr]  # is set in compile()
+                )
+
+        return results
+
+    def evaluate_vertices(self, vertex_indices: range) -> List[_VertexResult]:
+        """Evaluates the given vertices and returns compact results, which can be cheaply sent between processes"""
+
+        graph_index: GraphIndex = self._graph_index  # type:ignore[assignment]  # is set in compile()
+        results: List[_VertexResult] = []
+        for vertex_idx in vertex_indices:
+            check_indices = self._get_vertex_type_checks(*graph_index.vertex_types[vertex_idx])
+            if not check_indices:
+                continue
+
+            vertex = graph_index.vertices[vertex_idx]
+            with shared_vertex_values():
+                for check_idx in check_indices:
+                    try:
+                        result = self._solvers[check_idx].get_operation(vertex=vertex)
+                    except Exception:
+                        logging.debug(
+                            f"Failed to evaluate graph check {self.vertex_checks[check_idx].id} on vertex {vertex_idx}",
+                            exc_info=True,
+                        )
+                        continue
+
+                    # A None indicate for UNKNOWN result - the vertex shouldn't be added to the passed or the failed vertices
+                    if result is None:
+                        results.append((check_idx, vertex_idx, RESULT_UNKNOWN))
+                    elif result:
+                        results.append((check_idx, vertex_idx, RESULT_PASSED))
+                    else:
+                        results.append((check_idx, vertex_idx, RESULT_FAILED))
+
+        return results
+
+    def _get_vertex_type_checks(self, resource_type: Optional[str], block_type: Optional[str]) -> Tuple[int, ...]:
+        """Returns the indices of the checks, which need to evaluate a vertex of the given type"""
+
+        vertex_type = (resource_type, block_type)
+        check_indices = self._vertex_types_checks.get(vertex_type)
+        if check_indices is None:
+            candidates = set(self._checks_without_resource_type)
+            candidates.update(self._checks_by_resource_type.get(resource_type, ()))
+            check_indices = tuple(
+                check_idx
+                for check_idx in sorted(candidates)
+                if self._block_types[check_idx] is None or block_type in self._block_types[check_idx]  # type:ignore[operator]
+            )
+            self._vertex_types_checks[vertex_type] = check_indices
+
+        return check_indices
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Pattern, Tuple, TypeVar
+
+from bc_jsonpath_ng.ext import parse
+
+from checkov.common.util.bounded_cache import BoundedCache
+
+WILDCARD_PATTERN = re.compile(r"(\S+[.][*][.]*)+")
+DEFAULT_EXPRESSION_CACHE_MAX_SIZE = 4096
+
+_T = TypeVar("_T")
+
+
+class ExpressionCache(BoundedCache[Tuple[str, str], Any]):
+    """
+    A bounded, thread-safe cache of the compiled expressions used by the attribute solvers.
+
+    The regex patterns, jsonpath expressions and wildcard attribute expansions of a check don't change between
+    the evaluated vertices, therefore they are compiled once and shared by all solvers using the same expression.
+    The least recently used entries are evicted first, when the cache is full.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_EXPRESSION_CACHE_MAX_SIZE) -> None:
+        super().__init__(max_size=max_size)
+
+    def get_regex(self, pattern: str) -> Pattern[str]:
+        """Returns the compiled regex pattern, raises re.error for an invalid pattern"""
+
+        return self._get("regex", pattern, re.compile)
+
+    def get_jsonpath(self, expression: str) -> Any:
+        """Returns the parsed jsonpath expression, raises an exception for an invalid expression"""
+
+        return self._get("jsonpath", expression, parse)
+
+    def get_attribute_patterns(self, attribute: str) -> Tuple[Pattern[str], Pattern[str]]:
+        """Returns the patterns of a wildcard attribute with and without the index parts"""
+
+        return self._get("attribute_patterns", attribute, _build_attribute_patterns)
+
+    def is_wildcard_attribute(self, attribute: str) -> bool:
+        return self._get("wildcard", attribute, lambda attr: WILDCARD_PATTERN.match(attr) is not None)
+
+    def _get(self, kind: str, expression: str, factory: Callable[[str], _T]) -> _T:
+        # invalid expressions are not cached and raise on every call
+        return self.get_or_compute((kind, expression), lambda key: factory(key[1]))  # type:ignore[no-any-return]  # the kind ensures the type
+
+
+def _build_attribute_patterns(attribute: str) -> Tuple[Pattern[str], Pattern[str]]:
+    index_pattern = r"[\d]+"
+    split_by_dots = attribute.split(".")
+
+    pattern_parts = []
+    pattern_parts_without_index = []
+    for attr_part in split_by_dots:
+        if attr_part == "*":
+            pattern_parts.append(index_pattern)
+        else:
+            attr_part_pattern = f"({attr_part})"
+            pattern_parts.append(attr_part_pattern)
+            pattern_parts_without_index.append(attr_part_pattern)
+
+    pattern = f'^{"[.]".join(pattern_parts)}$'
+    pattern_with_index = re.compile(pattern)
+
+    pattern = f'^{"[.]".join(pattern_parts_without_index)}$'
+    pattern_without_index = re.compile(pattern)
+
+    return pattern_with_index, pattern_without_index
+
+
+expression_cache = ExpressionCache()
@@ -9,15 +9,21 @@ from typing import Any, TYPE_CHECKING
 import yaml
 
 from checkov.common.checks_infra.checks_parser import GraphCheckParser
+from checkov.common.checks_infra.checks_planner import GraphChecksPlan
+from checkov.common.checks_infra.expression_cache import expression_cache
 from checkov.common.graph.checks_infra.base_parser import BaseGraphCheckParser
-from checkov.common.graph.checks_infra.registry import BaseRegistry
+from checkov.common.graph.checks_infra.registry import BaseRegistry, is_graph_checks_multiprocess_enabled
+from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.runner_filter import RunnerFilter
 from checkov.common.checks_infra.resources_types import resources_types
 
 if TYPE_CHECKING:
     from checkov.common.graph.checks_infra.base_check import BaseGraphCheck
+    from checkov.common.typing import _CheckResult, LibraryGraph
 
 CHECKS_POSSIBLE_ENDING = [".yaml", ".yml"]
+# the min. amount of vertices to split the evaluation of the vertex checks into multiple processes
+PARALLEL_EVALUATION_MIN_VERTICES = 1_000
 
 
 class Registry(BaseRegistry):
@@ -62,6 +68,44 @@ class Registry(BaseRegistry):
                                 RunnerFilter.notify_external_check(check.id)
                             self.checks.append(check)
 
+    def run_checks(
+        self, graph_connector: LibraryGraph, runner_filter: RunnerFilter, report_type: str
+    ) -> dict[BaseGraphCheck, list[_CheckResult]]:
+        checks_to_run = [c for c in self.checks if runner_filter.should_run_check(c, report_type=report_type)]
+        plan = GraphChecksPlan(checks_to_run)
+        run_multiprocess = is_graph_checks_multiprocess_enabled()
+
+        check_results: dict[BaseGraphCheck, list[_CheckResult]] = {}
+        plan_results = self.run_plan_multiprocess(plan, graph_connector) if run_multiprocess else plan.run(graph_connector)
+        for check, (passed, failed, unknown) in plan_results.items():
+            self.set_check_results(check, check_results, passed, failed, unknown)
+        self.run_checks_parallel(plan.other_checks, check_results, graph_connector, run_multiprocess=run_multiprocess)
+        self.logger.debug(f"Graph checks expression cache stats: {expression_cache.get_stats()}")
+
+        # keep the order of the checks independent of their run time
+        return {check: check_results[check] for check in checks_to_run if check in check_results}
+
+    @staticmethod
+    def run_plan_multiprocess(
+        plan: GraphChecksPlan, graph_connector: LibraryGraph
+    ) -> dict[BaseGraphCheck, tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]]:
+        """Evaluates the vertex checks of the plan in forked processes, each one handles a shard of the vertices
+
+        The processes share the already saved graph copy-on-write and only send back the compact results
+        of their vertices, which are resolved again to the vertices of the graph in the parent process.
+        """
+
+        if not plan.vertex_checks:
+            return plan.get_results(())
+
+        vertices_count = plan.compile(graph_connector)
+        if vertices_count < PARALLEL_EVALUATION_MIN_VERTICES:
+            return plan.get_results((plan.evaluate_vertices(range(vertices_count)),))
+
+        shard_size = vertices_count // parallel_runner.workers_number + 1
+        shards = [range(idx, min(idx + shard_size, vertices_count)) for idx in range(0, vertices_count, shard_size)]
+        return plan.get_results(parallel_runner.run_function(plan.evaluate_vertices, shards, group_size=1))
+
     def load_external_checks(self, dir: str) -> None:
         self._load_checks_from_dir(dir, True)
 
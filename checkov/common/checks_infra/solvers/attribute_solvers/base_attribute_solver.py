@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import concurrent.futures
 import logging
-import re
 import json
-from typing import List, Tuple, Dict, Any, Optional, Pattern, TYPE_CHECKING
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import List, Tuple, Dict, Any, Optional, Pattern, Set, TYPE_CHECKING
 
 from igraph import Graph
-from bc_jsonpath_ng.ext import parse
 
+from checkov.common.checks_infra.expression_cache import WILDCARD_PATTERN, expression_cache  # noqa: F401  # WILDCARD_PATTERN is kept for backwards compatibility
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
+from checkov.common.graph.db_connectors.graph_index import get_graph_index
 
 from concurrent.futures import ThreadPoolExecutor
 
@@ -23,7 +26,24 @@ if TYPE_CHECKING:
     from checkov.common.typing import LibraryGraph
 
 SUPPORTED_BLOCK_TYPES = {BlockType.RESOURCE, TerraformBlockType.DATA, TerraformBlockType.MODULE}
-WILDCARD_PATTERN = re.compile(r"(\S+[.][*][.]*)+")
+
+
+class _VertexValuesCache(threading.local):
+    values: Optional[Dict[str, bool]] = None
+
+
+_vertex_values_cache = _VertexValuesCache()
+
+
+@contextmanager
+def shared_vertex_values() -> Iterator[None]:
+    """Shares the rendered attribute values of a vertex between all attribute solvers evaluated within the context"""
+
+    _vertex_values_cache.values = {}
+    try:
+        yield
+    finally:
+        _vertex_values_cache.values = None
 
 
 class BaseAttributeSolver(BaseSolver):
@@ -39,6 +59,29 @@ class BaseAttributeSolver(BaseSolver):
         self.value = value
         self.is_jsonpath_check = is_jsonpath_check
         self.parsed_attributes: Dict[Optional[str], Any] = {}
+        # set by compile_expressions
+        self.is_wildcard_attribute: Optional[bool] = None
+        self.attribute_patterns: Optional[Tuple[Pattern[str], Pattern[str]]] = None
+
+    def compile_expressions(self) -> None:
+        """Compiles the expressions of the solver upfront and keeps them on the solver
+
+        The shared expression cache is only used while compiling, the vertex evaluations read the compiled
+        expressions of the solver. Invalid expressions are skipped here and reported, when the solver is evaluated.
+        """
+
+        if not self.attribute:
+            self.is_wildcard_attribute = False
+            return
+
+        self.is_wildcard_attribute = expression_cache.is_wildcard_attribute(self.attribute)
+        try:
+            if self.is_jsonpath_check:
+                self.parsed_attributes[self.attribute] = expression_cache.get_jsonpath(self.attribute)
+            elif self.is_wildcard_attribute:
+                self.attribute_patterns = expression_cache.get_attribute_patterns(self.attribute)
+        except Exception:
+            logging.debug(f"Failed to compile the attribute {self.attribute}", exc_info=True)
 
     def run(self, graph_connector: LibraryGraph) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         executer = ThreadPoolExecutor()
@@ -46,13 +89,18 @@ class BaseAttributeSolver(BaseSolver):
         passed_vertices: List[Dict[str, Any]] = []
         failed_vertices: List[Dict[str, Any]] = []
         unknown_vertices: List[Dict[str, Any]] = []
-        if isinstance(graph_connector, Graph):
-            if self.resource_types:
-                select_kwargs = {"resource_type_in": list(self.resource_types)}
+        graph_index = get_graph_index(graph_connector)
+        if isinstance(graph_connector, Graph) or graph_index:
+            vertices: List[Dict[str, Any]]
+            if graph_index:
+                resource_types, block_types = self.get_candidate_types(graph_connector)
+                vertices = graph_index.get_vertices(resource_types=resource_types, block_types=block_types)
+            elif self.resource_types:
+                vertices = graph_connector.vs.select(resource_type_in=list(self.resource_types))["attr"]
             else:
-                select_kwargs = {"block_type__in": list(SUPPORTED_BLOCK_TYPES)}
+                vertices = graph_connector.vs.select(block_type__in=list(SUPPORTED_BLOCK_TYPES))["attr"]
 
-            for data in graph_connector.vs.select(**select_kwargs)["attr"]:
+            for data in vertices:
                 result = self.get_operation(vertex=data)
                 # A None indicate for UNKNOWN result - the vertex shouldn't be added to the passed or the failed vertices
                 if result is None:
@@ -73,6 +121,17 @@ class BaseAttributeSolver(BaseSolver):
         concurrent.futures.wait(jobs)
         return passed_vertices, failed_vertices, unknown_vertices
 
+    def get_candidate_types(self, graph_connector: LibraryGraph) -> Tuple[Optional[List[str]], Optional[Set[str]]]:
+        """Returns the resource and block types of the vertices, which are evaluated by the solver
+
+        A value of None means, that the vertices are not filtered by the resource or block type.
+        """
+
+        if not self.resource_types:
+            return None, SUPPORTED_BLOCK_TYPES
+        # igraph vertices are not filtered by the block type, when resource types are given
+        return self.resource_types, None if isinstance(graph_connector, Graph) else SUPPORTED_BLOCK_TYPES
+
     def get_operation(self, vertex: Dict[str, Any]) -> Optional[bool]:
         # if this value contains an underendered variable, then we cannot evaluate value checks,
         # and will return None (for UNKNOWN)
@@ -83,18 +142,20 @@ class BaseAttributeSolver(BaseSolver):
         attr_to_check = None
         for attr in attr_parts:
             attr_to_check = f'{attr_to_check}.{attr}' if attr_to_check else attr
-            value_to_check = vertex.get(attr_to_check)
-            value_to_check = self._render_json_str(value_to_check, attr, vertex)
 
             # we can only check is_attribute_value_check when evaluating the full attribute
             # for example, if we have a policy that says "tags.component exists", and tags = local.tags, then
             # we need to check if tags is variable dependent even though this is a not value_attribute check
             if (attr_to_check != self.attribute or self.is_value_attribute_check) \
-                    and self._is_variable_dependant(value_to_check, vertex['source_']) \
+                    and self._is_attribute_variable_dependant(vertex, attr_to_check, attr) \
                     and self.value != '':
                 return None
 
-        if self.attribute and (self.is_jsonpath_check or re.match(WILDCARD_PATTERN, self.attribute)):
+        if self.is_wildcard_attribute is None:
+            # the solver was not created by the checks parser
+            self.compile_expressions()
+
+        if self.attribute and (self.is_jsonpath_check or self.is_wildcard_attribute):
             attribute_matches = self.get_attribute_matches(vertex)
             filtered_attribute_matches = attribute_matches
             if self.is_value_attribute_check and self.value != '':
@@ -144,7 +205,7 @@ class BaseAttributeSolver(BaseSolver):
             if self.is_jsonpath_check:
                 parsed_attr = self.parsed_attributes.get(self.attribute)
                 if parsed_attr is None:
-                    parsed_attr = parse(self.attribute)  # type:ignore[arg-type]  # self.attribute is no longer going to be Optional here
+                    parsed_attr = expression_cache.get_jsonpath(self.attribute)  # type:ignore[arg-type]  # self.attribute is no longer going to be Optional here
                     self.parsed_attributes[self.attribute] = parsed_attr
 
                 for match in parsed_attr.find(vertex):
@@ -155,9 +216,9 @@ class BaseAttributeSolver(BaseSolver):
                     attribute_matches.append(full_path)
 
             elif isinstance(self.attribute, str):
-                attribute_patterns = self.get_attribute_patterns(self.attribute)
+                attribute_patterns = self.attribute_patterns or self.get_attribute_patterns(self.attribute)
                 for attr in vertex:
-                    if any(re.match(re.compile(attribute_pattern), attr) for attribute_pattern in attribute_patterns):
+                    if any(attribute_pattern.match(attr) for attribute_pattern in attribute_patterns):
                         attribute_matches.append(attr)
 
             return attribute_matches
@@ -167,26 +228,20 @@ class BaseAttributeSolver(BaseSolver):
 
     @staticmethod
     def get_attribute_patterns(attribute: str) -> Tuple[Pattern[str], Pattern[str]]:
-        index_pattern = r"[\d]+"
-        split_by_dots = attribute.split(".")
-
-        pattern_parts = []
-        pattern_parts_without_index = []
-        for attr_part in split_by_dots:
-            if attr_part == "*":
-                pattern_parts.append(index_pattern)
-            else:
-                attr_part_pattern = f"({attr_part})"
-                pattern_parts.append(attr_part_pattern)
-                pattern_parts_without_index.append(attr_part_pattern)
+        return expression_cache.get_attribute_patterns(attribute)
 
-        pattern = f'^{"[.]".join(pattern_parts)}$'
-        pattern_with_index = re.compile(pattern)
+    def _is_attribute_variable_dependant(self, vertex: Dict[str, Any], attr_to_check: str, attr: str) -> bool:
+        cache = _vertex_values_cache.values
+        if cache is not None and attr_to_check in cache:
+            return cache[attr_to_check]
 
-        pattern = f'^{"[.]".join(pattern_parts_without_index)}$'
-        pattern_without_index = re.compile(pattern)
+        value_to_check = vertex.get(attr_to_check)
+        value_to_check = self._render_json_str(value_to_check, attr, vertex)
+        variable_dependant = self._is_variable_dependant(value_to_check, vertex['source_'])
 
-        return pattern_with_index, pattern_without_index
+        if cache is not None:
+            cache[attr_to_check] = variable_dependant
+        return variable_dependant
 
     @staticmethod
     def _is_variable_dependant(value: Any, source: str) -> bool:
@@ -1,7 +1,8 @@
 import logging
 import re
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Pattern
 
+from checkov.common.checks_infra.expression_cache import expression_cache
 from checkov.common.graph.checks_infra.enums import Operators
 from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver import BaseAttributeSolver
 
@@ -9,10 +10,27 @@ from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver
 class RegexMatchAttributeSolver(BaseAttributeSolver):
     operator = Operators.REGEX_MATCH  # noqa: CCE003  # a static attribute
 
+    def __init__(
+        self, resource_types: List[str], attribute: Optional[str], value: Any, is_jsonpath_check: bool = False
+    ) -> None:
+        super().__init__(resource_types, attribute, value, is_jsonpath_check)
+        self.regex: Optional[Pattern[str]] = None
+
+    def compile_expressions(self) -> None:
+        super().compile_expressions()
+
+        try:
+            self.regex = expression_cache.get_regex(str(self.value))
+        except re.error:
+            # will be reported, when the solver is evaluated
+            pass
+
     def _get_operation(self, vertex: Dict[str, Any], attribute: Optional[str]) -> bool:
         attr = vertex.get(attribute)  # type:ignore[arg-type]  # due to attribute can be None
         try:
-            return re.match(str(self.value), str(attr)) is not None
+            if self.regex is None:
+                self.regex = expression_cache.get_regex(str(self.value))
+            return self.regex.match(str(attr)) is not None
         except re.error as e:
             logging.warning(f'failed to run regex {self.value} for attribute: {attr}, {str(e)}')
             return False
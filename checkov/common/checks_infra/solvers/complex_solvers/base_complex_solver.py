@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import List, Any, Tuple, Dict, TYPE_CHECKING, Optional
+from typing import List, Any, Tuple, Dict, TYPE_CHECKING, Optional, Set
 
 from igraph import Graph
 
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
+from checkov.common.graph.db_connectors.graph_index import get_graph_index
 
 if TYPE_CHECKING:
     from checkov.common.typing import LibraryGraph
@@ -32,16 +33,28 @@ class BaseComplexSolver(BaseSolver):
     def get_operation(self, vertex: Dict[str, Any]) -> Optional[bool]:
         raise NotImplementedError()
 
+    def get_candidate_types(self, graph_connector: LibraryGraph) -> Tuple[Optional[List[str]], Optional[Set[str]]]:
+        """Returns the resource and block types of the vertices, which are evaluated by the solver"""
+
+        return self.resource_types or None, None
+
     def run(self, graph_connector: LibraryGraph) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         passed_vertices = []
         failed_vertices = []
         unknown_vertices = []
-        if isinstance(graph_connector, Graph):
-            select_kwargs = {}
-            if self.resource_types:
-                select_kwargs = {"resource_type_in": self.resource_types}
+        graph_index = get_graph_index(graph_connector)
+        if isinstance(graph_connector, Graph) or graph_index:
+            vertices: List[Dict[str, Any]]
+            if graph_index:
+                resource_types, block_types = self.get_candidate_types(graph_connector)
+                vertices = graph_index.get_vertices(resource_types=resource_types, block_types=block_types)
+            else:
+                select_kwargs = {}
+                if self.resource_types:
+                    select_kwargs = {"resource_type_in": self.resource_types}
+                vertices = graph_connector.vs.select(**select_kwargs)["attr"]
 
-            for data in graph_connector.vs.select(**select_kwargs)["attr"]:
+            for data in vertices:
                 result = self.get_operation(data)
                 if result is None:
                     unknown_vertices.append(data)
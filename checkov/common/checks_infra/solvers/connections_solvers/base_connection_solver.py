@@ -7,6 +7,7 @@ from igraph import Graph
 
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
+from checkov.common.graph.db_connectors.graph_index import get_graph_index
 from checkov.common.graph.graph_builder import CustomAttributes
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
 
@@ -50,7 +51,17 @@ class BaseConnectionSolver(BaseSolver):
         return vertex_type in itertools.chain(self.resource_types, self.connected_resources_types)
 
     def set_vertices(self, graph_connector: LibraryGraph, exclude_vertices: List[Dict[str, Any]], unknown_vertices: List[Dict[str, Any]]) -> None:
-        if isinstance(graph_connector, Graph):
+        graph_index = get_graph_index(graph_connector)
+        if graph_index:
+            self.vertices_under_resource_types = graph_index.get_vertices(resource_types=self.resource_types or None)
+            # an empty list of connected resource types never matched an igraph vertex, but every networkx vertex
+            connected_resources_types: Optional[List[str]] = self.connected_resources_types
+            if not connected_resources_types and not isinstance(graph_connector, Graph):
+                connected_resources_types = None
+            self.vertices_under_connected_resources_types = graph_index.get_vertices(
+                resource_types=connected_resources_types
+            )
+        elif isinstance(graph_connector, Graph):
             select_kwargs = {}
             if self.resource_types:
                 select_kwargs = {"resource_type_in": self.resource_types}
@@ -85,7 +96,13 @@ class BaseConnectionSolver(BaseSolver):
         if not self.vertices_under_resource_types:
             return graph_connector
 
-        if isinstance(graph_connector, Graph):
+        graph_index = get_graph_index(graph_connector)
+        if graph_index:
+            resource_nodes = set(graph_index.get_vertex_keys(resource_types=self.targeted_resources_types))
+            connection_nodes = set(
+                graph_index.get_vertex_keys(block_types=BaseConnectionSolver.SUPPORTED_CONNECTION_BLOCK_TYPES)
+            )
+        elif isinstance(graph_connector, Graph):
             resource_nodes = {
                 vertex for vertex in graph_connector.vs.select(resource_type_in=self.targeted_resources_types)
             }
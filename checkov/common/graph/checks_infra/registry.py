@@ -1,8 +1,11 @@
 from __future__ import annotations
 import concurrent.futures
 import logging
-from typing import Any, TYPE_CHECKING
+import os
+from typing import Any, TYPE_CHECKING, Union
+from checkov.common.graph.db_connectors.graph_index import GraphIndex, get_graph_index
 from checkov.common.models.enums import CheckResult
+from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.runner_filter import RunnerFilter
 
 if TYPE_CHECKING:
@@ -10,6 +13,13 @@ if TYPE_CHECKING:
     from checkov.common.graph.checks_infra.base_parser import BaseGraphCheckParser
     from checkov.common.typing import _CheckResult, LibraryGraph
 
+# a vertex result is either the index of the vertex in the graph index or the vertex itself, if it is not part of it
+_VertexReference = Union[int, "dict[str, Any]"]
+
+
+def is_graph_checks_multiprocess_enabled() -> bool:
+    return os.getenv("RUN_GRAPH_CHECKS_MULTIPROCESS", "").lower() == "true"
+
 
 class BaseRegistry:
     def __init__(self, parser: BaseGraphCheckParser) -> None:
@@ -25,12 +35,61 @@ class BaseRegistry:
 
         check_results: "dict[BaseGraphCheck, list[_CheckResult]]" = {}
         checks_to_run = [c for c in self.checks if runner_filter.should_run_check(c, report_type=report_type)]
+        self.run_checks_parallel(
+            checks_to_run, check_results, graph_connector, run_multiprocess=is_graph_checks_multiprocess_enabled()
+        )
+        return check_results
+
+    def run_checks_parallel(
+        self, checks: list[BaseGraphCheck], check_results: dict[BaseGraphCheck, list[_CheckResult]],
+        graph_connector: LibraryGraph, run_multiprocess: bool = False
+    ) -> None:
+        if run_multiprocess and len(checks) > 1:
+            self.run_checks_multiprocess(checks, check_results, graph_connector)
+            return
+
         with concurrent.futures.ThreadPoolExecutor() as executor:
             concurrent.futures.wait(
                 [executor.submit(self.run_check_parallel, check, check_results, graph_connector)
-                 for check in checks_to_run]
+                 for check in checks]
             )
-        return check_results
+
+    def run_checks_multiprocess(
+        self, checks: list[BaseGraphCheck], check_results: dict[BaseGraphCheck, list[_CheckResult]],
+        graph_connector: LibraryGraph
+    ) -> None:
+        """Runs the checks in forked processes, which share the already saved graph copy-on-write
+
+        The processes only send back the indices of the resulting vertices, which are resolved again
+        to the vertices of the graph in the parent process.
+        """
+
+        graph_index = get_graph_index(graph_connector) or GraphIndex(graph_connector)
+        vertex_indices = {id(vertex): idx for idx, vertex in enumerate(graph_index.vertices)}
+
+        def run_check(check_idx: int) -> tuple[int, list[list[_VertexReference]]]:
+            check = checks[check_idx]
+            logging.debug(f'Running graph check: {check.id}')
+            results = check.run(graph_connector)
+            return check_idx, [[vertex_indices.get(id(vertex), vertex) for vertex in vertices] for vertices in results]
+
+        for check_result in parallel_runner.run_function(run_check, list(range(len(checks)))):
+            if check_result is None:
+                # the check failed, which is already logged by the parallel runner
+                continue
+
+            check_idx, (passed, failed, unknown) = check_result
+            self.set_check_results(
+                checks[check_idx],
+                check_results,
+                self._resolve_vertices(graph_index, passed),
+                self._resolve_vertices(graph_index, failed),
+                self._resolve_vertices(graph_index, unknown),
+            )
+
+    @staticmethod
+    def _resolve_vertices(graph_index: GraphIndex, vertices: list[_VertexReference]) -> list[dict[str, Any]]:
+        return [graph_index.vertices[vertex] if isinstance(vertex, int) else vertex for vertex in vertices]
 
     def run_check_parallel(
             self, check: BaseGraphCheck, check_results: dict[BaseGraphCheck, list[_CheckResult]],
@@ -38,6 +97,16 @@ class BaseRegistry:
     ) -> None:
         logging.debug(f'Running graph check: {check.id}')
         passed, failed, unknown = check.run(graph_connector)
+        self.set_check_results(check, check_results, passed, failed, unknown)
+
+    def set_check_results(
+        self,
+        check: BaseGraphCheck,
+        check_results: dict[BaseGraphCheck, list[_CheckResult]],
+        passed: list[dict[str, Any]],
+        failed: list[dict[str, Any]],
+        unknown: list[dict[str, Any]],
+    ) -> None:
         evaluated_keys = check.get_evaluated_keys()
         check_result = self._process_check_result(passed, [], CheckResult.PASSED, evaluated_keys)
         check_result = self._process_check_result(failed, check_result, CheckResult.FAILED, evaluated_keys)
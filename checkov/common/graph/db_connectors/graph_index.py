@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from typing import Any, TYPE_CHECKING
+
+from igraph import Graph
+
+from checkov.common.graph.graph_builder import CustomAttributes
+
+if TYPE_CHECKING:
+    from checkov.common.typing import LibraryGraph
+
+GRAPH_INDEX_ATTRIBUTE = "checkov_vertex_index"
+
+
+class GraphIndex:
+    """
+    Inverted index of a saved graph, which maps the resource and block types to the vertices of the graph.
+
+    The index is built once after the graph was saved and lets the check solvers only visit the vertices,
+    they are interested in, instead of iterating over the whole graph for every check.
+    """
+
+    def __init__(self, graph: LibraryGraph) -> None:
+        self.graph_id = id(graph)
+        self.vertices: list[dict[str, Any]] = []
+        # igraph vertices are identified by their index, networkx nodes by their key
+        self.vertex_keys: list[Any] = []
+        self.vertex_types: list[tuple[str | None, str | None]] = []
+        self.resource_type_index: dict[str | None, list[int]] = defaultdict(list)
+        self.block_type_index: dict[str | None, list[int]] = defaultdict(list)
+
+        vertices: Iterable[tuple[Any, dict[str, Any], str | None, str | None]]
+        if isinstance(graph, Graph):
+            vertices = zip(
+                range(graph.vcount()),
+                graph.vs["attr"],
+                graph.vs[CustomAttributes.RESOURCE_TYPE],
+                graph.vs[CustomAttributes.BLOCK_TYPE],
+            ) if graph.vcount() else ()
+        else:
+            vertices = (
+                (key, data, data.get(CustomAttributes.RESOURCE_TYPE), data.get(CustomAttributes.BLOCK_TYPE))
+                for key, data in graph.nodes(data=True)
+            )
+
+        for idx, (key, attr, resource_type, block_type) in enumerate(vertices):
+            self.vertex_keys.append(key)
+            self.vertices.append(attr)
+            self.vertex_types.append((resource_type, block_type))
+            self.resource_type_index[resource_type].append(idx)
+            self.block_type_index[block_type].append(idx)
+
+        # convert to plain dicts to not create new entries while looking up unknown types
+        self.resource_type_index = dict(self.resource_type_index)
+        self.block_type_index = dict(self.block_type_index)
+
+    def is_valid_for(self, graph: LibraryGraph) -> bool:
+        """Subgraphs share or copy the graph attributes of their parent graph, therefore the index can't be used for them"""
+
+        if self.graph_id != id(graph):
+            return False
+
+        vertex_count: int = graph.vcount() if isinstance(graph, Graph) else graph.number_of_nodes()
+        return vertex_count == len(self.vertices)
+
+    def get_vertices(
+        self, resource_types: Collection[str] | None = None, block_types: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Returns the attributes of the vertices matching the given resource and block types in the graph order
+
+        A value of None for the resource or block types means, that the vertices are not filtered by them.
+        """
+
+        return [self.vertices[idx] for idx in self._get_matching_indices(resource_types, block_types)]
+
+    def get_vertex_keys(
+        self, resource_types: Collection[str] | None = None, block_types: Collection[str] | None = None
+    ) -> list[Any]:
+        """Returns the graph specific keys of the vertices matching the given resource and block types"""
+
+        return [self.vertex_keys[idx] for idx in self._get_matching_indices(resource_types, block_types)]
+
+    def _get_matching_indices(
+        self, resource_types: Collection[str] | None, block_types: Collection[str] | None
+    ) -> Iterable[int]:
+        if resource_types is None and block_types is None:
+            return range(len(self.vertices))
+
+        indices: set[int] | None = None
+        if resource_types is not None:
+            indices = self._get_indices(self.resource_type_index, resource_types)
+        if block_types is not None:
+            block_type_indices = self._get_indices(self.block_type_index, block_types)
+            indices = block_type_indices if indices is None else indices & block_type_indices
+
+        return sorted(indices or ())
+
+    @staticmethod
+    def _get_indices(index: dict[str | None, list[int]], types: Collection[str]) -> set[int]:
+        indices: set[int] = set()
+        for type_name in set(types):
+            indices.update(index.get(type_name, ()))
+        return indices
+
+
+def create_graph_index(graph: LibraryGraph) -> GraphIndex:
+    """Builds the vertex index of the given graph and stores it as a graph attribute"""
+
+    graph_index = GraphIndex(graph)
+    if isinstance(graph, Graph):
+        graph[GRAPH_INDEX_ATTRIBUTE] = graph_index
+    else:
+        graph.graph[GRAPH_INDEX_ATTRIBUTE] = graph_index
+
+    return graph_index
+
+
+def get_graph_index(graph: LibraryGraph) -> GraphIndex | None:
+    """Returns the vertex index of the given graph, if it exists and is still up-to-date"""
+
+    if isinstance(graph, Graph):
+        graph_index = graph[GRAPH_INDEX_ATTRIBUTE] if GRAPH_INDEX_ATTRIBUTE in graph.attributes() else None
+    else:
+        graph_index = graph.graph.get(GRAPH_INDEX_ATTRIBUTE)
+
+    if isinstance(graph_index, GraphIndex) and graph_index.is_valid_for(graph):
+        return graph_index
+
+    return None
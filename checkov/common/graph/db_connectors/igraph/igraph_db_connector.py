@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, TypeVar
 from igraph import Graph
 
 from checkov.common.graph.db_connectors.db_connector import DBConnector
+from checkov.common.graph.db_connectors.graph_index import GraphIndex, create_graph_index
 from checkov.common.graph.graph_builder import CustomAttributes
 
 if TYPE_CHECKING:
@@ -17,6 +18,7 @@ _Block = TypeVar("_Block", bound="Block")
 class IgraphConnector(DBConnector[Graph]):
     def __init__(self) -> None:
         self.graph = Graph(directed=True)
+        self.graph_index: GraphIndex | None = None
 
     def save_graph(self, local_graph: LocalGraph[_Block], add_bulk_edges: bool = False) -> Graph:
         return self.networkit_from_local_graph(local_graph)
@@ -65,6 +67,7 @@ class IgraphConnector(DBConnector[Graph]):
             # "label_color": edge_colors,
         }
         self.graph.add_edges(edges_to_add, edge_attributes)
+        self.graph_index = create_graph_index(self.graph)
 
         # plot(self.graph, target='myfile.png', bbox=(0, 0, 2000, 2000), margin=100, vertex_label_dist=1, layout="circle")
         return self.graph
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, TypeVar
 import networkx as nx
 
 from checkov.common.graph.db_connectors.db_connector import DBConnector
+from checkov.common.graph.db_connectors.graph_index import GraphIndex, create_graph_index
 from checkov.common.graph.graph_builder import CustomAttributes
 
 if TYPE_CHECKING:
@@ -17,6 +18,7 @@ _Block = TypeVar("_Block", bound="Block")
 class NetworkxConnector(DBConnector[nx.DiGraph]):
     def __init__(self) -> None:
         self.graph = nx.DiGraph()
+        self.graph_index: GraphIndex | None = None
 
     def save_graph(self, local_graph: LocalGraph[_Block], add_bulk_edges: bool = False) -> nx.DiGraph:
         return self.networkx_from_local_graph(local_graph)
@@ -42,6 +44,7 @@ class NetworkxConnector(DBConnector[nx.DiGraph]):
 
         self.graph.add_nodes_from(vertices_to_add)
         self.graph.add_edges_from(edges_to_add)
+        self.graph_index = create_graph_index(self.graph)
 
         return self.graph
 
@@ -25,6 +25,9 @@ class Block:
         "dynamic_attributes",
     )
 
+    # blocks, which get their own copy of the config and only update it copy-on-write, don't need to copy it again
+    copy_config_on_init = True  # noqa: CCE003  # a static attribute
+
     def __init__(
             self,
             name: str,
@@ -45,7 +48,7 @@ class Block:
             :param attributes: dictionary of the block's original attributes in the origin file
         """
         self.name = name
-        self.config = deepcopy(config)
+        self.config = deepcopy(config) if self.copy_config_on_init else config
         self.path = path
         self.block_type = block_type
         self.attributes = attributes
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import concurrent
 import hashlib
-from typing import Any, Callable
+from typing import Any, Callable, TYPE_CHECKING
 import concurrent.futures
 
+if TYPE_CHECKING:
+    from checkov.common.graph.graph_builder import Edge
+
 
 def calculate_hash(data: Any) -> str:
     sha256 = hashlib.sha256(str(data).encode("utf-8"))
@@ -34,6 +37,58 @@ def run_function_multithreaded(
                     raise
 
 
+def get_strongly_connected_components(out_edges: dict[int, list[Edge]]) -> list[list[int]]:
+    """Finds the strongly connected components of the graph with an iterative version of Tarjan's algorithm
+
+    The components are returned in reverse topological order, a component follows all components it has edges to.
+    """
+
+    components: list[list[int]] = []
+    index_by_vertex: dict[int, int] = {}
+    low_link_by_vertex: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+
+    for root in list(out_edges):
+        if root in index_by_vertex:
+            continue
+
+        # each entry holds the vertex and the position of its next edge to visit
+        work_stack = [(root, 0)]
+        while work_stack:
+            vertex, edge_idx = work_stack.pop()
+            if edge_idx == 0:
+                index_by_vertex[vertex] = low_link_by_vertex[vertex] = len(index_by_vertex)
+                stack.append(vertex)
+                on_stack.add(vertex)
+
+            vertex_out_edges = out_edges.get(vertex, [])
+            while edge_idx < len(vertex_out_edges):
+                dest = vertex_out_edges[edge_idx].dest
+                edge_idx += 1
+                if dest not in index_by_vertex:
+                    work_stack.append((vertex, edge_idx))
+                    work_stack.append((dest, 0))
+                    break
+                if dest in on_stack:
+                    low_link_by_vertex[vertex] = min(low_link_by_vertex[vertex], index_by_vertex[dest])
+            else:
+                if low_link_by_vertex[vertex] == index_by_vertex[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    components.append(sorted(component))
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    low_link_by_vertex[parent] = min(low_link_by_vertex[parent], low_link_by_vertex[vertex])
+
+    return components
+
+
 def filter_sub_keys(key_list: list[str]) -> list[str]:
     filtered_key_list = []
     for key in key_list:
@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 import os
 from abc import ABC, abstractmethod
+from itertools import chain
 from typing import TYPE_CHECKING, List, Dict, Any, Iterable, TypeVar, Generic
 
 from checkov.common.graph.graph_builder import Edge
-from checkov.common.graph.graph_builder.utils import run_function_multithreaded
-from checkov.common.graph.graph_builder.graph_components.block_types import BlockType
+from checkov.common.graph.graph_builder.utils import get_strongly_connected_components
+from checkov.common.parallelizer.parallel_runner import parallel_runner
 
 
 if TYPE_CHECKING:
@@ -16,17 +17,18 @@ if TYPE_CHECKING:
 
 _LocalGraph = TypeVar("_LocalGraph", bound="LocalGraph[Any]")
 
+# forking processes only pays off for levels with many edges to evaluate
+PARALLEL_RENDERING_MIN_EDGE_GROUPS = 1_000
+
 
 class VariableRenderer(ABC, Generic[_LocalGraph]):
-    MAX_NUMBER_OF_LOOPS = 50
+    # the edges of a level can only be evaluated in forked processes,
+    # if the evaluation changes the vertices only via 'update_vertex_attribute'
+    SUPPORTS_PARALLEL_RENDERING = False
 
     def __init__(self, local_graph: _LocalGraph) -> None:
         self.local_graph = local_graph
         self.run_async = True if os.getenv("RENDER_VARIABLES_ASYNC") == "True" else False
-        self.max_workers = int(os.getenv("RENDER_ASYNC_MAX_WORKERS", 50))
-        self.duplicate_percent = int(os.getenv("RENDER_EDGES_DUPLICATE_PERCENT", 90))
-        self.duplicate_iter_count = int(os.getenv("RENDER_EDGES_DUPLICATE_ITER_COUNT", 4))
-        self.done_edges_by_origin_vertex: Dict[int, List[Edge]] = {}
         self.replace_cache: List[Dict[str, Any]] = [{}] * len(local_graph.vertices)
         self.vertices_index_to_render: List[int] = []
 
@@ -35,63 +37,20 @@ class VariableRenderer(ABC, Generic[_LocalGraph]):
         self._render_variables_from_vertices()
 
     def _render_variables_from_edges(self) -> None:
-        # find vertices with out-degree = 0 and in-degree > 0
-        end_vertices_indexes = self.local_graph.get_vertices_with_degrees_conditions(
-            out_degree_cond=lambda degree: degree == 0, in_degree_cond=lambda degree: degree > 0
-        )
-
-        # all the edges entering `end_vertices`
-        edges_to_render = self.local_graph.get_in_edges(end_vertices_indexes)
-        if self.vertices_index_to_render:
-            edges_to_render = self._remove_unrelated_edges(edges_to_render)
-
-        end_vertices_indexes = set()
-        loops = 0
-        evaluated_edges_cache: list[list[Edge]] = [[], []]
-        duplicates_count = 0
-        while edges_to_render:
-            evaluated_edges_two_iter_ago = evaluated_edges_cache[-2]
-            intersection_edges = set(edges_to_render).intersection(evaluated_edges_two_iter_ago)
-            match_percent = int((len(intersection_edges) / len(edges_to_render)) * 100)
-            if match_percent > self.duplicate_percent:
-                duplicates_count += 1
-            if duplicates_count > self.duplicate_iter_count:
-                logging.info(f"Reached too many edge duplications of {self.duplicate_percent}% for {self.duplicate_iter_count} iterations. breaking.")
-                break
-            evaluated_edges_cache.append(edges_to_render)
-
-            logging.debug(f"evaluating {len(edges_to_render)} edges")
+        for level, edges_to_render in enumerate(self.get_edges_by_rendering_level(), start=1):
+            logging.debug(f"evaluating {len(edges_to_render)} edges of level {level}")
             # group edges that have the same origin and label together
             edges_groups = self.group_edges_by_origin_and_label(edges_to_render)
-            if self.run_async:
-                run_function_multithreaded(
-                    func=self._edge_evaluation_task,
-                    data=edges_groups,
-                    max_group_size=1,
-                    num_of_workers=self.max_workers,
-                )
+            if (
+                self.run_async
+                and self.SUPPORTS_PARALLEL_RENDERING
+                and parallel_runner.os != "Windows"
+                and len(edges_groups) >= PARALLEL_RENDERING_MIN_EDGE_GROUPS
+            ):
+                self._evaluate_edge_groups_multiprocess(edges_groups)
             else:
                 for edge_group in edges_groups:
                     self._edge_evaluation_task([edge_group])
-            for edge in edges_to_render:
-                origin = edge.origin
-                self.done_edges_by_origin_vertex.setdefault(origin, []).append(edge)
-
-            for edge in edges_to_render:
-                origin_vertex_index = edge.origin
-                out_edges = set(self.local_graph.out_edges.get(origin_vertex_index, []))
-                done_edges_for_origin = self.done_edges_by_origin_vertex.get(origin_vertex_index, [])
-                if out_edges.issubset(done_edges_for_origin):
-                    end_vertices_indexes.add(origin_vertex_index)
-            new_edges_to_render = self.local_graph.get_in_edges_deduped(end_vertices_indexes)
-            edges_to_render = self.local_graph.sort_edged_by_dest_out_degree(
-                new_edges_to_render - set(edges_to_render)
-            )
-
-            loops += 1
-            if loops >= self.MAX_NUMBER_OF_LOOPS:
-                logging.warning("Reached 50 graph edge iterations, breaking.")
-                break
 
         if self.vertices_index_to_render:
             return
@@ -100,6 +59,92 @@ class VariableRenderer(ABC, Generic[_LocalGraph]):
         self.evaluate_non_rendered_values()
         logging.debug("done evaluate_non_rendered_values")
 
+    def get_edges_by_rendering_level(self) -> list[list[Edge]]:
+        """Schedules the edges of the graph into levels, which can be rendered one after the other
+
+        An edge is rendered, after all edges of its destination vertex are rendered. Therefore, the strongly connected
+        components of the graph are rendered in topological order. Vertices, which are part of a cycle or depend on one,
+        are never completely rendered, therefore the edges pointing to them are skipped
+        and left to 'evaluate_non_rendered_values'.
+
+        :return: for each level the edges, which can be rendered
+        """
+
+        out_edges = self.local_graph.out_edges
+        components = get_strongly_connected_components(out_edges)
+        component_by_vertex = {vertex: idx for idx, component in enumerate(components) for vertex in component}
+
+        # the components are ordered topologically, a component follows all components it has edges to,
+        # a level of -1 marks a component, which is part of a cycle or depends on one
+        component_levels: list[int] = []
+        levels: list[list[Edge]] = []
+        for idx, component in enumerate(components):
+            component_edges: list[tuple[int, Edge]] = []
+            in_cycle = False
+            for vertex in component:
+                for edge in out_edges[vertex]:
+                    dest_component = component_by_vertex[edge.dest]
+                    if dest_component == idx:
+                        in_cycle = True
+                    elif component_levels[dest_component] < 0:
+                        in_cycle = True
+                    else:
+                        component_edges.append((component_levels[dest_component] + 1, edge))
+
+            component_levels.append(-1 if in_cycle else max((level for level, _ in component_edges), default=0))
+
+            # the edges to already rendered components can be rendered nevertheless
+            for level, edge in component_edges:
+                while len(levels) < level:
+                    levels.append([])
+                levels[level - 1].append(edge)
+
+        return [self.local_graph.sort_edged_by_dest_out_degree(dict.fromkeys(edges)) for edges in levels]
+
+    def _evaluate_edge_groups_multiprocess(self, edges_groups: list[list[Edge]]) -> None:
+        """Evaluates the edge groups of a level in forked processes and applies their vertex updates
+
+        The edge groups of a level only read the attributes of already rendered vertices, therefore the groups of
+        different origin vertices can be evaluated independently. The vertex updates are applied in the same order
+        as they happened in the forked processes.
+        """
+
+        edges_groups_by_origin: dict[int, list[list[Edge]]] = {}
+        for edge_group in edges_groups:
+            edges_groups_by_origin.setdefault(edge_group[0].origin, []).append(edge_group)
+        origins_edges_groups = list(edges_groups_by_origin.values())
+        shard_size = len(origins_edges_groups) // parallel_runner.workers_number + 1
+        shards = [
+            list(chain.from_iterable(origins_edges_groups[idx:idx + shard_size]))
+            for idx in range(0, len(origins_edges_groups), shard_size)
+        ]
+
+        for shard, vertex_updates in zip(shards, parallel_runner.run_function(self._record_vertex_updates, shards, group_size=1, run_multiprocess=True)):
+            if vertex_updates is None:
+                # the forked process failed, therefore evaluate the edges again in this process
+                for edge_group in shard:
+                    self._edge_evaluation_task([edge_group])
+                continue
+
+            for args, kwargs in vertex_updates:
+                self.local_graph.update_vertex_attribute(*args, **kwargs)
+
+    def _record_vertex_updates(self, edges_groups: list[list[Edge]]) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+        """Evaluates the edge groups and returns the vertex updates, which happened during the evaluation"""
+
+        vertex_updates: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        update_vertex_attribute = self.local_graph.update_vertex_attribute
+
+        def record_vertex_update(*args: Any, **kwargs: Any) -> None:
+            vertex_updates.append((args, kwargs))
+            update_vertex_attribute(*args, **kwargs)
+
+        # it only runs in the forked process, therefore the graph of the parent process is not affected
+        self.local_graph.update_vertex_attribute = record_vertex_update  # type:ignore[method-assign]
+        for edge_group in edges_groups:
+            self._edge_evaluation_task([edge_group])
+        return vertex_updates
+
     @abstractmethod
     def _render_variables_from_vertices(self) -> None:
         pass
@@ -109,13 +154,6 @@ class VariableRenderer(ABC, Generic[_LocalGraph]):
         self.evaluate_vertex_attribute_from_edge(inner_edges)
         return inner_edges
 
-    def _remove_unrelated_edges(self, edges_to_render: List[Edge]) -> List[Edge]:
-        new_edges_to_render = []
-        for edge in edges_to_render:
-            if not self.local_graph.vertices[edge.origin] == BlockType.RESOURCE and edge.origin not in self.vertices_index_to_render:
-                new_edges_to_render.append(edge)
-        return new_edges_to_render
-
     @abstractmethod
     def evaluate_vertex_attribute_from_edge(self, edge_list: List[Edge]) -> None:
         pass
@@ -6,6 +6,8 @@ from checkov.common.typing import _CheckResult
 
 
 class GithubActionsRecord(Record):
+    __slots__ = ("triggers", "job", "workflow_name")
+
     def __init__(self,
                  triggers: Optional[Set[str]],
                  job: Union[Optional[str], None],
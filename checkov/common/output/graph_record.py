@@ -6,8 +6,10 @@ from checkov.common.output.record import Record
 
 
 class GraphRecord(Record):
+    __slots__ = ("breadcrumbs",)
+
     def __init__(self, record: Record, breadcrumbs: dict[str, dict[str, Any]]):
-        super().__init__(record.check_id, record.check_name, record.check_result, record.code_block, record.file_path,
+        super().__init__(record.check_id, record.check_name, record.check_result, record._code_block, record.file_path,
                          record.file_line_range, record.resource, record.evaluations, record.check_class,
                          record.file_abs_path, record.entity_tags, record.caller_file_path,
                          record.caller_file_line_range, bc_check_id=record.bc_check_id, resource_address=record.resource_address,
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, List, Tuple, Optional, Dict, Any
+from typing import Union, List, Tuple, Optional, Dict, Any, TypeVar
 
 from colorama import init, Fore, Style
 from termcolor import colored
@@ -12,6 +14,7 @@ from checkov.common.bridgecrew.severities import Severity
 from checkov.common.models.enums import CheckResult
 from checkov.common.typing import _CheckResult
 from checkov.common.util.file_utils import convert_to_unix_path
+from checkov.common.util.source_file_store import CodeBlockReference
 from checkov.common.util.type_forcers import force_int
 
 init(autoreset=True)
@@ -24,14 +27,47 @@ OUTPUT_CODE_LINE_LIMIT = force_int(os.getenv('CHECKOV_OUTPUT_CODE_LINE_LIMIT'))
 SCA_PACKAGE_SCAN_CHECK_NAME = "SCA package scan"
 SCA_LICENSE_CHECK_NAME = "SCA license"
 
+_T = TypeVar("_T")
+
 
 class Record:
+    __slots__ = (
+        "check_id",
+        "bc_check_id",
+        "check_name",
+        "check_result",
+        "_code_block",
+        "file_path",
+        "file_abs_path",
+        "repo_file_path",
+        "file_line_range",
+        "resource",
+        "evaluations",
+        "check_class",
+        "fixed_definition",
+        "entity_tags",
+        "caller_file_path",
+        "caller_file_line_range",
+        "resource_address",
+        "severity",
+        "bc_category",
+        "benchmarks",
+        "description",
+        "short_description",
+        "vulnerability_details",
+        "connected_node",
+        "guideline",
+        "details",
+        "check_len",
+        "definition_context_file_path",
+    )
+
     def __init__(
         self,
         check_id: str,
         check_name: str,
         check_result: _CheckResult,
-        code_block: List[Tuple[int, str]],
+        code_block: List[Tuple[int, str]] | CodeBlockReference,
         file_path: str,
         file_line_range: List[int],
         resource: str,
@@ -59,26 +95,28 @@ class Record:
                              - 'var_file'
                              - 'value'
                              - 'definitions', a list of dicts which contain 'definition_expression'
+        :param code_block: the code lines or a reference to them, which is resolved, when the code block is accessed
         """
-        self.check_id = check_id
-        self.bc_check_id = bc_check_id
-        self.check_name = check_name
+        # the same paths and check metadata are repeated in many records, therefore the strings are shared
+        self.check_id = _intern(check_id)
+        self.bc_check_id = _intern(bc_check_id)
+        self.check_name = _intern(check_name)
         self.check_result = check_result
         self.code_block = code_block
-        self.file_path = file_path
-        self.file_abs_path = file_abs_path
+        self.file_path = _intern(file_path)
+        self.file_abs_path = _intern(file_abs_path)
         self.repo_file_path = self._determine_repo_file_path(file_abs_path)
         self.file_line_range = file_line_range
-        self.resource = resource
+        self.resource = _intern(resource)
         self.evaluations = evaluations
-        self.check_class = check_class
+        self.check_class = _intern(check_class)
         self.fixed_definition = None
         self.entity_tags = entity_tags
-        self.caller_file_path = caller_file_path  # When created from a module
+        self.caller_file_path = _intern(caller_file_path)  # When created from a module
         self.caller_file_line_range = caller_file_line_range  # When created from a module
-        self.resource_address = resource_address
+        self.resource_address = _intern(resource_address)
         self.severity = severity
-        self.bc_category = bc_category
+        self.bc_category = _intern(bc_category)
         self.benchmarks = benchmarks
         self.description = description  # used by SARIF output
         self.short_description = short_description  # used by SARIF and GitLab SAST output
@@ -87,16 +125,28 @@ class Record:
         self.guideline: str | None = None
         self.details: List[str] = details or []
         self.check_len = check_len
-        self.definition_context_file_path = definition_context_file_path
+        self.definition_context_file_path = _intern(definition_context_file_path)
+
+    @property
+    def code_block(self) -> List[Tuple[int, str]]:
+        code_block = self._code_block
+        if isinstance(code_block, CodeBlockReference):
+            return code_block.get_code_block()
+        return code_block
+
+    @code_block.setter
+    def code_block(self, code_block: List[Tuple[int, str]] | CodeBlockReference) -> None:
+        self._code_block = code_block
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the attributes of the record, like the former '__dict__' of the record"""
+
+        return {attribute: getattr(self, attribute) for attribute in _get_record_attributes(type(self))}
 
     @staticmethod
     def _determine_repo_file_path(file_path: Union[str, "os.PathLike[str]"]) -> str:
-        # matches file paths given in the BC platform and should always be a unix path
-        repo_file_path = Path(file_path)
-        if CURRENT_LOCAL_DRIVE == repo_file_path.drive:
-            return convert_to_unix_path(f"/{os.path.relpath(repo_file_path)}").replace("/..", "")
-
-        return f"/{'/'.join(repo_file_path.parts[1:])}"
+        # the relative path depends on the current working directory
+        return _determine_repo_file_path(os.fspath(file_path), os.getcwd())
 
     def set_guideline(self, guideline: Optional[str]) -> None:
         self.guideline = guideline
@@ -210,3 +260,37 @@ class Record:
 
     def get_unique_string(self) -> str:
         return f"{self.check_id}.{self.check_result}.{self.file_abs_path}.{self.file_line_range}.{self.resource}"
+
+
+def _intern(value: _T) -> _T:
+    # 'sys.intern' only accepts str objects and no subclasses of it
+    if isinstance(value, str) and type(value) is str:
+        return sys.intern(value)  # type:ignore[return-value]  # it is a str
+    return value
+
+
+@lru_cache(maxsize=None)
+def _determine_repo_file_path(file_path: str, cwd: str) -> str:
+    # matches file paths given in the BC platform and should always be a unix path
+    repo_file_path = Path(file_path)
+    if CURRENT_LOCAL_DRIVE == repo_file_path.drive:
+        return sys.intern(convert_to_unix_path(f"/{os.path.relpath(repo_file_path, cwd)}").replace("/..", ""))
+
+    return sys.intern(f"/{'/'.join(repo_file_path.parts[1:])}")
+
+
+def _get_record_attributes(record_class: type[Record]) -> tuple[str, ...]:
+    """Returns the public attributes of the record class in the order they are set"""
+
+    attributes = _RECORD_ATTRIBUTES_BY_CLASS.get(record_class)
+    if attributes is None:
+        attributes = tuple(
+            attribute.lstrip("_")
+            for cls in reversed(record_class.__mro__)
+            for attribute in cls.__dict__.get("__slots__", ())
+        )
+        _RECORD_ATTRIBUTES_BY_CLASS[record_class] = attributes
+    return attributes
+
+
+_RECORD_ATTRIBUTES_BY_CLASS: dict[type[Record], tuple[str, ...]] = {}
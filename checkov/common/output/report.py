@@ -40,6 +40,8 @@ SEVERITY_TO_SARIF_LEVEL = {
     "low": "note",
     "none": "none",
 }
+SARIF_SCHEMA = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json"
+SARIF_VERSION = "2.1.0"
 
 
 class Report:
@@ -99,7 +101,7 @@ class Report:
             return {
                 "check_type": self.check_type,
                 "results": {
-                    "failed_checks": [check.__dict__ for check in self.failed_checks]
+                    "failed_checks": [check.to_dict() for check in self.failed_checks]
                 },
                 "summary": self.get_summary(),
             }
@@ -107,9 +109,9 @@ class Report:
             return {
                 "check_type": self.check_type,
                 "checks": {
-                    "passed_checks": [check.__dict__ for check in self.passed_checks],
-                    "failed_checks": [check.__dict__ for check in self.failed_checks],
-                    "skipped_checks": [check.__dict__ for check in self.skipped_checks]
+                    "passed_checks": [check.to_dict() for check in self.passed_checks],
+                    "failed_checks": [check.to_dict() for check in self.failed_checks],
+                    "skipped_checks": [check.to_dict() for check in self.skipped_checks]
                 },
                 "image_cached_results": [res.__dict__ for res in self.image_cached_results]
             }
@@ -117,9 +119,9 @@ class Report:
             return {
                 "check_type": self.check_type,
                 "results": {
-                    "passed_checks": [check.__dict__ for check in self.passed_checks],
-                    "failed_checks": [check.__dict__ for check in self.failed_checks],
-                    "skipped_checks": [check.__dict__ for check in self.skipped_checks],
+                    "passed_checks": [check.to_dict() for check in self.passed_checks],
+                    "failed_checks": [check.to_dict() for check in self.failed_checks],
+                    "skipped_checks": [check.to_dict() for check in self.skipped_checks],
                     "parsing_errors": list(self.parsing_errors),
                 },
                 "summary": self.get_summary(),
@@ -257,116 +259,130 @@ class Report:
         print(colored(f"Error parsing file {file}", "red"))
 
     def get_sarif_json(self, tool: str) -> Dict[str, Any]:
-        runs = []
-        rules = []
+        rules: list[dict[str, Any]] = []
+        rule_idx_by_check_id: dict[str, int] = {}
         results = []
-        ruleset = set()
-        idx = 0
         level = "warning"
-        tool = tool if tool else "Bridgecrew"
-        information_uri = "https://docs.bridgecrew.io" if tool.lower() == "bridgecrew" else "https://checkov.io"
 
         for record in self.failed_checks + self.skipped_checks:
             if self.check_type == CheckType.SCA_PACKAGE and record.check_name != SCA_PACKAGE_SCAN_CHECK_NAME:
                 continue
 
-            help_uri = record.guideline
-            if record.vulnerability_details:
-                # use the CVE link, if it is a SCA record
-                help_uri = record.vulnerability_details.get("link")
-
-            rule = {
-                "id": record.check_id,
-                "name": record.check_name,
-                "shortDescription": {
-                    "text": record.short_description if record.short_description else record.check_name,
-                },
-                "fullDescription": {
-                    "text": record.description if record.description else record.check_name,
-                },
-                "help": {
-                    "text": f'"{record.check_name}\nResource: {record.resource}"',
-                },
-                "defaultConfiguration": {"level": "error"},
-            }
-            if help_uri:
-                rule["helpUri"] = help_uri
+            idx = rule_idx_by_check_id.get(record.check_id)
+            if idx is None:
+                idx = rule_idx_by_check_id[record.check_id] = len(rules)
+                rules.append(self.get_sarif_rule(record))
 
-            if record.check_id not in ruleset:
-                ruleset.add(record.check_id)
-                rules.append(rule)
-                idx = rules.index(rule)
-            else:
-                for r in rules:
-                    if r['id'] == rule['id']:
-                        idx = rules.index(r)
-                        break
-            if record.file_line_range[0] == 0:
-                record.file_line_range[0] = 1
-            if record.file_line_range[1] == 0:
-                record.file_line_range[1] = 1
+            level = self.get_sarif_level(record, level)
+            results.append(self.get_sarif_result(record, rule_idx=idx, level=level))
 
-            if record.severity:
-                level = SEVERITY_TO_SARIF_LEVEL.get(record.severity.name.lower(), "none")
-            elif record.check_result.get("result") == CheckResult.FAILED:
-                level = "error"
-
-            result = {
-                "ruleId": record.check_id,
-                "ruleIndex": idx,
-                "level": level,
-                "attachments": [{'description': detail} for detail in record.details],
-                "message": {
-                    "text": record.description if record.description else record.check_name,
+        sarif_template_report = {
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
+            "runs": [
+                {
+                    "tool": self.get_sarif_tool(tool, rules),
+                    "results": results,
                 },
-                "locations": [
-                    {
-                        "physicalLocation": {
-                            "artifactLocation": {"uri": record.file_path.lstrip("/")},
-                            "region": {
-                                "startLine": int(record.file_line_range[0]),
-                                "endLine": int(record.file_line_range[1]),
-                            },
-                        }
-                    }
-                ],
+            ],
+        }
+        return sarif_template_report
+
+    @staticmethod
+    def get_sarif_tool(tool: str, rules: list[dict[str, Any]]) -> dict[str, Any]:
+        tool = tool if tool else "Bridgecrew"
+        information_uri = "https://docs.bridgecrew.io" if tool.lower() == "bridgecrew" else "https://checkov.io"
+
+        return {
+            "driver": {
+                "name": tool,
+                "version": version,
+                "informationUri": information_uri,
+                "rules": rules,
+                "organization": "bridgecrew",
             }
+        }
 
-            if record.check_result.get("result") == CheckResult.SKIPPED:
-                # sca_package suppressions can only be enabled via flag
-                # other runners only report in source suppressions
-                kind = "external" if record.vulnerability_details else "inSource"
-                justification = record.check_result.get("suppress_comment")
-                if justification is None:
-                    justification = "No comment provided"
-
-                result["suppressions"] = [
-                    {
-                        "kind": kind,
-                        "justification": justification,
-                    }
-                ]
+    @staticmethod
+    def get_sarif_rule(record: Record) -> dict[str, Any]:
+        help_uri = record.guideline
+        if record.vulnerability_details:
+            # use the CVE link, if it is a SCA record
+            help_uri = record.vulnerability_details.get("link")
+
+        rule = {
+            "id": record.check_id,
+            "name": record.check_name,
+            "shortDescription": {
+                "text": record.short_description if record.short_description else record.check_name,
+            },
+            "fullDescription": {
+                "text": record.description if record.description else record.check_name,
+            },
+            "help": {
+                "text": f'"{record.check_name}\nResource: {record.resource}"',
+            },
+            "defaultConfiguration": {"level": "error"},
+        }
+        if help_uri:
+            rule["helpUri"] = help_uri
 
-            results.append(result)
+        return rule
 
-        runs.append({
-            "tool": {
-                "driver": {
-                    "name": tool,
-                    "version": version,
-                    "informationUri": information_uri,
-                    "rules": rules,
-                    "organization": "bridgecrew",
-                }
+    @staticmethod
+    def get_sarif_level(record: Record, previous_level: str) -> str:
+        """Returns the SARIF level of the record, records without a severity or a failed result keep the previous one"""
+
+        if record.severity:
+            return SEVERITY_TO_SARIF_LEVEL.get(record.severity.name.lower(), "none")
+        elif record.check_result.get("result") == CheckResult.FAILED:
+            return "error"
+        return previous_level
+
+    @staticmethod
+    def get_sarif_result(record: Record, rule_idx: int, level: str) -> dict[str, Any]:
+        if record.file_line_range[0] == 0:
+            record.file_line_range[0] = 1
+        if record.file_line_range[1] == 0:
+            record.file_line_range[1] = 1
+
+        result = {
+            "ruleId": record.check_id,
+            "ruleIndex": rule_idx,
+            "level": level,
+            "attachments": [{'description': detail} for detail in record.details],
+            "message": {
+                "text": record.description if record.description else record.check_name,
             },
-            "results": results,
-        })
-        sarif_template_report = {
-            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
-            "version": "2.1.0",
-            "runs": runs,
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": record.file_path.lstrip("/")},
+                        "region": {
+                            "startLine": int(record.file_line_range[0]),
+                            "endLine": int(record.file_line_range[1]),
+                        },
+                    }
+                }
+            ],
         }
-        return sarif_template_report
+
+        if record.check_result.get("result") == CheckResult.SKIPPED:
+            # sca_package suppressions can only be enabled via flag
+            # other runners only report in source suppressions
+            kind = "external" if record.vulnerability_details else "inSource"
+            justification = record.check_result.get("suppress_comment")
+            if justification is None:
+                justification = "No comment provided"
+
+            result["suppressions"] = [
+                {
+                    "kind": kind,
+                    "justification": justification,
+                }
+            ]
+
+        return result
 
     def write_sarif_output(self, tool: str) -> None:
         try:
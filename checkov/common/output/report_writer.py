@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, TextIO
+
+from junit_xml import TestSuite
+
+from checkov.common.output.report import Report, SARIF_SCHEMA, SARIF_VERSION
+from checkov.common.util.json_utils import CustomJSONEncoder
+
+
+class ReportWriter(ABC):
+    """Writes the output of multiple reports incrementally to a stream
+
+    Only the output of the currently written report is kept in memory, instead of the output of all reports.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self.reports_count = 0
+
+    def write_report(self, report: Report) -> None:
+        self._write_report(report)
+        self.reports_count += 1
+
+    @abstractmethod
+    def _write_report(self, report: Report) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finishes the output, the stream itself is not closed"""
+
+        pass
+
+
+class JsonReportWriter(ReportWriter):
+    """Writes the reports as a JSON list, or as a single JSON object, if exactly one report is expected"""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        reports_number: int,
+        is_quiet: bool = False,
+        url: str | None = None,
+        compact: bool = False,
+        indent: int | None = None,
+    ) -> None:
+        super().__init__(stream)
+        self.is_list = reports_number > 1
+        self.is_quiet = is_quiet
+        self.url = url
+        self.compact = compact
+        self.indent = indent
+
+    def _write_report(self, report: Report) -> None:
+        report_json = report.get_dict(is_quiet=self.is_quiet, url=self.url)
+        if self.compact:
+            strip_code_blocks_from_json(report_json)
+
+        output = json.dumps(report_json, indent=self.indent, cls=CustomJSONEncoder)
+        if not self.is_list:
+            self.stream.write(output)
+            return
+
+        if self.indent is None:
+            self.stream.write(", " if self.reports_count else "[")
+        else:
+            # JSON strings can't contain line breaks, therefore indenting each line keeps the values untouched
+            indentation = " " * self.indent
+            self.stream.write(",\n" if self.reports_count else "[\n")
+            output = indentation + output.replace("\n", f"\n{indentation}")
+        self.stream.write(output)
+
+    def close(self) -> None:
+        if not self.reports_count:
+            self.stream.write(json.dumps(Report("").get_summary(), indent=self.indent, cls=CustomJSONEncoder))
+        elif self.is_list:
+            self.stream.write("]" if self.indent is None else "\n]")
+
+
+class SarifReportWriter(ReportWriter):
+    """Writes the failed and skipped checks of all reports as results of a single SARIF run
+
+    The rules are collected while writing the results and added at the end, therefore the 'results' key
+    precedes the 'tool' key of the run.
+    """
+
+    def __init__(self, stream: TextIO, tool: str) -> None:
+        super().__init__(stream)
+        self.tool = tool
+        self.rules: list[dict[str, Any]] = []
+        self.rule_idx_by_check_id: dict[str, int] = {}
+        self.level = "warning"
+        self.results_count = 0
+
+        sarif_header = json.dumps({"$schema": SARIF_SCHEMA, "version": SARIF_VERSION})
+        self.stream.write(f'{sarif_header[:-1]}, "runs": [{{"results": [')
+
+    def _write_report(self, report: Report) -> None:
+        for record in report.failed_checks + report.skipped_checks:
+            idx = self.rule_idx_by_check_id.get(record.check_id)
+            if idx is None:
+                idx = self.rule_idx_by_check_id[record.check_id] = len(self.rules)
+                self.rules.append(Report.get_sarif_rule(record))
+
+            self.level = Report.get_sarif_level(record, self.level)
+            result = Report.get_sarif_result(record, rule_idx=idx, level=self.level)
+
+            if self.results_count:
+                self.stream.write(", ")
+            self.stream.write(json.dumps(result, cls=CustomJSONEncoder))
+            self.results_count += 1
+
+    def close(self) -> None:
+        tool = json.dumps(Report.get_sarif_tool(self.tool, self.rules), cls=CustomJSONEncoder)
+        self.stream.write(f'], "tool": {tool}}}]}}')
+
+
+class JUnitXmlReportWriter(ReportWriter):
+    """Writes each report as a JUnit XML test suite
+
+    The 'testsuites' element holds the totals of all test suites, therefore the test suites are buffered
+    in a temporary file until all reports are written.
+    """
+
+    TOTAL_ATTRIBUTES = ("disabled", "errors", "failures", "tests")
+
+    def __init__(self, stream: TextIO, properties: dict[str, Any] | None = None, use_bc_ids: bool = False) -> None:
+        super().__init__(stream)
+        self.properties = properties
+        self.use_bc_ids = use_bc_ids
+        self.totals = dict.fromkeys(JUnitXmlReportWriter.TOTAL_ATTRIBUTES, 0)
+        self.total_time = 0.0
+        self.test_suites_file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+
+    def _write_report(self, report: Report) -> None:
+        self._write_test_suite(report.get_test_suite(properties=self.properties, use_bc_ids=self.use_bc_ids))
+
+    def _write_test_suite(self, test_suite: TestSuite) -> None:
+        test_cases = test_suite.test_cases
+        self.totals["disabled"] += sum(not case.is_enabled for case in test_cases)
+        self.totals["errors"] += sum(case.is_error() for case in test_cases)
+        self.totals["failures"] += sum(case.is_failure() for case in test_cases)
+        self.totals["tests"] += len(test_cases)
+        self.total_time += sum(case.elapsed_sec for case in test_cases if case.elapsed_sec)
+
+        # the test suite is pretty printed with the same indentation as inside the full document
+        test_suite_xml = Report.get_junit_xml_string([test_suite])
+        test_suite_xml = test_suite_xml.split("\n", 2)[2].rsplit("</testsuites>", 1)[0]
+        self.test_suites_file.write(test_suite_xml)
+
+    def close(self) -> None:
+        if not self.reports_count:
+            self._write_test_suite(Report("").get_test_suite(properties=self.properties))
+
+        attributes = " ".join(f'{key}="{value}"' for key, value in self.totals.items())
+        self.stream.write(f'<?xml version="1.0" ?>\n<testsuites {attributes} time="{self.total_time}">\n')
+
+        self.test_suites_file.seek(0)
+        shutil.copyfileobj(self.test_suites_file, self.stream)
+        self.test_suites_file.close()
+
+        self.stream.write("</testsuites>\n")
+
+
+def strip_code_blocks_from_json(report_json: dict[str, Any]) -> None:
+    results = report_json.get('results', {})
+    for result in results.values():
+        for result_dict in result:
+            if isinstance(result_dict, dict):
+                result_dict["code_block"] = None
+                result_dict["connected_node"] = None
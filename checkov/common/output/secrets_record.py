@@ -25,6 +25,8 @@ TEXT_BY_SECRET_VALIDATION_STATUS = {
 
 
 class SecretsRecord(Record):
+    __slots__ = ("validation_status",)
+
     def __init__(self,
                  check_id: str,
                  check_name: str,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import heapq
 import logging
 import multiprocessing
 import os
@@ -18,20 +19,44 @@ class ParallelRunner:
         self.workers_number = (workers_number if workers_number else os.cpu_count()) or 1
         self.os = platform.system()
 
-    def run_function(self, func: Callable[[Any], _T], items: List[Any], group_size: Optional[int] = None, run_multiprocess: Optional[bool] = False) -> Iterator[_T]:
+    def run_function(
+        self,
+        func: Callable[[Any], _T],
+        items: List[Any],
+        group_size: Optional[int] = None,
+        run_multiprocess: Optional[bool] = False,
+        item_weight: Optional[Callable[[Any], int]] = None,
+    ) -> Iterator[_T]:
+        """Runs the given function on all items in parallel
+
+        If 'item_weight' is set, then the items are distributed by their weight (ex. file size) instead of their count,
+        so a few heavy items don't delay the whole run.
+        """
+
         if self.os == 'Windows' or (not run_multiprocess and os.getenv("PYCHARM_HOSTED") == "1"):
             # PYCHARM_HOSTED env variable equals 1 when debugging via jetbrains IDE.
             # To prevent JetBrains IDE from crashing on debug use multi threading
             # Override this condition if run_multiprocess is set to True
+            if item_weight:
+                # start with the heaviest items, so they don't end up in the tail
+                items = sorted(items, key=item_weight, reverse=True)
             return self._run_function_multithreaded(func, items)
         else:
-            return self._run_function_multiprocess(func, items, group_size)
+            return self._run_function_multiprocess(func, items, group_size, item_weight)
 
-    def _run_function_multiprocess(self, func: Callable[[Any], Any], items: List[Any], group_size: Optional[int]) \
-            -> Generator[Any, None, None]:
-        if not group_size:
-            group_size = int(len(items) / self.workers_number) + 1
-        groups_of_items = [items[i: i + group_size] for i in range(0, len(items), group_size)]
+    def _run_function_multiprocess(
+        self,
+        func: Callable[[Any], Any],
+        items: List[Any],
+        group_size: Optional[int],
+        item_weight: Optional[Callable[[Any], int]] = None,
+    ) -> Generator[Any, None, None]:
+        if item_weight:
+            groups_of_items = self._group_items_by_weight(items, item_weight, self.workers_number)
+        else:
+            if not group_size:
+                group_size = int(len(items) / self.workers_number) + 1
+            groups_of_items = [items[i: i + group_size] for i in range(0, len(items), group_size)]
 
         def func_wrapper(original_func: Callable[[Any], Any], items_group: List[Any], connection: Connection) -> None:
             for item in items_group:
@@ -62,6 +87,23 @@ class ParallelRunner:
                 except EOFError:
                     pass
 
+    @staticmethod
+    def _group_items_by_weight(items: List[Any], item_weight: Callable[[Any], int], groups_number: int) -> List[List[Any]]:
+        """Distributes the items into groups of similar total weight
+
+        Uses the longest processing time first approach, by always adding the next heaviest item
+        to the currently lightest group.
+        """
+
+        groups: List[List[Any]] = [[] for _ in range(min(groups_number, len(items)))]
+        groups_heap = [(0, idx) for idx in range(len(groups))]
+        for item in sorted(items, key=item_weight, reverse=True):
+            group_weight, group_idx = heapq.heappop(groups_heap)
+            groups[group_idx].append(item)
+            heapq.heappush(groups_heap, (group_weight + item_weight(item), group_idx))
+
+        return groups
+
     def _run_function_multithreaded(self, func: Callable[[Any], _T], items: List[Any]) -> Iterator[_T]:
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers_number) as executor:
             return executor.map(func, items)
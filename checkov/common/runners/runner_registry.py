@@ -6,11 +6,12 @@ import json
 import logging
 import os
 import re
+import sys
 
 from collections import defaultdict
 from collections.abc import Iterable
 from pathlib import Path
-from typing import List, Dict, Any, Optional, cast, TYPE_CHECKING, Type
+from typing import List, Dict, Any, Optional, cast, TYPE_CHECKING, Type, Callable, TextIO
 
 from typing_extensions import Literal
 
@@ -31,11 +32,12 @@ from checkov.common.output.csv import CSVSBOM
 from checkov.common.output.cyclonedx import CycloneDX
 from checkov.common.output.gitlab_sast import GitLabSast
 from checkov.common.output.report import Report, merge_reports
+from checkov.common.output.report_writer import JsonReportWriter, JUnitXmlReportWriter, ReportWriter, \
+    SarifReportWriter, strip_code_blocks_from_json
 from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.common.typing import _ExitCodeThresholds, _BaseRunner
 from checkov.common.util import data_structures_utils
 from checkov.common.util.banner import tool as tool_name
-from checkov.common.util.json_utils import CustomJSONEncoder
 from checkov.common.util.secrets_omitter import SecretsOmitter
 from checkov.common.util.type_forcers import convert_csv_string_arg_to_list, force_list
 from checkov.sca_image.runner import Runner as image_runner
@@ -55,6 +57,17 @@ CYCLONEDX_OUTPUTS = ("cyclonedx", "cyclonedx_json")
 OUTPUT_CHOICES = ["cli", "cyclonedx", "cyclonedx_json", "json", "junitxml", "github_failed_only", "gitlab_sast", "sarif", "csv"]
 SUMMARY_POSITIONS = frozenset(['top', 'bottom'])
 OUTPUT_DELIMITER = "\n--- OUTPUT DELIMITER ---\n"
+OUTPUT_FILE_NAMES = {
+    'cli': 'results_cli.txt',
+    'github_failed_only': 'results_github_failed_only.md',
+    'sarif': 'results_sarif.sarif',
+    'json': 'results_json.json',
+    'junitxml': 'results_junitxml.xml',
+    'cyclonedx': 'results_cyclonedx.xml',
+    'cyclonedx_json': 'results_cyclonedx.json',
+    'gitlab_sast': 'results_gitlab_sast.json',
+}
+STREAMED_OUTPUTS = frozenset(["json", "junitxml", "sarif"])
 
 
 class RunnerRegistry:
@@ -281,9 +294,12 @@ class RunnerRegistry:
         else:
             output_formats = {output_format: CONSOLE_OUTPUT for output_format in config.output}
 
+        # the output of these formats is written incrementally to the files, therefore the paths are needed upfront
+        output_file_paths = self._get_output_file_paths(config, output_formats)
+
         exit_codes = []
         cli_reports = []
-        report_jsons = []
+        json_reports = []
         sarif_reports = []
         junit_reports = []
         github_reports = []
@@ -303,7 +319,7 @@ class RunnerRegistry:
         for report in scan_reports:
             if not report.is_empty():
                 if "json" in config.output:
-                    report_jsons.append(report.get_dict(is_quiet=config.quiet, url=url))
+                    json_reports.append(report)
                 if "junitxml" in config.output:
                     junit_reports.append(report)
                 if "github_failed_only" in config.output:
@@ -363,8 +379,6 @@ class RunnerRegistry:
             ansi_escape = re.compile(r'(?:\x1B[@-_]|[\x80-\x9F])[0–9:;<=>?]*[ -/]*[@-~]')
             data_outputs['cli'] = ansi_escape.sub('', cli_output)
         if "sarif" in config.output:
-            master_report = Report("merged")
-
             output_format = output_formats["sarif"]
             if "cli" not in config.output and output_format == CONSOLE_OUTPUT:
                 print(self.banner)
@@ -379,12 +393,16 @@ class RunnerRegistry:
                         use_bc_ids=config.output_bc_ids,
                         summary_position=config.summary_position
                     ))
-                master_report.failed_checks += report.failed_checks
-                master_report.skipped_checks += report.skipped_checks
 
             if output_format == CONSOLE_OUTPUT:
                 # don't write to file, if an explicit file path was set
-                master_report.write_sarif_output(self.tool)
+                if self.stream_output_to_file(
+                    file_name="results.sarif",
+                    data_format="sarif",
+                    reports=sarif_reports,
+                    create_writer=lambda stream: SarifReportWriter(stream=stream, tool=self.tool),
+                ):
+                    print("\nWrote output in SARIF format to the file 'results.sarif'")
 
             if output_format == CONSOLE_OUTPUT:
                 del output_formats["sarif"]
@@ -394,46 +412,58 @@ class RunnerRegistry:
                 if CONSOLE_OUTPUT in output_formats.values():
                     print(OUTPUT_DELIMITER)
 
-            data_outputs["sarif"] = json.dumps(master_report.get_sarif_json(self.tool), cls=CustomJSONEncoder)
+            if "sarif" in output_file_paths:
+                self.stream_output_to_file(
+                    file_name=output_file_paths["sarif"],
+                    data_format="sarif",
+                    reports=sarif_reports,
+                    create_writer=lambda stream: SarifReportWriter(stream=stream, tool=self.tool),
+                )
         if "json" in config.output:
-            if config.compact and report_jsons:
-                self.strip_code_blocks_from_json(report_jsons)
-
-            report_json_output: "list[dict[str, Any]] | dict[str, Any]" = report_jsons
-            if not report_jsons:
-                report_json_output = Report("").get_summary()
-            elif len(report_jsons) == 1:
-                report_json_output = report_jsons[0]
-
-            json_output = json.dumps(report_json_output, indent=4, cls=CustomJSONEncoder)
+            def create_json_writer(stream: TextIO, indent: int | None = None) -> JsonReportWriter:
+                return JsonReportWriter(
+                    stream=stream,
+                    reports_number=len(json_reports),
+                    is_quiet=config.quiet,
+                    url=url,
+                    compact=config.compact,
+                    indent=indent,
+                )
 
-            self._print_to_console(
+            self._stream_to_console(
                 output_formats=output_formats,
                 output_format="json",
-                output=json_output,
+                reports=json_reports,
+                create_writer=lambda stream: create_json_writer(stream=stream, indent=4),
             )
 
-            data_outputs["json"] = json.dumps(report_json_output, cls=CustomJSONEncoder)
+            if "json" in output_file_paths:
+                self.stream_output_to_file(
+                    file_name=output_file_paths["json"],
+                    data_format="json",
+                    reports=json_reports,
+                    create_writer=create_json_writer,
+                )
         if "junitxml" in config.output:
             properties = Report.create_test_suite_properties_block(config)
 
-            if junit_reports:
-                test_suites = [
-                    report.get_test_suite(properties=properties, use_bc_ids=config.output_bc_ids)
-                    for report in junit_reports
-                ]
-            else:
-                test_suites = [Report("").get_test_suite(properties=properties)]
-
-            junit_output = Report.get_junit_xml_string(test_suites)
+            def create_junit_writer(stream: TextIO) -> JUnitXmlReportWriter:
+                return JUnitXmlReportWriter(stream=stream, properties=properties, use_bc_ids=config.output_bc_ids)
 
-            self._print_to_console(
+            self._stream_to_console(
                 output_formats=output_formats,
                 output_format="junitxml",
-                output=junit_output,
+                reports=junit_reports,
+                create_writer=create_junit_writer,
             )
 
-            data_outputs['junitxml'] = junit_output
+            if "junitxml" in output_file_paths:
+                self.stream_output_to_file(
+                    file_name=output_file_paths["junitxml"],
+                    data_format="junitxml",
+                    reports=junit_reports,
+                    create_writer=create_junit_writer,
+                )
         if any(cyclonedx in config.output for cyclonedx in CYCLONEDX_OUTPUTS):
             cyclonedx = CycloneDX(repo_id=metadata_integration.bc_integration.repo_id, reports=cyclonedx_reports)
 
@@ -475,36 +505,76 @@ class RunnerRegistry:
             csv_sbom_report.persist_report(is_api_key=is_api_key, output_path=config.output_file_path)
 
         # Save output to file
-        file_names = {
-            'cli': 'results_cli.txt',
-            'github_failed_only': 'results_github_failed_only.md',
-            'sarif': 'results_sarif.sarif',
-            'json': 'results_json.json',
-            'junitxml': 'results_junitxml.xml',
-            'cyclonedx': 'results_cyclonedx.xml',
-            'cyclonedx_json': 'results_cyclonedx.json',
-            'gitlab_sast': 'results_gitlab_sast.json',
-        }
-
-        if config.output_file_path:
-            if output_formats:
-                for output_format, output_path in output_formats.items():
-                    self.save_output_to_file(
-                        file_name=output_path,
-                        data=data_outputs[output_format],
-                        data_format=output_format,
-                    )
-            else:
-                for output in config.output:
-                    if output in file_names:
-                        self.save_output_to_file(
-                            file_name=f'{config.output_file_path}/{file_names[output]}',
-                            data=data_outputs[output],
-                            data_format=output,
-                        )
+        for output_format, output_path in output_file_paths.items():
+            if output_format in STREAMED_OUTPUTS:
+                # already written
+                continue
+            self.save_output_to_file(
+                file_name=output_path,
+                data=data_outputs[output_format],
+                data_format=output_format,
+            )
         exit_code = 1 if 1 in exit_codes else 0
         return cast(Literal[0, 1], exit_code)
 
+    @staticmethod
+    def _get_output_file_paths(config: argparse.Namespace, output_formats: dict[str, str]) -> dict[str, str]:
+        """Returns the file paths to save the outputs to, outputs to the console are only saved without a mapping"""
+
+        if not config.output_file_path:
+            return {}
+
+        output_file_paths = {
+            output_format: output_path
+            for output_format, output_path in output_formats.items()
+            if output_path != CONSOLE_OUTPUT
+        }
+        if output_file_paths:
+            return output_file_paths
+
+        return {
+            output: f'{config.output_file_path}/{OUTPUT_FILE_NAMES[output]}'
+            for output in config.output
+            if output in OUTPUT_FILE_NAMES
+        }
+
+    def stream_output_to_file(
+        self, file_name: str, data_format: str, reports: list[Report], create_writer: Callable[[TextIO], ReportWriter]
+    ) -> bool:
+        """Writes the reports one after the other to the file and returns, if it was successful"""
+
+        try:
+            file_path = Path(file_name)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "w") as f:
+                self._write_reports(writer=create_writer(f), reports=reports)
+            logging.info(f"\nWrote output in {data_format} format to the file '{file_name}')")
+            return True
+        except EnvironmentError:
+            logging.error(f"\nAn error occurred while writing {data_format} results to file: {file_name}",
+                          exc_info=True)
+            return False
+
+    def _stream_to_console(
+        self,
+        output_formats: dict[str, str],
+        output_format: str,
+        reports: list[Report],
+        create_writer: Callable[[TextIO], ReportWriter],
+    ) -> None:
+        """Writes the reports one after the other to the console, if needed"""
+
+        if output_formats[output_format] == CONSOLE_OUTPUT:
+            self._write_reports(writer=create_writer(sys.stdout), reports=reports)
+            # finishes the output with a line break like the other outputs
+            self._print_to_console(output_formats=output_formats, output_format=output_format, output="")
+
+    @staticmethod
+    def _write_reports(writer: ReportWriter, reports: list[Report]) -> None:
+        for report in reports:
+            writer.write_report(report)
+        writer.close()
+
     def _print_to_console(self, output_formats: dict[str, str], output_format: str, output: str, url: str | None = None) -> None:
         """Prints the output to console, if needed"""
 
@@ -635,12 +705,7 @@ class RunnerRegistry:
     @staticmethod
     def strip_code_blocks_from_json(report_jsons: List[Dict[str, Any]]) -> None:
         for report in report_jsons:
-            results = report.get('results', {})
-            for result in results.values():
-                for result_dict in result:
-                    if isinstance(result_dict, dict):
-                        result_dict["code_block"] = None
-                        result_dict["connected_node"] = None
+            strip_code_blocks_from_json(report)
 
     @staticmethod
     def extract_git_info_from_account_id(account_id: str) -> tuple[str, str]:
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+_MISSING = object()
+
+
+class BoundedCache(Generic[_K, _V]):
+    """
+    A bounded, thread-safe in-memory cache, which evicts the least recently used entries first.
+
+    It keeps hit, miss and eviction counters, so the effectiveness of the cache can be logged.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: _K, factory: Callable[[_K], _V]) -> _V:
+        """Returns the cached value of the key or computes and caches it
+
+        The value is computed outside the lock, exceptions of the factory are not cached.
+        """
+
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory(key)
+            self.put(key, value)
+        return value  # type:ignore[no-any-return]  # the value is either cached or computed
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any
+
+CACHE_ENTRY_SUFFIX = ".json"
+CACHE_FORMAT_VERSION = 2
+DEFAULT_CACHE_MAX_SIZE = 512 * 1024 * 1024  # 512 MB
+
+
+def compute_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class ContentCache:
+    """
+    A persistent, content addressed cache, which is stored on disk.
+
+    The cache directory is usually shared between CI runs, therefore the entries are stored as JSON and only
+    plain data (dicts with str keys, lists, str, int, float, bool and None) can be cached. Loading an entry never
+    executes code, payloads with any other type are not stored.
+
+    Entries are grouped under a namespace, which should change, whenever the stored payload format can change
+    (ex. a new checkov or parser version). Namespaces of the same prefix, which don't match the current one,
+    are removed on initialization. The total size of the namespace is bounded and the least recently used
+    entries are evicted first.
+    """
+
+    def __init__(self, cache_dir: str, namespace: str, max_size: int = DEFAULT_CACHE_MAX_SIZE) -> None:
+        self.cache_dir = cache_dir
+        self.namespace = namespace
+        self.max_size = max_size
+        self.namespace_dir = os.path.join(cache_dir, namespace)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.enabled = True
+
+        try:
+            os.makedirs(self.namespace_dir, exist_ok=True)
+            self._remove_stale_namespaces()
+            self.size = self._compute_size()
+        except OSError:
+            logging.info(f"Failed to initialize cache directory {self.namespace_dir}, caching is disabled", exc_info=True)
+            self.enabled = False
+            self.size = 0
+
+    @staticmethod
+    def build_namespace(prefix: str, *versions: str) -> str:
+        versions_hash = compute_content_hash("|".join((str(CACHE_FORMAT_VERSION), *versions)).encode("utf-8"))
+        return f"{prefix}-{versions_hash[:16]}"
+
+    def get(self, key: str) -> Any | None:
+        """Returns the cached payload for the given key or None, if it doesn't exist"""
+
+        if not self.enabled:
+            return None
+
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            # bump the modification time to keep the entry in the LRU order
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            logging.debug(f"Failed to load cache entry {entry_path}", exc_info=True)
+            self._remove_entry(entry_path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return payload
+
+    def put(self, key: str, payload: Any) -> None:
+        if not self.enabled:
+            return
+
+        entry_path = self._get_entry_path(key)
+        try:
+            data = json.dumps(payload).encode("utf-8")
+            if json.loads(data) != payload:
+                # ex. tuples or non str dict keys, which would be loaded as a different payload
+                logging.debug(f"Skipping cache entry {entry_path}, the payload is not plain JSON data")
+                return
+            # write to a temp file first, so concurrent readers never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.namespace_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            logging.debug(f"Failed to store cache entry {entry_path}", exc_info=True)
+            return
+
+        self.size += len(data)
+        if self.size > self.max_size:
+            self._evict()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+        }
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.namespace_dir, f"{key}{CACHE_ENTRY_SUFFIX}")
+
+    def _remove_stale_namespaces(self) -> None:
+        prefix = self.namespace.rsplit("-", maxsplit=1)[0]
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir() and entry.name.startswith(f"{prefix}-") and entry.name != self.namespace:
+                logging.debug(f"Removing stale cache namespace {entry.path}")
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _compute_size(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.namespace_dir) if entry.is_file())
+
+    def _remove_entry(self, entry_path: str) -> None:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries, until the cache is back under 90% of its max size"""
+
+        entries = []
+        for entry in os.scandir(self.namespace_dir):
+            if entry.is_file() and entry.name.endswith(CACHE_ENTRY_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        entries.sort()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target_size = int(self.max_size * 0.9)
+        for _, entry_size, entry_path in entries:
+            if size <= target_size:
+                break
+            self._remove_entry(entry_path)
+            size -= entry_size
+            self.evictions += 1
+
+        self.size = size
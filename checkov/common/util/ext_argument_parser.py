@@ -391,6 +391,20 @@ class ExtArgumentParser(configargparse.ArgumentParser):
             default=DEFAULT_EXTERNAL_MODULES_DIR,
             env_var="EXTERNAL_MODULES_DIR",
         )
+        self.add(
+            "--parse-cache-dir",
+            help="Directory to persist parsed Terraform files in, keyed by their content hash. "
+            "Unchanged files are loaded from the cache on subsequent runs instead of being parsed again. "
+            "The cache size can be limited via the CHECKOV_PARSE_CACHE_MAX_SIZE env var (in bytes).",
+            env_var="CKV_PARSE_CACHE_DIR",
+        )
+        self.add(
+            "--incremental-from",
+            help="Directory holding the state of a previous Terraform scan. Only resources impacted by files, "
+            "which changed since then, are scanned again by the Terraform resource checks, the results of all other "
+            "resources are taken from the previous scan. The state is updated with the results of the current scan.",
+            env_var="CKV_INCREMENTAL_FROM",
+        )
         self.add(
             "--evaluate-variables",
             help="evaluate the values of variables and locals",
@@ -8,6 +8,7 @@ from bc_jsonpath_ng import parse, JSONPath
 from checkov.common.bridgecrew.severities import Severity
 from checkov.common.output.common import ImageDetails
 from checkov.common.packaging.version import LegacyVersion, Version
+from checkov.common.util.source_file_store import CodeBlockReference
 
 type_of_function = type(lambda x: x)
 
@@ -28,6 +29,8 @@ class CustomJSONEncoder(json.JSONEncoder):
             return str(o)
         elif isinstance(o, ImageDetails):
             return o.__dict__
+        elif isinstance(o, CodeBlockReference):
+            return o.get_code_block()
         elif isinstance(o, type_of_function):
             return str(o)
         else:
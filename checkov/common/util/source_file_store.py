@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import os
+import re
+import sys
+import threading
+from array import array
+from typing import Any, Iterator, Sequence, Tuple, overload
+
+from checkov.common.util.bounded_cache import BoundedCache
+
+# the lines are split like a file opened in text mode with universal newlines mode would do
+LINE_END_PATTERN = re.compile(rb"\r\n?|\n")
+MAX_OPEN_FILES = 64  # every memory map keeps its own file descriptor open
+
+
+class SourceFileStore:
+    """
+    Provides the lines of source files on demand, without keeping their content in memory.
+
+    The files are memory mapped and only the byte offsets of their line starts are kept per file,
+    therefore a code block can be sliced from a file at any time, ex. when the scan results are printed.
+    The number of concurrently open memory maps is bounded and the least recently used ones are closed first.
+    """
+
+    def __init__(self, max_open_files: int = MAX_OPEN_FILES) -> None:
+        self._line_offsets: dict[str, array[int]] = {}
+        self._file_signatures: dict[str, tuple[int, int]] = {}
+        self._memory_maps: BoundedCache[str, mmap.mmap | None] = BoundedCache(max_size=max_open_files)
+        self._lock = threading.Lock()
+
+    def get_lines(self, file_path: str, start_line: int, end_line: int) -> list[tuple[int, str]]:
+        """Returns the numbered lines of the given range, the end line is included
+
+        Lines outside the file are omitted and a non-readable file has no lines at all.
+        """
+
+        with self._lock:
+            line_offsets = self._get_line_offsets(file_path)
+            start_line = max(start_line, 1)
+            end_line = min(end_line, len(line_offsets) - 1)
+            if start_line > end_line:
+                return []
+
+            memory_map = self._memory_maps.get_or_compute(file_path, self._open_memory_map)
+            if memory_map is None:
+                return []
+
+            return [
+                (line_num, self._decode_line(memory_map[line_offsets[line_num - 1]:line_offsets[line_num]]))
+                for line_num in range(start_line, end_line + 1)
+            ]
+
+    def get_file_lines(self, file_path: str) -> list[tuple[int, str]]:
+        """Returns all numbered lines of the file and re-indexes it, if it was modified since the last read"""
+
+        # the text contains only '\n' line breaks, other characters like form feeds don't split lines in text mode
+        with io.StringIO(self.get_file_text(file_path), newline="\n") as file:
+            return [(idx + 1, line) for idx, line in enumerate(file)]
+
+    def get_file_text(self, file_path: str) -> str:
+        """Returns the content of the file with universal newlines and re-indexes it, if it was modified since the last read"""
+
+        with self._lock:
+            signature = self._get_file_signature(file_path)
+            if self._file_signatures.get(file_path) != signature:
+                self._file_signatures[file_path] = signature
+                self._line_offsets.pop(file_path, None)
+                self._memory_maps.put(file_path, self._open_memory_map(file_path))
+
+            memory_map = self._memory_maps.get_or_compute(file_path, self._open_memory_map)
+            if memory_map is None:
+                return ""
+
+            with io.TextIOWrapper(io.BytesIO(memory_map), encoding="utf-8", errors="replace") as file:
+                return file.read()
+
+    def get_line_count(self, file_path: str) -> int:
+        with self._lock:
+            return len(self._get_line_offsets(file_path)) - 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._line_offsets.clear()
+            self._file_signatures.clear()
+            self._memory_maps.clear()
+
+    def _get_line_offsets(self, file_path: str) -> array[int]:
+        line_offsets = self._line_offsets.get(file_path)
+        if line_offsets is None:
+            memory_map = self._memory_maps.get_or_compute(file_path, self._open_memory_map)
+            line_offsets = array("q", [0])
+            if memory_map is not None:
+                line_offsets.extend(match.end() for match in LINE_END_PATTERN.finditer(memory_map))
+                if line_offsets[-1] != len(memory_map):
+                    # the last line doesn't end with a line break
+                    line_offsets.append(len(memory_map))
+            self._line_offsets[file_path] = line_offsets
+
+        return line_offsets
+
+    @staticmethod
+    def _get_file_signature(file_path: str) -> tuple[int, int]:
+        try:
+            stat = os.stat(file_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return 0, 0
+
+    @staticmethod
+    def _open_memory_map(file_path: str) -> mmap.mmap | None:
+        try:
+            with open(file_path, "rb") as file:
+                # empty files can't be memory mapped
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if file.seek(0, 2) else None
+        except (OSError, ValueError):
+            logging.debug(f"Failed to memory map file {file_path}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _decode_line(line: bytes) -> str:
+        text = line.decode("utf-8", errors="replace")
+        if text.endswith("\r\n"):
+            return f"{text[:-2]}\n"
+        elif text.endswith("\r"):
+            return f"{text[:-1]}\n"
+        return text
+
+
+source_file_store = SourceFileStore()
+
+
+class CodeBlockReference(Sequence[Tuple[int, str]]):
+    """References the code lines of a file, which are only read, when the code block is accessed
+
+    It can be used everywhere instead of the numbered code lines, the lines are read from the shared source file store.
+    """
+
+    __slots__ = ("file_abs_path", "start_line", "end_line")
+
+    def __init__(self, file_abs_path: str, start_line: int, end_line: int) -> None:
+        self.file_abs_path = sys.intern(file_abs_path)
+        self.start_line = start_line
+        self.end_line = end_line
+
+    def get_code_block(self) -> list[tuple[int, str]]:
+        return source_file_store.get_lines(self.file_abs_path, self.start_line, self.end_line)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, str]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[int, str]]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> tuple[int, str] | list[tuple[int, str]]:
+        return self.get_code_block()[index]
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return iter(self.get_code_block())
+
+    def __len__(self) -> int:
+        line_count = source_file_store.get_line_count(self.file_abs_path)
+        return max(min(self.end_line, line_count) - max(self.start_line, 1) + 1, 0)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CodeBlockReference):
+            return (self.file_abs_path, self.start_line, self.end_line) == (
+                other.file_abs_path, other.start_line, other.end_line
+            )
+        if isinstance(other, list):
+            return self.get_code_block() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.file_abs_path, self.start_line, self.end_line))
+
+    def __repr__(self) -> str:
+        return f"CodeBlockReference({self.file_abs_path!r}, {self.start_line}, {self.end_line})"
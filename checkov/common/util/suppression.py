@@ -51,3 +51,35 @@ def collect_suppressions_for_context(code_lines: Iterable[tuple[int, int | str]]
             skipped_checks.append(skipped_check)
 
     return skipped_checks
+
+
+def collect_suppressions_for_file(file_text: str) -> list[tuple[int, _SkippedCheck]]:
+    """Searches for suppressions in a whole file at once and returns them with their line number
+
+    Like searching line by line, only the first suppression of a line is collected.
+    """
+
+    suppressions: list[tuple[int, _SkippedCheck]] = []
+    bc_id_mapping = metadata_integration.bc_to_ckv_id_mapping
+    line_number = 1
+    position = 0
+    for skip_search in COMMENT_REGEX.finditer(file_text):
+        line_number += file_text.count("\n", position, skip_search.start())
+        position = skip_search.start()
+        if suppressions and suppressions[-1][0] == line_number:
+            continue
+
+        skipped_check: _SkippedCheck = {
+            "id": skip_search.group(2),
+            "suppress_comment": skip_search.group(3)[1:] if skip_search.group(3) else "No comment provided",
+        }
+        # No matter which ID was used to skip, save the pair of IDs in the appropriate fields
+        if bc_id_mapping and skipped_check["id"] in bc_id_mapping:
+            skipped_check["bc_id"] = skipped_check["id"]
+            skipped_check["id"] = bc_id_mapping[skipped_check["id"]]
+        elif metadata_integration.check_metadata:
+            skipped_check["bc_id"] = metadata_integration.get_bc_id(skipped_check["id"])
+
+        suppressions.append((line_number, skipped_check))
+
+    return suppressions
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from checkov.common.typing import _SkippedCheck
+
+
+class SuppressionIndex:
+    """Indexes the skipped checks of an entity or file by their check id
+
+    The registries look up the skip info of each check in constant time, instead of searching all skipped checks.
+    If a check is skipped multiple times, the first suppression wins.
+    """
+
+    __slots__ = ("_skipped_checks_by_id",)
+
+    def __init__(self, skipped_checks: Iterable[_SkippedCheck] | None) -> None:
+        self._skipped_checks_by_id: dict[str, list[_SkippedCheck]] = {}
+        for skipped_check in skipped_checks or ():
+            self._skipped_checks_by_id.setdefault(skipped_check["id"], []).append(skipped_check)
+
+    def get(self, check_id: str, start_line: int | None = None, end_line: int | None = None) -> _SkippedCheck:
+        """Returns the skip info of the check or an empty one
+
+        If a line range is given, only suppressions with a line number inside the range are considered,
+        which is used for file level suppressions.
+        """
+
+        skipped_checks = self._skipped_checks_by_id.get(check_id)
+        if skipped_checks:
+            if start_line is None or end_line is None:
+                return skipped_checks[0]
+            for skipped_check in skipped_checks:
+                line_number = skipped_check.get("line_number")
+                if line_number is not None and start_line <= line_number <= end_line:
+                    return skipped_check
+
+        return {}
+
+    def __contains__(self, check_id: str) -> bool:
+        return check_id in self._skipped_checks_by_id
+
+    def __bool__(self) -> bool:
+        return bool(self._skipped_checks_by_id)
+
@@ -6,6 +6,7 @@ from checkov.common.checks.base_check import BaseCheck
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
 from checkov.common.models.enums import CheckResult
 from checkov.common.typing import _SkippedCheck
+from checkov.common.util.suppression_index import SuppressionIndex
 from checkov.json_doc.enums import BlockType
 from checkov.runner_filter import RunnerFilter
 
@@ -71,8 +72,9 @@ class Registry(BaseCheckRegistry):
         entity_type: str,
         results: Dict[str, Any],
     ) -> None:
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info = ([x for x in skipped_checks if x["id"] == check.id] or [{}])[0]
+            skip_info = suppressions.get(check.id)
 
             if runner_filter.should_run_check(check=check, report_type=self.report_type):
                 scanner: Callable[[str, Any, Any, Any, str, str, Dict[str, Any]], None] = self._scanner.get(check.block_type, self._scan_json_document)
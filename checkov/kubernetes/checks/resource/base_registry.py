@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.common.util.suppression_index import SuppressionIndex
 
 if TYPE_CHECKING:
     from checkov.common.checks.base_check import BaseCheck
@@ -30,11 +31,9 @@ class Registry(BaseCheckRegistry):
         (entity_type, entity_configuration) = self.extract_entity_details(entity)
         results = {}
         checks = self.get_checks(entity_type)
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info: "_SkippedCheck" = {}
-            if skipped_checks:
-                if check.id in [x['id'] for x in skipped_checks]:
-                    skip_info = [x for x in skipped_checks if x['id'] == check.id][0]
+            skip_info = suppressions.get(check.id)
 
             if self._should_run_scan(check, entity_configuration, runner_filter, self.report_type):
                 self.logger.debug("Running check: {} on file {}".format(check.name, scanned_file))
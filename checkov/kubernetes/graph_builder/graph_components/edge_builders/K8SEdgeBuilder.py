@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import abstractmethod
+from typing import Any
 
 from checkov.kubernetes.graph_builder.graph_components.blocks import KubernetesBlock
 
@@ -26,3 +27,21 @@ class K8SEdgeBuilder:
         e.g: find vertices with a label attribute that match current vertex's selector attribute
         """
         raise NotImplementedError
+
+    @staticmethod
+    @abstractmethod
+    def create_index(vertices: list[KubernetesBlock]) -> Any:
+        """
+        implementation should build a lookup structure of the vertices once per graph,
+        which lets find_indexed_connections avoid comparing a vertex with every other vertex.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    @abstractmethod
+    def find_indexed_connections(vertex: KubernetesBlock, vertices: list[KubernetesBlock], index: Any) -> list[int]:
+        """
+        implementation should return the same connections as find_connections, in the same order,
+        by using the index created by create_index for the given vertices
+        """
+        raise NotImplementedError
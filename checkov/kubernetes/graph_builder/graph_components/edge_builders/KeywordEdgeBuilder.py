@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
 from checkov.kubernetes.graph_builder.graph_components.edge_builders.K8SEdgeBuilder import K8SEdgeBuilder
 from checkov.kubernetes.graph_builder.graph_components.blocks import KubernetesBlock
 from checkov.kubernetes.graph_builder.graph_components.ResourceKeywordIdentifier import ResourceKeywordIdentifier
 from checkov.kubernetes.kubernetes_utils import FILTERED_RESOURCES_FOR_EDGE_BUILDERS
 
 
+@dataclass
+class KeywordIndex:
+    # maps a (potential vertex key, value) pair to the indices of the vertices having it
+    postings: dict[tuple[str, Any], list[int]] = field(default_factory=lambda: defaultdict(list))
+    # vertices with unhashable values per key, which are compared one by one
+    unindexed_vertices: dict[str, list[int]] = field(default_factory=lambda: defaultdict(list))
+
+
 class KeywordEdgeBuilder(K8SEdgeBuilder):
 
     @staticmethod
@@ -72,3 +85,97 @@ class KeywordEdgeBuilder(K8SEdgeBuilder):
             match = False
 
         return match
+
+    @staticmethod
+    def create_index(vertices: list[KubernetesBlock]) -> KeywordIndex:
+        potential_vertex_keys: set[str] = set()
+        all_references_definitions: list[list[dict[str, str] | list[dict[str, dict[str, str]]]]] = list(ResourceKeywordIdentifier.KINDS_KEYWORDS_MAP.values())  # type: ignore[arg-type]
+        for resource_references_definitions in all_references_definitions:
+            for references_definition in resource_references_definitions:
+                if isinstance(references_definition, dict):
+                    potential_vertex_keys.update(references_definition.keys())
+                elif isinstance(references_definition, list):
+                    for reference_definitions_items in references_definition[0].values():
+                        potential_vertex_keys.update(reference_definitions_items.keys())
+
+        index = KeywordIndex()
+        for vertex_index, vertex in enumerate(vertices):
+            for potential_vertex_key in potential_vertex_keys:
+                value = vertex.attributes.get(potential_vertex_key)
+                if value is None:
+                    continue
+                if isinstance(value, Hashable):
+                    index.postings[(potential_vertex_key, value)].append(vertex_index)
+                else:
+                    index.unindexed_vertices[potential_vertex_key].append(vertex_index)
+
+        return index
+
+    @staticmethod
+    def find_indexed_connections(
+        vertex: KubernetesBlock, vertices: list[KubernetesBlock], index: KeywordIndex
+    ) -> list[int]:
+        # counts the matched references definitions per vertex, to keep the result equal to find_connections
+        matches_count: Counter[int] = Counter()
+        resource_references_definitions: list[dict[str, str] | list[dict[str, dict[str, str]]]] = ResourceKeywordIdentifier.KINDS_KEYWORDS_MAP[vertex.attributes["kind"]]  # type: ignore[assignment]
+        for references_definition in resource_references_definitions:
+            if isinstance(references_definition, dict):
+                matches_count.update(KeywordEdgeBuilder._find_indexed_matches(
+                    vertex, vertices, index, references_definition.items()
+                ))
+
+            elif isinstance(references_definition, list):
+                for base_key_attribute, reference_definitions_items in references_definition[0].items():
+                    vertex_attribute_references_list: list[dict[str, str]] = vertex.attributes.get(base_key_attribute)  # type: ignore[assignment]
+                    if not vertex_attribute_references_list:
+                        continue
+                    for i in range(len(vertex_attribute_references_list)):
+                        references = [
+                            (potential_vertex_key, f"{base_key_attribute}.{i}.{vertex_key}")
+                            for potential_vertex_key, vertex_key in reference_definitions_items.items()
+                        ]
+                        matches_count.update(KeywordEdgeBuilder._find_indexed_matches(vertex, vertices, index, references))
+
+        connections: list[int] = []
+        for potential_vertex_index in sorted(matches_count):
+            if vertices[potential_vertex_index].id != vertex.id:
+                connections.extend([potential_vertex_index] * matches_count[potential_vertex_index])
+
+        return connections
+
+    @staticmethod
+    def _find_indexed_matches(
+        vertex: KubernetesBlock,
+        vertices: list[KubernetesBlock],
+        index: KeywordIndex,
+        references: Iterable[tuple[str, str]],
+    ) -> set[int]:
+        """Returns the indices of the vertices, which match all the given (potential vertex key, vertex key) references"""
+
+        references_values: list[tuple[str, Any]] = []
+        for potential_vertex_key, vertex_key in references:
+            vertex_ref = vertex.attributes.get(vertex_key)
+            if vertex_ref is None:
+                return set()
+            references_values.append((potential_vertex_key, vertex_ref))
+
+        # only the vertices of the rarest reference are compared with all references
+        candidates: Iterable[int] = range(len(vertices))
+        candidates_count = len(vertices)
+        for potential_vertex_key, vertex_ref in references_values:
+            if not isinstance(vertex_ref, Hashable):
+                continue
+            posting = index.postings.get((potential_vertex_key, vertex_ref), [])
+            unindexed_vertices = index.unindexed_vertices.get(potential_vertex_key, [])
+            if len(posting) + len(unindexed_vertices) < candidates_count:
+                candidates = posting + unindexed_vertices
+                candidates_count = len(posting) + len(unindexed_vertices)
+
+        return {
+            potential_vertex_index
+            for potential_vertex_index in candidates
+            if all(
+                vertices[potential_vertex_index].attributes.get(potential_vertex_key) == vertex_ref
+                for potential_vertex_key, vertex_ref in references_values
+            )
+        }
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
 from checkov.kubernetes.graph_builder.graph_components.edge_builders.K8SEdgeBuilder import K8SEdgeBuilder
+from checkov.kubernetes.graph_builder.graph_components.edge_builders.LabelsIndex import LabelsIndex, is_indexable
 from checkov.kubernetes.graph_builder.graph_components.blocks import KubernetesBlock
 from checkov.kubernetes.kubernetes_utils import FILTERED_RESOURCES_FOR_EDGE_BUILDERS
 
 
+@dataclass
+class LabelSelectorIndex:
+    selectors: LabelsIndex = field(default_factory=LabelsIndex)
+    # vertices with selectors, which can't be indexed and are compared one by one
+    unindexed_vertices: list[int] = field(default_factory=list)
+
+
 class LabelSelectorEdgeBuilder(K8SEdgeBuilder):
 
     @staticmethod
@@ -41,13 +52,52 @@ class LabelSelectorEdgeBuilder(K8SEdgeBuilder):
                 continue
 
             match_labels = potential_vertex.metadata.selector.match_labels
-            if match_labels:
-                if len(match_labels) > len(labels):
-                    continue
-                # find shared label between the inspected vertex and the iterated potential vertex
-                shared_labels = [k for k in match_labels if k in labels and match_labels[k] == labels[k]]
-                if len(shared_labels) == len(match_labels):
-                    # if all potential vertex's selector labels appear in vertex's labels - it's connected
-                    connections.append(potential_vertex_index)
+            if match_labels and LabelSelectorEdgeBuilder._is_selected(labels, match_labels):
+                connections.append(potential_vertex_index)
 
         return connections
+
+    @staticmethod
+    def create_index(vertices: list[KubernetesBlock]) -> LabelSelectorIndex:
+        index = LabelSelectorIndex()
+        for vertex_index, vertex in enumerate(vertices):
+            if not vertex.metadata:
+                continue
+
+            match_labels = vertex.metadata.selector.match_labels
+            if match_labels and not index.selectors.add(vertex_index, match_labels):
+                index.unindexed_vertices.append(vertex_index)
+
+        return index
+
+    @staticmethod
+    def find_indexed_connections(
+        vertex: KubernetesBlock, vertices: list[KubernetesBlock], index: LabelSelectorIndex
+    ) -> list[int]:
+        if not vertex.metadata:
+            return []
+
+        labels = vertex.metadata.labels
+        if not is_indexable(labels):
+            return LabelSelectorEdgeBuilder.find_connections(vertex, vertices)
+
+        connections = index.selectors.find_contained(labels)
+        for potential_vertex_index in index.unindexed_vertices:
+            match_labels = vertices[potential_vertex_index].metadata.selector.match_labels  # type:ignore[union-attr]  # only vertices with metadata are added
+            if LabelSelectorEdgeBuilder._is_selected(labels, match_labels):  # type:ignore[arg-type]  # only vertices with match labels are added
+                connections.add(potential_vertex_index)
+
+        return sorted(
+            potential_vertex_index
+            for potential_vertex_index in connections
+            if vertices[potential_vertex_index].id != vertex.id
+        )
+
+    @staticmethod
+    def _is_selected(labels: dict[str, Any], match_labels: dict[str, Any]) -> bool:
+        if len(match_labels) > len(labels):
+            return False
+        # find shared label between the inspected vertex and the iterated potential vertex
+        shared_labels = [k for k in match_labels if k in labels and match_labels[k] == labels[k]]
+        # if all potential vertex's selector labels appear in vertex's labels - it's connected
+        return len(shared_labels) == len(match_labels)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LabelsIndex:
+    """
+    Inverted index, which maps a (label key, label value) pair to the indices of the vertices having it.
+
+    It replaces the comparison of the labels of a vertex with the labels of every other vertex
+    by looking up the vertices of the rarest label and only comparing those.
+    """
+
+    def __init__(self) -> None:
+        self.labels: dict[int, dict[str, Any]] = {}
+        self.postings: dict[tuple[str, Any], list[int]] = defaultdict(list)
+        # maps the rarest label of each vertex to the vertex, is built lazily after all vertices were added
+        self._anchors: dict[tuple[str, Any], list[int]] | None = None
+
+    def add(self, vertex_index: int, labels: dict[str, Any]) -> bool:
+        """Adds the labels of the vertex to the index
+
+        Returns False, if the labels can't be indexed, because of unhashable values.
+        """
+
+        if not is_indexable(labels):
+            return False
+
+        self.labels[vertex_index] = labels
+        for label in labels.items():
+            self.postings[label].append(vertex_index)
+        self._anchors = None
+        return True
+
+    def find_containing(self, labels: dict[str, Any]) -> set[int]:
+        """Returns the indices of the vertices, which have all the given labels"""
+
+        if not labels:
+            return set(self.labels)
+
+        candidates = min((self.postings.get(label, ()) for label in labels.items()), key=len)
+        return {
+            vertex_index
+            for vertex_index in candidates
+            if all(label in self.labels[vertex_index].items() for label in labels.items())
+        }
+
+    def find_contained(self, labels: dict[str, Any]) -> set[int]:
+        """Returns the indices of the vertices, which have all their labels in the given labels
+
+        Vertices without labels are not returned.
+        """
+
+        if self._anchors is None:
+            self._anchors = self._build_anchors()
+
+        vertex_indices: set[int] = set()
+        for label in labels.items():
+            for vertex_index in self._anchors.get(label, ()):
+                if all(vertex_label in labels.items() for vertex_label in self.labels[vertex_index].items()):
+                    vertex_indices.add(vertex_index)
+
+        return vertex_indices
+
+    def _build_anchors(self) -> dict[tuple[str, Any], list[int]]:
+        anchors: dict[tuple[str, Any], list[int]] = defaultdict(list)
+        for vertex_index, labels in self.labels.items():
+            if labels:
+                anchor = min(labels.items(), key=lambda label: len(self.postings[label]))
+                anchors[anchor].append(vertex_index)
+
+        return dict(anchors)
+
+
+def is_indexable(labels: Any) -> bool:
+    return isinstance(labels, dict) and all(isinstance(value, Hashable) for value in labels.values())
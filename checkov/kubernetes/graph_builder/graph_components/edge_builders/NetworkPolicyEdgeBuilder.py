@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
 from checkov.kubernetes.graph_builder.graph_components.edge_builders.K8SEdgeBuilder import K8SEdgeBuilder
+from checkov.kubernetes.graph_builder.graph_components.edge_builders.LabelsIndex import LabelsIndex, is_indexable
 from checkov.kubernetes.graph_builder.graph_components.blocks import KubernetesBlock
 from checkov.kubernetes.kubernetes_utils import remove_metadata_from_attribute
 
 
+@dataclass
+class PodLabelsIndex:
+    pod_labels: LabelsIndex = field(default_factory=LabelsIndex)
+    # pods without labels are matched by every network policy
+    unlabeled_pods: list[int] = field(default_factory=list)
+    # pods with labels, which can't be indexed and are compared one by one
+    unindexed_pods: list[int] = field(default_factory=list)
+
+
 class NetworkPolicyEdgeBuilder(K8SEdgeBuilder):
 
     @staticmethod
@@ -44,15 +57,61 @@ class NetworkPolicyEdgeBuilder(K8SEdgeBuilder):
 
             # the network policy has specific pod labels
             if match_labels and pod.metadata is not None and pod.metadata.labels is not None:
-                pod_labels = pod.metadata.labels
-                if len(match_labels) > len(pod_labels):
-                    continue
-                # find shared label between the inspected vertex and the iterated potential vertex
-                shared_labels = [k for k in match_labels if k in pod_labels and match_labels[k] == pod_labels[k]]
-                if len(shared_labels) == len(match_labels):
+                if NetworkPolicyEdgeBuilder._is_selected(pod.metadata.labels, match_labels):
                     connections.append(potential_pod_index)
             # the network policy has a podSelector property with no labels and should apply for all pods
             else:
                 connections.append(potential_pod_index)
 
         return connections
+
+    @staticmethod
+    def create_index(vertices: list[KubernetesBlock]) -> PodLabelsIndex:
+        index = PodLabelsIndex()
+        for vertex_index, vertex in enumerate(vertices):
+            if vertex.attributes.get("kind") != "Pod":
+                continue
+
+            if vertex.metadata is None or vertex.metadata.labels is None:
+                index.unlabeled_pods.append(vertex_index)
+            elif not index.pod_labels.add(vertex_index, vertex.metadata.labels):
+                index.unindexed_pods.append(vertex_index)
+
+        return index
+
+    @staticmethod
+    def find_indexed_connections(
+        vertex: KubernetesBlock, vertices: list[KubernetesBlock], index: PodLabelsIndex
+    ) -> list[int]:
+        pod_selector = vertex.attributes.get("spec", {}).get("podSelector")
+        if not pod_selector:
+            return []
+        match_labels = pod_selector.get("matchLabels")
+        remove_metadata_from_attribute(match_labels)
+
+        if not match_labels:
+            # the network policy has a podSelector property with no labels and should apply for all pods
+            connections = {*index.pod_labels.labels, *index.unlabeled_pods, *index.unindexed_pods}
+        elif not is_indexable(match_labels):
+            return NetworkPolicyEdgeBuilder.find_connections(vertex, vertices)
+        else:
+            connections = index.pod_labels.find_containing(match_labels)
+            connections.update(index.unlabeled_pods)
+            for potential_pod_index in index.unindexed_pods:
+                pod_labels = vertices[potential_pod_index].metadata.labels  # type:ignore[union-attr]  # only pods with metadata are added
+                if NetworkPolicyEdgeBuilder._is_selected(pod_labels, match_labels):
+                    connections.add(potential_pod_index)
+
+        return sorted(
+            potential_pod_index
+            for potential_pod_index in connections
+            if vertices[potential_pod_index].id != vertex.id
+        )
+
+    @staticmethod
+    def _is_selected(pod_labels: dict[str, Any], match_labels: dict[str, Any]) -> bool:
+        if len(match_labels) > len(pod_labels):
+            return False
+        # find shared label between the inspected vertex and the iterated potential vertex
+        shared_labels = [k for k in match_labels if k in pod_labels and match_labels[k] == pod_labels[k]]
+        return len(shared_labels) == len(match_labels)
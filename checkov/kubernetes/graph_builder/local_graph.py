@@ -84,10 +84,12 @@ class KubernetesLocalGraph(LocalGraph[KubernetesBlock]):
 
     def _create_edges(self) -> None:
         edges_to_create = defaultdict(list)
+        # the indices are built once, instead of comparing every vertex with all other vertices
+        edge_builders_indices = [edge_builder.create_index(self.vertices) for edge_builder in self.edge_builders]
         for vertex_index, vertex in enumerate(self.vertices):
-            for edge_builder in self.edge_builders:
+            for edge_builder, index in zip(self.edge_builders, edge_builders_indices):
                 if edge_builder.should_search_for_edges(vertex):
-                    current_vertex_connections = edge_builder.find_connections(vertex, self.vertices)
+                    current_vertex_connections = edge_builder.find_indexed_connections(vertex, self.vertices, index)
                     if current_vertex_connections:
                         edges_to_create[vertex.name].extend(current_vertex_connections)
             for destination_vertex_index in edges_to_create[vertex.name]:
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 from checkov.common.bridgecrew.check_type import CheckType
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.common.util.suppression_index import SuppressionIndex
 
 
 @dataclass
@@ -22,11 +23,9 @@ class ServerlessRegistry(BaseCheckRegistry):
         entity_type, entity_configuration = self.extract_entity_details(entity)
         results = {}
         checks = self.get_checks(entity_type)
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info = {}
-            if skipped_checks:
-                if check.id in [x['id'] for x in skipped_checks]:
-                    skip_info = [x for x in skipped_checks if x['id'] == check.id][0]
+            skip_info = suppressions.get(check.id)
 
             if runner_filter.should_run_check(check, report_type=CheckType.SERVERLESS):
                 self.logger.debug("Running check: {} on file {}".format(check.name, scanned_file))
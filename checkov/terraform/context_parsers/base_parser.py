@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from itertools import islice
 from pathlib import Path
@@ -10,10 +10,11 @@ from typing import List, Dict, Any, Tuple
 
 import dpath.util
 
-from checkov.common.bridgecrew.integration_features.features.policy_metadata_integration import integration as metadata_integration
-from checkov.common.comment.enum import COMMENT_REGEX
 from checkov.common.models.enums import ContextCategories
+from checkov.common.typing import _SkippedCheck
 from checkov.common.util.parser_utils import get_abs_path
+from checkov.common.util.source_file_store import CodeBlockReference, source_file_store
+from checkov.common.util.suppression import collect_suppressions_for_file
 from checkov.terraform.context_parsers.registry import parser_registry
 
 OPEN_CURLY = "{"
@@ -21,6 +22,8 @@ CLOSE_CURLY = "}"
 
 
 class BaseContextParser(ABC):
+    _file_lines: list[tuple[int, str]] | None = None  # noqa: CCE003  # subclasses may not call __init__
+
     def __init__(self, definition_type: str) -> None:
         # bc_integration.setup_http_manager()
         self.logger = logging.getLogger("{}".format(self.__module__))
@@ -30,13 +33,24 @@ class BaseContextParser(ABC):
         self.definition_type = definition_type
         self.tf_file = ""
         self.tf_file_path: Path | None = None
-        self.file_lines: list[tuple[int, str]] = []
         self.filtered_lines: list[tuple[int, str]] = []
         self.filtered_line_numbers: list[int] = []
         self.context: dict[str, Any] = defaultdict(dict)
 
         parser_registry.register(self)
 
+    @property
+    def file_lines(self) -> list[tuple[int, str]]:
+        """The lines of the current file, which are only read, if a parser needs them"""
+
+        if self._file_lines is None:
+            self._file_lines = self._read_file_lines()
+        return self._file_lines
+
+    @file_lines.setter
+    def file_lines(self, file_lines: list[tuple[int, str]] | None) -> None:
+        self._file_lines = file_lines
+
     @abstractmethod
     def get_entity_context_path(self, entity_block: Dict[str, Dict[str, Any]]) -> List[str]:
         """
@@ -76,38 +90,34 @@ class BaseContextParser(ABC):
         return self.filtered_lines
 
     def _read_file_lines(self) -> List[Tuple[int, str]]:
-        with open(self.tf_file, "r") as file:
-            file.seek(0)
-            file_lines = [(ind + 1, line) for ind, line in enumerate(file.readlines())]
-            return file_lines
+        return source_file_store.get_file_lines(self.tf_file)
+
+    def _get_code_lines(self, start_line: int, end_line: int) -> CodeBlockReference:
+        """References the entity's code lines, which are sliced from the shared source file store on access"""
+
+        return CodeBlockReference(self.tf_file, start_line, end_line)
 
     @staticmethod
     def is_optional_comment_line(line: str) -> bool:
         line_without_whitespace = line.replace(" ", "")
         return "checkov:skip=" in line_without_whitespace or "bridgecrew:skip=" in line_without_whitespace
 
-    def _collect_skip_comments(self, definition_blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _collect_skip_comments(
+            self,
+            definition_blocks: List[Dict[str, Any]],
+            skip_comments: list[tuple[int, _SkippedCheck]] | None = None,
+    ) -> Dict[str, Any]:
         """
         Collects checkov skip comments to all definition blocks
         :param definition_blocks: parsed definition blocks
+        :param skip_comments: the skip comments of the whole file sorted by their line number, searched if not given
         :return: context enriched with with skipped checks per skipped entity
         """
-        bc_id_mapping = metadata_integration.bc_to_ckv_id_mapping
-        comments = [
-            (
-                line_num,
-                {
-                    "id": match.group(2),
-                    "suppress_comment": match.group(3)[1:] if match.group(3) else "No comment provided",
-                },
-            )
-            for (line_num, x) in self.file_lines
-            if self.is_optional_comment_line(x)
-            for match in [re.search(COMMENT_REGEX, x)]
-            if match
-        ]
+        if skip_comments is None:
+            skip_comments = collect_suppressions_for_file(source_file_store.get_file_text(self.tf_file))
+        comment_line_nums = [line_num for line_num, _ in skip_comments]
+
         for entity_block in definition_blocks:
-            skipped_checks = []
             entity_context_path = self.get_entity_context_path(entity_block)
             entity_context = self.context
             found = True
@@ -120,16 +130,12 @@ class BaseContextParser(ABC):
                     break
             if not found:
                 continue
-            for (skip_check_line_num, skip_check) in comments:
-                if "start_line" in entity_context and "end_line" in entity_context \
-                        and entity_context["start_line"] < skip_check_line_num < entity_context["end_line"]:
-                    # No matter which ID was used to skip, save the pair of IDs in the appropriate fields
-                    if bc_id_mapping and skip_check["id"] in bc_id_mapping:
-                        skip_check["bc_id"] = skip_check["id"]
-                        skip_check["id"] = bc_id_mapping[skip_check["id"]]
-                    elif metadata_integration.check_metadata:
-                        skip_check["bc_id"] = metadata_integration.get_bc_id(skip_check["id"])
-                    skipped_checks.append(skip_check)
+            skipped_checks = []
+            if "start_line" in entity_context and "end_line" in entity_context:
+                # only the comments strictly inside the block belong to it
+                first_idx = bisect_right(comment_line_nums, entity_context["start_line"])
+                last_idx = bisect_left(comment_line_nums, entity_context["end_line"])
+                skipped_checks = [skip_check for _, skip_check in skip_comments[first_idx:last_idx]]
             dpath.new(self.context, entity_context_path + ["skipped_checks"], skipped_checks)
         return self.context
 
@@ -153,17 +159,26 @@ class BaseContextParser(ABC):
         return end_line_num
 
     def run(
-            self, tf_file: str, definition_blocks: List[Dict[str, Any]], collect_skip_comments: bool = True
+            self,
+            tf_file: str,
+            definition_blocks: List[Dict[str, Any]],
+            collect_skip_comments: bool = True,
+            skip_comments: list[tuple[int, _SkippedCheck]] | None = None,
     ) -> Dict[str, Any]:
         # TF files for loaded modules have this formation:  <file>[<referrer>#<index>]
         # Chop off everything after the file name for our purposes here
         self.tf_file = get_abs_path(tf_file)
         self.tf_file_path = Path(self.tf_file)
         self.context = defaultdict(dict)
-        self.file_lines = self._read_file_lines()
+        self.file_lines = None
         self.context = self.enrich_definition_block(definition_blocks)
         if collect_skip_comments:
-            self.context = self._collect_skip_comments(definition_blocks)
+            self.context = self._collect_skip_comments(definition_blocks, skip_comments)
+
+        # the code lines of the entities are referenced, therefore the file lines are not needed anymore
+        self.file_lines = None
+        self.filtered_lines = []
+        self.filtered_line_numbers = []
         return self.context
 
     def get_block_type(self) -> str:
@@ -23,7 +23,7 @@ class DataContextParser(BaseContextParser):
             self.context[entity_type][entity_name] = {
                 "start_line": entity_config[START_LINE],
                 "end_line": entity_config[END_LINE],
-                "code_lines": self.file_lines[entity_config[START_LINE] - 1: entity_config[END_LINE]],
+                "code_lines": self._get_code_lines(entity_config[START_LINE], entity_config[END_LINE]),
             }
 
         return self.context
@@ -30,7 +30,7 @@ class LocalsContextParser(BaseContextParser):
             if END_LINE in entity_block.keys():
                 self.context["end_line"] = entity_block[END_LINE]
             if "start_line" in self.context and "end_line" in self.context:
-                self.context["code_lines"] = self.file_lines[self.context["start_line"] - 1: self.context["end_line"]]
+                self.context["code_lines"] = self._get_code_lines(self.context["start_line"], self.context["end_line"])
 
             if isinstance(entity_block, dict):
                 self._collect_local_values(entity_block)
@@ -1,11 +1,20 @@
+from __future__ import annotations
+
 import logging
+import platform
 from typing import Dict, TYPE_CHECKING, Tuple, List, Any
 
-import dpath.util
+from checkov.common.parallelizer.parallel_runner import parallel_runner
+from checkov.common.util.parser_utils import get_abs_path
+from checkov.common.util.source_file_store import source_file_store
+from checkov.common.util.suppression import collect_suppressions_for_file
 
 if TYPE_CHECKING:
     from checkov.terraform.context_parsers.base_parser import BaseContextParser
 
+# building the context of a file is cheap, forking processes pays off only for many files
+PARALLEL_CONTEXT_MIN_FILES = 200
+
 
 class ParserRegistry:
     context_parsers: Dict[str, "BaseContextParser"] = {}  # noqa: CCE003
@@ -23,20 +32,71 @@ class ParserRegistry:
     def enrich_definitions_context(
         self, definitions: Tuple[str, Dict[str, List[Dict[str, Any]]]], collect_skip_comments: bool = True
     ) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        supported_definitions = [parser_type for parser_type in self.context_parsers.keys()]
         (tf_file, definition_blocks_types) = definitions
-        if definition_blocks_types:
-            definition_blocks_types = {x: definition_blocks_types[x] for x in definition_blocks_types.keys()}
-            for definition_type in definition_blocks_types.keys():
-                if definition_type in supported_definitions:
-                    dpath.new(self.definitions_context, [tf_file, definition_type], {})
-                    context_parser = self.context_parsers[definition_type]
-                    definition_blocks = definition_blocks_types[definition_type]
-                    self.definitions_context[tf_file][definition_type] = context_parser.run(
-                        tf_file, definition_blocks, collect_skip_comments
-                    )
+        file_context = self.build_file_context(tf_file, definition_blocks_types, collect_skip_comments)
+        if file_context:
+            self.definitions_context.setdefault(tf_file, {}).update(file_context)
 
         return self.definitions_context
 
+    def enrich_definitions_contexts(
+        self, definitions: Dict[str, Dict[str, List[Dict[str, Any]]]], collect_skip_comments: bool = True
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Enriches the context of all files, which are split between multiple processes for bigger repositories"""
+
+        if (
+            len(definitions) < PARALLEL_CONTEXT_MIN_FILES
+            or parallel_runner.workers_number < 2
+            or platform.system() == "Windows"  # the context parsers keep state and can't be run in threads
+        ):
+            for definition in definitions.items():
+                self.enrich_definitions_context(definition, collect_skip_comments)
+            return self.definitions_context
+
+        def build_file_context(
+            definition: Tuple[str, Dict[str, List[Dict[str, Any]]]]
+        ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+            return definition[0], self.build_file_context(definition[0], definition[1], collect_skip_comments)
+
+        results = parallel_runner.run_function(build_file_context, list(definitions.items()), run_multiprocess=True)
+        for result in results:
+            if result is None:
+                # the failure was already logged by the worker
+                continue
+            tf_file, file_context = result
+            if file_context:
+                self.definitions_context.setdefault(tf_file, {}).update(file_context)
+
+        return self.definitions_context
+
+    def build_file_context(
+        self,
+        tf_file: str,
+        definition_blocks_types: Dict[str, List[Dict[str, Any]]],
+        collect_skip_comments: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Builds the context of all block types of a file
+
+        The file is read and searched for skip comments only once, the block lines are taken from the definitions.
+        """
+
+        file_context: Dict[str, Dict[str, Any]] = {}
+        if not definition_blocks_types:
+            return file_context
+
+        skip_comments = None
+        for definition_type, definition_blocks in definition_blocks_types.items():
+            context_parser = self.context_parsers.get(definition_type)
+            if not context_parser:
+                continue
+
+            if collect_skip_comments and skip_comments is None:
+                skip_comments = collect_suppressions_for_file(source_file_store.get_file_text(get_abs_path(tf_file)))
+            file_context[definition_type] = context_parser.run(
+                tf_file, definition_blocks, collect_skip_comments, skip_comments
+            )
+
+        return file_context
+
 
 parser_registry = ParserRegistry()
@@ -23,6 +23,9 @@ class TerraformBlock(Block):
         "dynamic_attributes",
     )
 
+    # the config is copied by the Module and updated copy-on-write by TerraformLocalGraph.update_vertex_config()
+    copy_config_on_init = False  # noqa: CCE003  # a static attribute
+
     def __init__(self, name: str, config: Dict[str, Any], path: str, block_type: BlockType, attributes: Dict[str, Any],
                  id: str = "", source: str = "", has_dynamic_block: bool = False, dynamic_attributes: dict[str, Any] | None = None,) -> None:
         """
@@ -90,7 +90,7 @@ class Module:
                 provider_block = TerraformBlock(
                     block_type=BlockType.PROVIDER,
                     name=provider_name,
-                    config=provider_dict,
+                    config=deepcopy(provider_dict),
                     path=path,
                     attributes=attributes,
                     source=self.source,
@@ -104,7 +104,7 @@ class Module:
                 variable_block = TerraformBlock(
                     block_type=BlockType.VARIABLE,
                     name=name,
-                    config=variable_dict,
+                    config=deepcopy(variable_dict),
                     path=path,
                     attributes=attributes,
                     source=self.source,
@@ -117,7 +117,7 @@ class Module:
                 local_block = TerraformBlock(
                     block_type=BlockType.LOCALS,
                     name=name,
-                    config={name: blocks_section[name]},
+                    config=deepcopy({name: blocks_section[name]}),
                     path=path,
                     attributes={name: blocks_section[name]},
                     source=self.source,
@@ -132,7 +132,7 @@ class Module:
                 output_block = TerraformBlock(
                     block_type=BlockType.OUTPUT,
                     name=name,
-                    config=output_dict,
+                    config=deepcopy(output_dict),
                     path=path,
                     attributes={"value": output_dict[name].get("value")},
                     source=self.source,
@@ -146,7 +146,7 @@ class Module:
                     module_block = TerraformBlock(
                         block_type=BlockType.MODULE,
                         name=name,
-                        config=module_dict,
+                        config=deepcopy(module_dict),
                         path=path,
                         attributes=attributes,
                         source=self.source,
@@ -165,9 +165,9 @@ class Module:
                     if self.render_dynamic_blocks_env_var.lower() == 'false':
                         has_dynamic_block = False
                     else:
-                        old_attributes = deepcopy(attributes)
+                        old_attribute_keys = set(attributes)
                         has_dynamic_block = handle_dynamic_values(attributes)
-                        dynamic_attributes = {k: attributes[k] for k in set(attributes) - set(old_attributes)}
+                        dynamic_attributes = {k: attributes[k] for k in set(attributes) - old_attribute_keys}
                     provisioner = attributes.get("provisioner")
                     if provisioner:
                         self._handle_provisioner(provisioner, attributes)
@@ -191,7 +191,7 @@ class Module:
         try:
             return json.loads(json.dumps(resource_conf).replace("\\\\", "\\"))
         except json.JSONDecodeError:
-            return resource_conf
+            return deepcopy(resource_conf)
 
     def _add_data(self, blocks: List[Dict[str, Dict[str, Any]]], path: str) -> None:
         for data_dict in blocks:
@@ -201,7 +201,7 @@ class Module:
                     data_block = TerraformBlock(
                         block_type=BlockType.DATA,
                         name=block_name,
-                        config=data_dict,
+                        config=deepcopy(data_dict),
                         path=path,
                         attributes=data_dict.get(data_type, {}).get(name, {}),
                         id=block_name,
@@ -214,7 +214,7 @@ class Module:
             terraform_block = TerraformBlock(
                 block_type=BlockType.TERRAFORM,
                 name="",
-                config=terraform_dict,
+                config=deepcopy(terraform_dict),
                 path=path,
                 attributes=terraform_dict,
                 source=self.source,
@@ -226,7 +226,7 @@ class Module:
             tfvar_block = TerraformBlock(
                 block_type=BlockType.TF_VARIABLE,
                 name=tf_var_name,
-                config={tf_var_name: attributes},
+                config=deepcopy({tf_var_name: attributes}),
                 path=path,
                 attributes=attributes,
                 source=self.source,
@@ -3,7 +3,6 @@ from __future__ import annotations
 import logging
 import os
 from collections import defaultdict
-from copy import deepcopy
 from pathlib import Path
 from typing import List, Optional, Union, Any, Dict, Set, Tuple
 
@@ -29,7 +28,9 @@ from checkov.terraform.graph_builder.utils import (
     attribute_has_nested_attributes, remove_index_pattern_from_str,
 )
 from checkov.terraform.graph_builder.utils import is_local_path
+from checkov.terraform.graph_builder.variable_rendering.evaluate_terraform import get_evaluation_cache_stats
 from checkov.terraform.graph_builder.variable_rendering.renderer import TerraformVariableRenderer
+from checkov.terraform.graph_builder.vertex_lookup import TerraformVertexLookup
 
 
 MODULE_RESERVED_ATTRIBUTES = ("source", "version")
@@ -55,6 +56,7 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
         self.vertices_by_module_dependency: Dict[Tuple[str, str], Dict[BlockType, List[int]]] = defaultdict(lambda: defaultdict(list))
         self.enable_foreach_handling = strtobool(os.getenv('CHECKOV_ENABLE_FOREACH_HANDLING', 'False'))
         self.foreach_blocks: Dict[str, List[int]] = {BlockType.RESOURCE: [], BlockType.MODULE: []}
+        self.vertex_lookup: Optional[TerraformVertexLookup] = None
 
     def build_graph(self, render_variables: bool) -> None:
         self._create_vertices()
@@ -74,6 +76,7 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
             logging.info(f"Rendering variables, graph has {len(self.vertices)} vertices and {len(self.edges)} edges")
             renderer = TerraformVariableRenderer(self)
             renderer.render_variables_from_local_graph()
+            logging.debug(f"Terraform evaluation cache stats: {get_evaluation_cache_stats()}")
             self.update_vertices_breadcrumbs_and_module_connections()
             self.update_nested_modules_address()
             if strtobool(os.getenv("CHECKOV_EXPERIMENTAL_CROSS_VARIABLE_EDGES", "True")):
@@ -86,6 +89,7 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
     def _create_vertices(self) -> None:
         logging.info("Creating vertices")
         self.vertices: List[TerraformBlock] = [None] * len(self.module.blocks)
+        self.vertex_lookup = None
         for i, block in enumerate(self.module.blocks):
             self.vertices[i] = block
 
@@ -395,33 +399,12 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
     def _find_vertex_index_relative_to_path(
         self, block_type: BlockType, name: str, block_path: str, module_path: str, module_num: str, relative_module_idx: Optional[int] = None
     ) -> int:
-        relative_vertices = []
-        if relative_module_idx is not None:
-            module_dependency_by_name_key = next(k for k, v in self.vertices_by_module_dependency.items() if v.get(BlockType.MODULE, []).__contains__(relative_module_idx))
-        else:
-            module_dependency_by_name_key = (module_path, module_num)
-        possible_vertices = self.vertices_by_module_dependency_by_name.get(module_dependency_by_name_key, {}).get(block_type, {}).get(name, [])
-        for vertex_index in possible_vertices:
-            vertex = self.vertices[vertex_index]
-            if self.get_dirname(vertex.path) == self.get_dirname(block_path):
-                relative_vertices.append(vertex_index)
-
-        if len(relative_vertices) == 1:
-            relative_vertex = relative_vertices[0]
-        else:
-            relative_vertex = self._find_vertex_with_longest_path_match(relative_vertices, block_path)
-        return relative_vertex
-
-    def _find_vertex_with_longest_path_match(self, relevant_vertices_indexes: List[int], origin_path: str) -> int:
-        vertex_index_with_longest_common_prefix = -1
-        longest_common_prefix = ""
-        for vertex_index in relevant_vertices_indexes:
-            vertex = self.vertices[vertex_index]
-            common_prefix = os.path.commonpath([os.path.realpath(vertex.path), os.path.realpath(origin_path)])
-            if len(common_prefix) > len(longest_common_prefix):
-                vertex_index_with_longest_common_prefix = vertex_index
-                longest_common_prefix = common_prefix
-        return vertex_index_with_longest_common_prefix
+        if self.vertex_lookup is None:
+            # the vertices don't change after their creation, therefore the lookup is only built once
+            self.vertex_lookup = TerraformVertexLookup(self)
+        return self.vertex_lookup.find_vertex_index(
+            block_type, name, block_path, module_path, module_num, relative_module_idx
+        )
 
     def get_vertices_hash_codes_to_attributes_map(self) -> Dict[str, Dict[str, Any]]:
         return {vertex.get_hash(): vertex.get_attribute_dict() for vertex in self.vertices}
@@ -468,7 +451,8 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
             # skip, if there is no change
             return
 
-        updated_config = deepcopy(vertex.config)
+        # the config is shared with the definitions and other vertices, therefore it is only updated copy-on-write
+        updated_config = vertex.config
         if vertex.block_type != BlockType.LOCALS:
             parts = vertex.name.split(".")
             start = 0
@@ -489,7 +473,7 @@ class TerraformLocalGraph(LocalGraph[TerraformBlock]):
         if len(changed_attributes) > 0:
             if vertex.block_type == BlockType.LOCALS:
                 updated_config = updated_config.get(vertex.name)
-            update_dictionary_attribute(vertex.config, vertex.name, updated_config, dynamic_blocks)
+            vertex.config = update_dictionary_attribute(vertex.config, vertex.name, updated_config, dynamic_blocks)  # type:ignore[assignment]
 
     def get_resources_types_in_graph(self) -> List[str]:
         return self.module.get_resources_types()
@@ -586,6 +570,12 @@ def to_list(data):
 def update_dictionary_attribute(
         config: Union[List[Any], Dict[str, Any]], key_to_update: str, new_value: Any, dynamic_blocks: bool = False
 ) -> Union[List[Any], Dict[str, Any]]:
+    """Returns the config with the updated attribute
+
+    The given config is not modified, only the dicts and lists on the path to the updated attribute are copied,
+    everything else is shared with the given config.
+    """
+
     key_parts = key_to_update.split(".")
 
     if isinstance(config, dict) and isinstance(key_parts, list):
@@ -596,13 +586,16 @@ def update_dictionary_attribute(
             if len(key_parts) == 1:
                 if isinstance(inner_config, list) and not isinstance(new_value, list):
                     new_value = [new_value]
-                config[key] = to_list(new_value) if dynamic_blocks else new_value
-                return config
+                return {**config, key: to_list(new_value) if dynamic_blocks else new_value}
             else:
-                config[key] = update_dictionary_attribute(inner_config, ".".join(key_parts[1:]), new_value, dynamic_blocks=dynamic_blocks)
+                updated_inner_config = update_dictionary_attribute(inner_config, ".".join(key_parts[1:]), new_value, dynamic_blocks=dynamic_blocks)
+                return _copy_with_item(config, key, updated_inner_config)
         else:
-            for key in config:
-                config[key] = update_dictionary_attribute(config[key], key_to_update, new_value, dynamic_blocks=dynamic_blocks)
+            updated_config = config
+            for key, inner_config in config.items():
+                updated_inner_config = update_dictionary_attribute(inner_config, key_to_update, new_value, dynamic_blocks=dynamic_blocks)
+                updated_config = _copy_with_item(updated_config, key, updated_inner_config, original=config)
+            return updated_config
     if isinstance(config, list):
         return update_list_attribute(
             config=config,
@@ -617,7 +610,7 @@ def update_dictionary_attribute(
 def update_list_attribute(
     config: list[Any], key_parts: list[str], key_to_update: str, new_value: Any, dynamic_blocks: bool = False
 ) -> list[Any] | dict[str, Any]:
-    """Updates a list attribute in the given config"""
+    """Returns the config with the updated list attribute, without modifying the given config"""
 
     if not config:
         # happens when we can't correctly evaluate something, because of strange defaults or 'for_each' blocks
@@ -632,16 +625,32 @@ def update_list_attribute(
                 # happens when config = [[]]
                 return config
 
-            inner_config[idx] = new_value
-            return config
+            updated_inner_config = inner_config.copy()
+            updated_inner_config[idx] = new_value
+            return [updated_inner_config, *config[1:]]
     entry_to_update = int(key_parts[0]) if key_parts[0].isnumeric() else -1
+    updated_config = config
     for i, config_value in enumerate(config):
         if entry_to_update == -1:
-            config[i] = update_dictionary_attribute(config=config_value, key_to_update=key_to_update, new_value=new_value, dynamic_blocks=dynamic_blocks)
+            updated_config_value = update_dictionary_attribute(config=config_value, key_to_update=key_to_update, new_value=new_value, dynamic_blocks=dynamic_blocks)
         elif entry_to_update == i:
-            config[i] = update_dictionary_attribute(config=config_value, key_to_update=".".join(key_parts[1:]), new_value=new_value, dynamic_blocks=dynamic_blocks)
+            updated_config_value = update_dictionary_attribute(config=config_value, key_to_update=".".join(key_parts[1:]), new_value=new_value, dynamic_blocks=dynamic_blocks)
+        else:
+            continue
+        updated_config = _copy_with_item(updated_config, i, updated_config_value, original=config)
 
-    return config
+    return updated_config
+
+
+def _copy_with_item(container: Any, key: Any, value: Any, original: Any = None) -> Any:
+    """Sets the item in a copy of the container, unless the item didn't change or the container is already a copy"""
+
+    if container[key] is value:
+        return container
+    if original is None or container is original:
+        container = container.copy()
+    container[key] = value
+    return container
 
 
 def get_path_with_nested_modules(block: TerraformBlock) -> str:
@@ -1,11 +1,17 @@
 import logging
 import os
 import re
+from copy import deepcopy
 from typing import Any, Union, Optional, List, Dict, Callable, TypeVar, Tuple
 
+from checkov.common.util.bounded_cache import BoundedCache
 from checkov.common.util.type_forcers import force_int
 from checkov.common.util.parser_utils import find_var_blocks
-from checkov.terraform.graph_builder.variable_rendering.safe_eval_functions import evaluate
+from checkov.terraform.graph_builder.variable_rendering.hcl_expression_interpreter import UNEVALUATED, \
+    evaluate_terraform_expression
+from checkov.terraform.graph_builder.variable_rendering.hcl_expression_parser import parsed_expressions_cache
+from checkov.terraform.graph_builder.variable_rendering.safe_eval_functions import evaluate, \
+    compiled_expressions_cache
 
 T = TypeVar("T", str, int, bool)
 
@@ -14,6 +20,13 @@ DIRECTIVE_EXPR = re.compile(r"\%\{([^\}]*)\}")
 
 COMPARE_REGEX = re.compile(r"^(?P<a>.+?)\s*(?P<operator>==|!=|>=|>|<=|<|&&|\|\|)\s*(?P<b>.+)$")
 CHECKOV_RENDER_MAX_LEN = force_int(os.getenv("CHECKOV_RENDER_MAX_LEN", "10000"))
+EVALUATED_TERRAFORM_CACHE_MAX_SIZE = force_int(os.getenv("CHECKOV_EVALUATION_CACHE_MAX_SIZE", "16384")) or 0
+
+# the same interpolation strings are evaluated many times, especially in repositories with many module calls
+evaluated_terraform_cache: BoundedCache[Tuple[str, bool], Any] = BoundedCache(
+    max_size=EVALUATED_TERRAFORM_CACHE_MAX_SIZE
+)
+_NOT_CACHED = object()
 
 
 def evaluate_terraform(input_str: Any, keep_interpolations: bool = True) -> Any:
@@ -22,6 +35,43 @@ def evaluate_terraform(input_str: Any, keep_interpolations: bool = True) -> Any:
                       f'evaluated, please set the environment variable CHECKOV_RENDER_MAX_LEN '
                       f'to {str(len(input_str) + 1)} or to 0 to allow rendering of any length')
         return input_str
+
+    if type(input_str) is not str or not EVALUATED_TERRAFORM_CACHE_MAX_SIZE:
+        return _evaluate_terraform(input_str, keep_interpolations)
+
+    cache_key = (input_str, keep_interpolations)
+    evaluated_value = evaluated_terraform_cache.get(cache_key, _NOT_CACHED)
+    if evaluated_value is _NOT_CACHED:
+        evaluated_value = _evaluate_terraform(input_str, keep_interpolations)
+        evaluated_terraform_cache.put(cache_key, evaluated_value)
+
+    # the callers may change the evaluated value, therefore they get their own copy of mutable values
+    return deepcopy(evaluated_value) if isinstance(evaluated_value, (dict, list, set)) else evaluated_value
+
+
+def get_evaluation_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        "evaluated_terraform": evaluated_terraform_cache.get_stats(),
+        "compiled_expressions": compiled_expressions_cache.get_stats(),
+        "parsed_expressions": parsed_expressions_cache.get_stats(),
+    }
+
+
+def _evaluate_terraform(input_str: Any, keep_interpolations: bool) -> Any:
+    if isinstance(input_str, str):
+        # expressions, which only consist of values, are evaluated by the HCL expression interpreter,
+        # everything else (ex. unresolved references) is still handled by rewriting the string.
+        # string results of bare expressions are evaluated again, like the string rewriting does with them
+        evaluated_value = evaluate_terraform_expression(input_str)
+        if evaluated_value is not UNEVALUATED:
+            if not isinstance(evaluated_value, str) or "${" in input_str:
+                return evaluated_value
+            input_str = evaluated_value
+
+    return _evaluate_by_string_rewriting(input_str, keep_interpolations)
+
+
+def _evaluate_by_string_rewriting(input_str: Any, keep_interpolations: bool) -> Any:
     evaluated_value = _try_evaluate(input_str)
     if type(evaluated_value) is not str:
         return input_str if callable(evaluated_value) else evaluated_value
@@ -72,6 +122,8 @@ def replace_string_value(original_str: Any, str_to_replace: str, replaced_value:
         return original_str
 
     if type(original_str) is list:
+        # the list may be shared with the attributes of the vertex, therefore only a copy of it is updated
+        original_str = original_str.copy()
         for i, item in enumerate(original_str):
             original_str[i] = replace_string_value(item, str_to_replace, replaced_value, keep_origin)
             if type(replaced_value) in [int, float, bool]:
@@ -0,0 +1,357 @@
+"""
+A tree-walking interpreter for the Terraform expressions parsed by hcl_expression_parser.py.
+
+The values are represented by plain Python types (str, int, float, bool, None, list and dict) and the functions
+are the ones of SAFE_EVAL_DICT. Everything, which can't be evaluated like Terraform does, raises a
+HclEvaluationError instead of guessing, so the callers can fall back to another evaluation.
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type, Union
+
+from checkov.terraform.graph_builder.variable_rendering.hcl_expression_parser import (
+    BinaryOperation,
+    Conditional,
+    ForExpression,
+    FunctionCall,
+    GetAttr,
+    HclParseError,
+    Index,
+    Literal,
+    Node,
+    ObjectConstructor,
+    Splat,
+    SplatItem,
+    Template,
+    TemplateFor,
+    TemplateIf,
+    TupleConstructor,
+    UnaryOperation,
+    Variable,
+    parse_hcl_expression,
+)
+from checkov.terraform.graph_builder.variable_rendering.safe_eval_functions import SAFE_EVAL_DICT
+from checkov.terraform.parser_functions import FUNCTION_FAILED
+
+NUMERIC_STRING_PATTERN = re.compile(r"-?\d+(\.\d+)?([eE][+-]?\d+)?")
+# node types, which compute a value, all others only construct one from their literal parts
+COMPUTED_NODE_TYPES = (
+    BinaryOperation, UnaryOperation, Conditional, FunctionCall, Index, GetAttr, Splat, ForExpression, TemplateIf,
+    TemplateFor,
+)
+
+# the scope maps the names of the for-expression symbols to their values and SplatItem to the current splat item
+Scope = Dict[Union[str, Type[SplatItem]], Any]
+
+
+class HclEvaluationError(Exception):
+    pass
+
+
+class Unevaluated:
+    """The result of an expression, which couldn't be evaluated"""
+
+
+UNEVALUATED = Unevaluated()
+
+
+def evaluate_terraform_expression(source: str) -> Any:
+    """Evaluates an expression or bare template, like "${var.a}-b", which only consists of values
+
+    Returns UNEVALUATED, if the source can't be parsed, has unresolved references or doesn't compute anything,
+    like a single literal.
+    """
+
+    try:
+        try:
+            node = parse_hcl_expression(source)
+        except HclParseError:
+            if "${" not in source and "%{" not in source:
+                return UNEVALUATED
+            node = parse_hcl_expression(source, bare_template=True)
+
+        if not is_computed_expression(node):
+            return UNEVALUATED
+        return evaluate_node(node, {})
+    except (HclParseError, HclEvaluationError, RecursionError):
+        return UNEVALUATED
+
+
+def is_computed_expression(node: Node) -> bool:
+    if isinstance(node, COMPUTED_NODE_TYPES):
+        return True
+    if isinstance(node, Template):
+        return any(not isinstance(part, str) for part in node.parts)
+    if isinstance(node, TupleConstructor):
+        return any(is_computed_expression(item) for item in node.items)
+    if isinstance(node, ObjectConstructor):
+        return any(is_computed_expression(key) or is_computed_expression(value) for key, value in node.items)
+    return False
+
+
+def evaluate_node(node: Node, scope: Scope) -> Any:
+    if isinstance(node, str):
+        return node
+    evaluator = _EVALUATORS.get(type(node))
+    if evaluator is None:
+        raise HclEvaluationError(f"Unsupported expression {node}")
+    return evaluator(node, scope)
+
+
+def _evaluate_literal(node: Literal, scope: Scope) -> Any:
+    return node.value
+
+
+def _evaluate_template(node: Template, scope: Scope) -> Any:
+    if len(node.parts) == 1 and not isinstance(node.parts[0], str):
+        # a template with a single interpolation results in the value itself
+        return evaluate_node(node.parts[0], scope)
+    return "".join(to_string(evaluate_node(part, scope)) for part in node.parts)
+
+
+def _evaluate_template_if(node: TemplateIf, scope: Scope) -> str:
+    template = node.true_template if to_bool(evaluate_node(node.condition, scope)) else node.false_template
+    return "".join(to_string(evaluate_node(part, scope)) for part in template.parts)
+
+
+def _evaluate_template_for(node: TemplateFor, scope: Scope) -> str:
+    result = []
+    for key, value in _iterate_collection(evaluate_node(node.collection, scope)):
+        item_scope = _create_item_scope(scope, node.key_name, key, node.value_name, value)
+        result.extend(to_string(evaluate_node(part, item_scope)) for part in node.template.parts)
+    return "".join(result)
+
+
+def _evaluate_variable(node: Variable, scope: Scope) -> Any:
+    if node.name not in scope:
+        raise HclEvaluationError(f"Unresolved reference {node.name}")
+    return scope[node.name]
+
+
+def _evaluate_tuple(node: TupleConstructor, scope: Scope) -> List[Any]:
+    return [evaluate_node(item, scope) for item in node.items]
+
+
+def _evaluate_object(node: ObjectConstructor, scope: Scope) -> Dict[str, Any]:
+    return {to_string(evaluate_node(key, scope)): evaluate_node(value, scope) for key, value in node.items}
+
+
+def _evaluate_function_call(node: FunctionCall, scope: Scope) -> Any:
+    function = SAFE_EVAL_DICT.get(node.name)
+    if function is None:
+        raise HclEvaluationError(f"Unsupported function {node.name}")
+
+    args = [evaluate_node(arg, scope) for arg in node.args]
+    if node.expand_final_arg:
+        if not args or not isinstance(args[-1], list):
+            raise HclEvaluationError(f"Can't expand the final argument of {node.name}")
+        args.extend(args.pop())
+
+    try:
+        result = function(*args)
+    except Exception as e:
+        raise HclEvaluationError(f"Failed to call {node.name}") from e
+    if callable(result) or (isinstance(result, str) and result == FUNCTION_FAILED):
+        raise HclEvaluationError(f"Failed to call {node.name}")
+    return result
+
+
+def _evaluate_index(node: Index, scope: Scope) -> Any:
+    return _get_index(evaluate_node(node.collection, scope), evaluate_node(node.key, scope))
+
+
+def _evaluate_get_attr(node: GetAttr, scope: Scope) -> Any:
+    obj = evaluate_node(node.obj, scope)
+    if not isinstance(obj, dict) or node.name not in obj:
+        raise HclEvaluationError(f"Unsupported attribute {node.name}")
+    return obj[node.name]
+
+
+def _evaluate_splat(node: Splat, scope: Scope) -> List[Any]:
+    source = evaluate_node(node.source, scope)
+    if source is None:
+        return []
+    items = source if isinstance(source, list) else [source]
+    return [evaluate_node(node.each, {**scope, SplatItem: item}) for item in items]
+
+
+def _evaluate_splat_item(node: SplatItem, scope: Scope) -> Any:
+    return scope[SplatItem]
+
+
+def _evaluate_conditional(node: Conditional, scope: Scope) -> Any:
+    if to_bool(evaluate_node(node.condition, scope)):
+        return evaluate_node(node.true_result, scope)
+    return evaluate_node(node.false_result, scope)
+
+
+def _evaluate_unary_operation(node: UnaryOperation, scope: Scope) -> Any:
+    operand = evaluate_node(node.operand, scope)
+    if node.operator == "!":
+        return not to_bool(operand)
+    return -to_number(operand)
+
+
+def _evaluate_binary_operation(node: BinaryOperation, scope: Scope) -> Any:
+    left = evaluate_node(node.left, scope)
+    right = evaluate_node(node.right, scope)
+    operator = node.operator
+
+    if operator == "&&":
+        return to_bool(left) and to_bool(right)
+    if operator == "||":
+        return to_bool(left) or to_bool(right)
+    if operator in ("==", "!="):
+        if _get_type_name(left) != _get_type_name(right):
+            # Terraform doesn't convert the values for equality checks, which would give unexpected results
+            raise HclEvaluationError("Can't compare values of different types")
+        return (left == right) == (operator == "==")
+
+    left_number = to_number(left)
+    right_number = to_number(right)
+    return _NUMBER_OPERATORS[operator](left_number, right_number)
+
+
+def _evaluate_for_expression(node: ForExpression, scope: Scope) -> Union[List[Any], Dict[str, Any]]:
+    items: List[Tuple[Any, Any]] = []
+    for key, value in _iterate_collection(evaluate_node(node.collection, scope)):
+        item_scope = _create_item_scope(scope, node.key_name, key, node.value_name, value)
+        if node.condition is not None and not to_bool(evaluate_node(node.condition, item_scope)):
+            continue
+        result_key = evaluate_node(node.key_result, item_scope) if node.key_result is not None else None
+        items.append((result_key, evaluate_node(node.value_result, item_scope)))
+
+    if node.key_result is None:
+        return [value for _, value in items]
+
+    result: Dict[str, Any] = {}
+    for key, value in items:
+        str_key = to_string(key)
+        if node.group:
+            result.setdefault(str_key, []).append(value)
+        elif str_key in result:
+            raise HclEvaluationError(f"Duplicate object key {str_key}")
+        else:
+            result[str_key] = value
+    return result
+
+
+def _iterate_collection(collection: Any) -> Iterator[Tuple[Any, Any]]:
+    if isinstance(collection, list):
+        return iter(enumerate(collection))
+    if isinstance(collection, dict):
+        # Terraform iterates maps in the lexical order of their keys
+        return iter(sorted(collection.items()))
+    if isinstance(collection, set):
+        return ((value, value) for value in sorted(collection, key=str))
+    raise HclEvaluationError("Can only iterate over lists, sets and maps")
+
+
+def _create_item_scope(scope: Scope, key_name: str | None, key: Any, value_name: str, value: Any) -> Scope:
+    item_scope = dict(scope)
+    if key_name is not None:
+        item_scope[key_name] = key
+    item_scope[value_name] = value
+    return item_scope
+
+
+def _get_index(collection: Any, key: Any) -> Any:
+    if isinstance(collection, list):
+        index = to_number(key)
+        if not isinstance(index, int) or not 0 <= index < len(collection):
+            raise HclEvaluationError(f"Invalid index {key}")
+        return collection[index]
+    if isinstance(collection, dict):
+        key = to_string(key)
+        if key not in collection:
+            raise HclEvaluationError(f"Missing map key {key}")
+        return collection[key]
+    raise HclEvaluationError("Can only index lists and maps")
+
+
+def _get_type_name(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    return type(value).__name__
+
+
+def to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value in ("true", "false"):
+        return bool(value == "true")
+    raise HclEvaluationError(f"Can't convert {value!r} to bool")
+
+
+def to_number(value: Any) -> Union[int, float]:
+    if isinstance(value, bool):
+        raise HclEvaluationError(f"Can't convert {value!r} to number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and NUMERIC_STRING_PATTERN.fullmatch(value):
+        number = float(value)
+        return int(number) if number.is_integer() and "." not in value and "e" not in value.lower() else number
+    raise HclEvaluationError(f"Can't convert {value!r} to number")
+
+
+def to_string(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    raise HclEvaluationError(f"Can't convert {value!r} to string")
+
+
+def _divide(left: Union[int, float], right: Union[int, float]) -> Union[int, float]:
+    if right == 0:
+        raise HclEvaluationError("Division by zero")
+    result = left / right
+    return int(result) if isinstance(left, int) and isinstance(right, int) and left % right == 0 else result
+
+
+def _modulo(left: Union[int, float], right: Union[int, float]) -> Union[int, float]:
+    if right == 0:
+        raise HclEvaluationError("Division by zero")
+    # like Terraform, the result has the sign of the dividend
+    result = math.fmod(left, right)
+    return int(result) if isinstance(left, int) and isinstance(right, int) else result
+
+
+_NUMBER_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": _divide,
+    "%": _modulo,
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+}
+
+_EVALUATORS: Dict[type, Callable[[Any, Scope], Any]] = {
+    Literal: _evaluate_literal,
+    Template: _evaluate_template,
+    TemplateIf: _evaluate_template_if,
+    TemplateFor: _evaluate_template_for,
+    Variable: _evaluate_variable,
+    TupleConstructor: _evaluate_tuple,
+    ObjectConstructor: _evaluate_object,
+    FunctionCall: _evaluate_function_call,
+    Index: _evaluate_index,
+    GetAttr: _evaluate_get_attr,
+    Splat: _evaluate_splat,
+    SplatItem: _evaluate_splat_item,
+    Conditional: _evaluate_conditional,
+    UnaryOperation: _evaluate_unary_operation,
+    BinaryOperation: _evaluate_binary_operation,
+    ForExpression: _evaluate_for_expression,
+}
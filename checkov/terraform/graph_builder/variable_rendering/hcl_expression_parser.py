@@ -0,0 +1,604 @@
+"""
+A tokenizer and Pratt parser for Terraform (HCL native syntax) expressions.
+
+The parsed expressions are represented as a small AST, which is evaluated by the tree-walking interpreter
+in hcl_expression_interpreter.py. Only the expression syntax is supported, heredocs and template strip
+markers (ex. "${~ x ~}") are rejected with a HclParseError.
+https://github.com/hashicorp/hcl/blob/main/hclsyntax/spec.md
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+from checkov.common.util.bounded_cache import BoundedCache
+
+PARSED_EXPRESSIONS_CACHE_MAX_SIZE = 16384
+
+NUMBER_PATTERN = re.compile(r"\d+(\.\d+)?([eE][+-]?\d+)?")
+INTEGER_PATTERN = re.compile(r"\d+")
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+# the longer operators need to be matched first
+OPERATORS = ("...", "==", "!=", "<=", ">=", "&&", "||", "=>", "+", "-", "*", "/", "%", "<", ">", "!", "?", ":", "=",
+             "(", ")", "[", "]", "{", "}", ",", ".", '"')
+STRING_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+# binding powers of the binary operators, a higher one binds stronger
+BINARY_OPERATORS = {
+    "||": 1,
+    "&&": 2,
+    "==": 3,
+    "!=": 3,
+    "<": 4,
+    ">": 4,
+    "<=": 4,
+    ">=": 4,
+    "+": 5,
+    "-": 5,
+    "*": 6,
+    "/": 6,
+    "%": 6,
+}
+
+TOKEN_NUMBER = "number"
+TOKEN_IDENTIFIER = "identifier"
+TOKEN_OPERATOR = "operator"
+TOKEN_EOF = "eof"
+
+
+class HclParseError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+    position: int
+
+
+@dataclass(frozen=True)
+class Literal:
+    value: Any
+
+
+@dataclass(frozen=True)
+class Template:
+    # str parts are literal text, all others are expressions or directives
+    parts: Tuple[Node, ...]
+
+
+@dataclass(frozen=True)
+class TemplateIf:
+    condition: Node
+    true_template: Template
+    false_template: Template
+
+
+@dataclass(frozen=True)
+class TemplateFor:
+    key_name: Optional[str]
+    value_name: str
+    collection: Node
+    template: Template
+
+
+@dataclass(frozen=True)
+class Variable:
+    name: str
+
+
+@dataclass(frozen=True)
+class TupleConstructor:
+    items: Tuple[Node, ...]
+
+
+@dataclass(frozen=True)
+class ObjectConstructor:
+    items: Tuple[Tuple[Node, Node], ...]
+
+
+@dataclass(frozen=True)
+class FunctionCall:
+    name: str
+    args: Tuple[Node, ...]
+    expand_final_arg: bool
+
+
+@dataclass(frozen=True)
+class Index:
+    collection: Node
+    key: Node
+
+
+@dataclass(frozen=True)
+class GetAttr:
+    obj: Node
+    name: str
+
+
+@dataclass(frozen=True)
+class Splat:
+    source: Node
+    # the traversal applied to each item of the source, relative to SplatItem
+    each: Node
+
+
+@dataclass(frozen=True)
+class SplatItem:
+    """The current item of a splat expression"""
+
+
+@dataclass(frozen=True)
+class Conditional:
+    condition: Node
+    true_result: Node
+    false_result: Node
+
+
+@dataclass(frozen=True)
+class UnaryOperation:
+    operator: str
+    operand: Node
+
+
+@dataclass(frozen=True)
+class BinaryOperation:
+    operator: str
+    left: Node
+    right: Node
+
+
+@dataclass(frozen=True)
+class ForExpression:
+    key_name: Optional[str]
+    value_name: str
+    collection: Node
+    # set for object for-expressions
+    key_result: Optional[Node]
+    value_result: Node
+    condition: Optional[Node]
+    group: bool
+
+
+Node = Union[
+    Literal, Template, TemplateIf, TemplateFor, Variable, TupleConstructor, ObjectConstructor, FunctionCall, Index,
+    GetAttr, Splat, SplatItem, Conditional, UnaryOperation, BinaryOperation, ForExpression, str
+]
+
+
+class HclExpressionParser:
+    """
+    Parses a single expression or a bare template, like the value of a Terraform string attribute.
+
+    The tokens are scanned on demand with a single token lookahead, because the content of quoted strings
+    is scanned character by character and can contain nested expressions.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.pos = 0
+        self._peeked: Optional[Token] = None
+        self._last_value = ""
+
+    def parse(self) -> Node:
+        expression = self.parse_expression()
+        self._expect_eof()
+        return expression
+
+    def parse_bare_template(self) -> Template:
+        template, terminator = self._parse_template_parts(quoted=False)
+        if terminator is not None:
+            raise HclParseError(f"Unexpected template directive {terminator}")
+        return template
+
+    def parse_expression(self) -> Node:
+        expression = self._parse_binary(0)
+        if self._peek_operator("?"):
+            self._advance()
+            true_result = self.parse_expression()
+            self._expect_operator(":")
+            false_result = self.parse_expression()
+            return Conditional(condition=expression, true_result=true_result, false_result=false_result)
+        return expression
+
+    def _parse_binary(self, min_binding_power: int) -> Node:
+        left = self._parse_unary()
+        while True:
+            token = self._peek()
+            binding_power = BINARY_OPERATORS.get(token.value) if token.kind == TOKEN_OPERATOR else None
+            if binding_power is None or binding_power <= min_binding_power:
+                return left
+            self._advance()
+            right = self._parse_binary(binding_power)
+            left = BinaryOperation(operator=token.value, left=left, right=right)
+
+    def _parse_unary(self) -> Node:
+        if self._peek_operator("!") or self._peek_operator("-"):
+            operator = self._advance().value
+            return UnaryOperation(operator=operator, operand=self._parse_unary())
+        return self._parse_postfix(self._parse_primary())
+
+    def _parse_postfix(self, expression: Node) -> Node:
+        while True:
+            if self._peek_operator("["):
+                self._advance()
+                if self._peek_operator("*"):
+                    self._advance()
+                    self._expect_operator("]")
+                    return Splat(source=expression, each=self._parse_splat_traversal(full_splat=True))
+                key = self.parse_expression()
+                self._expect_operator("]")
+                expression = Index(collection=expression, key=key)
+            elif self._peek_operator("."):
+                self._advance()
+                token = self._advance()
+                if token.kind == TOKEN_OPERATOR and token.value == "*":
+                    return Splat(source=expression, each=self._parse_splat_traversal(full_splat=False))
+                if token.kind == TOKEN_IDENTIFIER:
+                    expression = GetAttr(obj=expression, name=token.value)
+                elif token.kind == TOKEN_NUMBER and INTEGER_PATTERN.fullmatch(token.value):
+                    # legacy index syntax, like "list.0"
+                    expression = Index(collection=expression, key=Literal(int(token.value)))
+                else:
+                    raise HclParseError(f"Unexpected {token.value!r} after '.' at position {token.position}")
+            else:
+                return expression
+
+    def _parse_splat_traversal(self, full_splat: bool) -> Node:
+        """Parses the traversal applied to each item of a splat, attribute splats only allow attribute access"""
+
+        each: Node = SplatItem()
+        while True:
+            if self._peek_operator("."):
+                self._advance()
+                token = self._advance()
+                if token.kind != TOKEN_IDENTIFIER:
+                    raise HclParseError(f"Unexpected {token.value!r} in splat at position {token.position}")
+                each = GetAttr(obj=each, name=token.value)
+            elif full_splat and self._peek_operator("["):
+                self._advance()
+                key = self.parse_expression()
+                self._expect_operator("]")
+                each = Index(collection=each, key=key)
+            else:
+                return each
+
+    def _parse_primary(self) -> Node:
+        token = self._advance()
+        if token.kind == TOKEN_NUMBER:
+            return Literal(_parse_number(token.value))
+        if token.kind == TOKEN_IDENTIFIER:
+            if token.value == "true":
+                return Literal(True)
+            if token.value == "false":
+                return Literal(False)
+            if token.value == "null":
+                return Literal(None)
+            if self._peek_operator("("):
+                return self._parse_function_call(token.value)
+            return Variable(name=token.value)
+        if token.kind == TOKEN_OPERATOR:
+            if token.value == '"':
+                template, terminator = self._parse_template_parts(quoted=True)
+                if terminator is not None:
+                    raise HclParseError(f"Unexpected template directive {terminator}")
+                return template
+            if token.value == "(":
+                expression = self.parse_expression()
+                self._expect_operator(")")
+                return expression
+            if token.value == "[":
+                return self._parse_tuple()
+            if token.value == "{":
+                return self._parse_object()
+
+        raise HclParseError(f"Unexpected {token.value or token.kind!r} at position {token.position}")
+
+    def _parse_function_call(self, name: str) -> FunctionCall:
+        self._expect_operator("(")
+        args: List[Node] = []
+        expand_final_arg = False
+        while not self._peek_operator(")"):
+            args.append(self.parse_expression())
+            if self._peek_operator("..."):
+                self._advance()
+                expand_final_arg = True
+                break
+            if not self._peek_operator(","):
+                break
+            self._advance()
+        self._expect_operator(")")
+        return FunctionCall(name=name, args=tuple(args), expand_final_arg=expand_final_arg)
+
+    def _parse_tuple(self) -> Node:
+        if self._peek_keyword("for"):
+            return self._parse_for_expression(closing="]")
+
+        items: List[Node] = []
+        while not self._peek_operator("]"):
+            items.append(self.parse_expression())
+            if not self._peek_operator(","):
+                break
+            self._advance()
+        self._expect_operator("]")
+        return TupleConstructor(items=tuple(items))
+
+    def _parse_object(self) -> Node:
+        if self._peek_keyword("for"):
+            return self._parse_for_expression(closing="}")
+
+        items: List[Tuple[Node, Node]] = []
+        while not self._peek_operator("}"):
+            key = self.parse_expression()
+            if isinstance(key, Variable):
+                # a bare identifier is used as a literal key
+                key = Literal(key.name)
+            if not (self._peek_operator("=") or self._peek_operator(":")):
+                token = self._peek()
+                raise HclParseError(f"Expected '=' or ':' at position {token.position}")
+            self._advance()
+            items.append((key, self.parse_expression()))
+            if self._peek_operator(","):
+                self._advance()
+        self._expect_operator("}")
+        return ObjectConstructor(items=tuple(items))
+
+    def _parse_for_expression(self, closing: str) -> ForExpression:
+        self._advance()  # the "for" keyword
+        key_name, value_name = self._parse_for_names()
+        collection = self.parse_expression()
+        self._expect_operator(":")
+
+        key_result = None
+        value_result = self.parse_expression()
+        group = False
+        if closing == "}":
+            self._expect_operator("=>")
+            key_result = value_result
+            value_result = self.parse_expression()
+            if self._peek_operator("..."):
+                self._advance()
+                group = True
+
+        condition = None
+        if self._peek_keyword("if"):
+            self._advance()
+            condition = self.parse_expression()
+        self._expect_operator(closing)
+
+        return ForExpression(
+            key_name=key_name,
+            value_name=value_name,
+            collection=collection,
+            key_result=key_result,
+            value_result=value_result,
+            condition=condition,
+            group=group,
+        )
+
+    def _parse_for_names(self) -> Tuple[Optional[str], str]:
+        key_name = None
+        value_name = self._expect_identifier()
+        if self._peek_operator(","):
+            self._advance()
+            key_name = value_name
+            value_name = self._expect_identifier()
+        if not self._peek_keyword("in"):
+            raise HclParseError(f"Expected 'in' at position {self._peek().position}")
+        self._advance()
+        return key_name, value_name
+
+    def _parse_template_parts(self, quoted: bool) -> Tuple[Template, Optional[str]]:
+        """Parses the template until the closing quote, the end of input or a closing directive
+
+        Returns the template and the keyword of the directive, which ended it, if any.
+        """
+
+        if self._peeked is not None:
+            raise HclParseError(f"Unexpected template at position {self._peeked.position}")
+
+        source = self.source
+        parts: List[Node] = []
+        text: List[str] = []
+        while True:
+            if self.pos >= len(source):
+                if quoted:
+                    raise HclParseError("Unterminated string")
+                break
+
+            char = source[self.pos]
+            if quoted and char == '"':
+                self.pos += 1
+                break
+            if quoted and char == "\\":
+                text.append(self._scan_escape())
+                continue
+            if source.startswith(("$${", "%%{"), self.pos):
+                text.append(source[self.pos + 1:self.pos + 3])
+                self.pos += 3
+                continue
+            if source.startswith("${", self.pos):
+                self.pos += 2
+                if text:
+                    parts.append("".join(text))
+                    text = []
+                self._reject_strip_marker()
+                parts.append(self.parse_expression())
+                self._expect_template_end()
+                continue
+            if source.startswith("%{", self.pos):
+                self.pos += 2
+                self._reject_strip_marker()
+                keyword = self._expect_identifier()
+                if keyword in ("else", "endif", "endfor"):
+                    self._expect_template_end()
+                    if text:
+                        parts.append("".join(text))
+                    return Template(parts=tuple(parts)), keyword
+                if text:
+                    parts.append("".join(text))
+                    text = []
+                parts.append(self._parse_template_directive(keyword, quoted))
+                continue
+            if quoted and char == "\n":
+                raise HclParseError("Unterminated string")
+
+            text.append(char)
+            self.pos += 1
+
+        if text:
+            parts.append("".join(text))
+        return Template(parts=tuple(parts)), None
+
+    def _parse_template_directive(self, keyword: str, quoted: bool) -> Node:
+        if keyword == "if":
+            condition = self.parse_expression()
+            self._expect_template_end()
+            true_template, terminator = self._parse_template_parts(quoted)
+            false_template = Template(parts=())
+            if terminator == "else":
+                false_template, terminator = self._parse_template_parts(quoted)
+            if terminator != "endif":
+                raise HclParseError("Expected an endif directive")
+            return TemplateIf(condition=condition, true_template=true_template, false_template=false_template)
+        if keyword == "for":
+            key_name, value_name = self._parse_for_names()
+            collection = self.parse_expression()
+            self._expect_template_end()
+            template, terminator = self._parse_template_parts(quoted)
+            if terminator != "endfor":
+                raise HclParseError("Expected an endfor directive")
+            return TemplateFor(key_name=key_name, value_name=value_name, collection=collection, template=template)
+
+        raise HclParseError(f"Unknown template directive {keyword}")
+
+    def _scan_escape(self) -> str:
+        escape = self.source[self.pos + 1:self.pos + 2]
+        if escape in STRING_ESCAPES:
+            self.pos += 2
+            return STRING_ESCAPES[escape]
+        if escape in ("u", "U"):
+            length = 4 if escape == "u" else 8
+            code = self.source[self.pos + 2:self.pos + 2 + length]
+            if len(code) == length:
+                try:
+                    self.pos += 2 + length
+                    return chr(int(code, 16))
+                except ValueError:
+                    pass
+        raise HclParseError(f"Invalid escape sequence at position {self.pos}")
+
+    def _reject_strip_marker(self) -> None:
+        if self.source.startswith("~", self.pos):
+            raise HclParseError("Template strip markers are not supported")
+
+    def _expect_template_end(self) -> None:
+        token = self._peek()
+        if token.kind == TOKEN_OPERATOR and token.value == "}":
+            self._peeked = None
+            return
+        raise HclParseError(f"Expected the end of the template sequence at position {token.position}")
+
+    def _expect_eof(self) -> None:
+        token = self._peek()
+        if token.kind != TOKEN_EOF:
+            raise HclParseError(f"Unexpected {token.value!r} at position {token.position}")
+
+    def _expect_operator(self, operator: str) -> None:
+        token = self._advance()
+        if token.kind != TOKEN_OPERATOR or token.value != operator:
+            raise HclParseError(f"Expected {operator!r} at position {token.position}")
+
+    def _expect_identifier(self) -> str:
+        token = self._advance()
+        if token.kind != TOKEN_IDENTIFIER:
+            raise HclParseError(f"Expected an identifier at position {token.position}")
+        return token.value
+
+    def _peek_operator(self, operator: str) -> bool:
+        token = self._peek()
+        return token.kind == TOKEN_OPERATOR and token.value == operator
+
+    def _peek_keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        return token.kind == TOKEN_IDENTIFIER and token.value == keyword
+
+    def _advance(self) -> Token:
+        token = self._peek()
+        self._peeked = None
+        self._last_value = token.value
+        return token
+
+    def _peek(self) -> Token:
+        if self._peeked is None:
+            self._peeked = self._scan_token()
+        return self._peeked
+
+    def _scan_token(self) -> Token:
+        source = self.source
+        pos = self.pos
+        while pos < len(source) and source[pos] in " \t\r\n":
+            pos += 1
+        if source.startswith("#", pos) or source.startswith("//", pos) or source.startswith("/*", pos) \
+                or source.startswith("<<", pos):
+            raise HclParseError(f"Comments and heredocs are not supported, position {pos}")
+
+        self.pos = pos
+        if pos >= len(source):
+            return Token(TOKEN_EOF, "", pos)
+
+        char = source[pos]
+        if char.isdigit():
+            # after a '.' only the integer part belongs to the legacy index syntax, like "list.0.name"
+            pattern = INTEGER_PATTERN if self._last_value == "." else NUMBER_PATTERN
+            match = pattern.match(source, pos)
+            if match:
+                self.pos = match.end()
+                return Token(TOKEN_NUMBER, match.group(), pos)
+
+        match = IDENTIFIER_PATTERN.match(source, pos)
+        if match:
+            self.pos = match.end()
+            return Token(TOKEN_IDENTIFIER, match.group(), pos)
+
+        for operator in OPERATORS:
+            if source.startswith(operator, pos):
+                self.pos = pos + len(operator)
+                return Token(TOKEN_OPERATOR, operator, pos)
+
+        raise HclParseError(f"Unexpected character {char!r} at position {pos}")
+
+
+def _parse_number(value: str) -> Union[int, float]:
+    if INTEGER_PATTERN.fullmatch(value):
+        return int(value)
+    return float(value)
+
+
+parsed_expressions_cache: BoundedCache[Tuple[str, bool], Optional[Node]] = BoundedCache(
+    max_size=PARSED_EXPRESSIONS_CACHE_MAX_SIZE
+)
+
+
+def parse_hcl_expression(source: str, bare_template: bool = False) -> Node:
+    """Returns the AST of the expression or bare template, raises a HclParseError for an invalid one
+
+    The same sources are evaluated many times while rendering, therefore the parse results,
+    including the failed ones, are cached.
+    """
+
+    node = parsed_expressions_cache.get_or_compute((source, bare_template), _try_parse)
+    if node is None:
+        raise HclParseError(f"Invalid expression {source}")
+    return node
+
+
+def _try_parse(key: Tuple[str, bool]) -> Optional[Node]:
+    source, bare_template = key
+    parser = HclExpressionParser(source)
+    try:
+        return parser.parse_bare_template() if bare_template else parser.parse()
+    except (HclParseError, RecursionError):
+        return None
@@ -55,6 +55,8 @@ CHECKOV_RENDER_MAX_LEN = force_int(os.getenv("CHECKOV_RENDER_MAX_LEN", "10000"))
 
 
 class TerraformVariableRenderer(VariableRenderer):
+    SUPPORTS_PARALLEL_RENDERING = True
+
     def __init__(self, local_graph: "TerraformLocalGraph") -> None:
         super().__init__(local_graph)
 
@@ -84,7 +86,7 @@ class TerraformVariableRenderer(VariableRenderer):
             origin_vertex_attributes = self.local_graph.vertices[edge.origin].attributes
         except AttributeError:
             return
-        val_to_eval = deepcopy(origin_vertex_attributes.get(edge.label, ""))
+        val_to_eval = origin_vertex_attributes.get(edge.label, "")
 
         referenced_vertices = get_referenced_vertices_in_value(
             value=val_to_eval, aliases={}, resources_types=self.local_graph.get_resources_types_in_graph()
@@ -117,7 +119,8 @@ class TerraformVariableRenderer(VariableRenderer):
 
         modified_vertex_attributes = self.local_graph.vertices[edge.origin].attributes
         origin_val = modified_vertex_attributes.get(edge.label, "")
-        val_to_eval = deepcopy(origin_val)
+        # replacing values doesn't modify the original value, therefore it doesn't need to be copied
+        val_to_eval = origin_val
         first_key_path = None
 
         if referenced_vertices:
@@ -154,15 +157,6 @@ class TerraformVariableRenderer(VariableRenderer):
                 attribute_at_dest=first_key_path,
             )
 
-        # Avoid loops on output => output edges
-        if (
-            self.local_graph.vertices[edge.origin].block_type == BlockType.OUTPUT
-            and self.local_graph.vertices[edge.dest].block_type == BlockType.OUTPUT
-        ):
-            if edge.origin not in self.done_edges_by_origin_vertex:
-                self.done_edges_by_origin_vertex[edge.origin] = []
-            self.done_edges_by_origin_vertex[edge.origin].append(edge)
-
     def extract_value_from_vertex(self, key_path: List[str], attributes: Dict[str, Any]) -> Any:
         for i, _ in enumerate(key_path):
             key = join_trimmed_strings(char_to_join=".", str_lst=key_path, num_to_trim=i)
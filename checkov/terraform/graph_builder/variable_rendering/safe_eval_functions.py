@@ -4,8 +4,10 @@ import re
 from datetime import datetime, timedelta
 from functools import reduce
 from math import ceil, floor, log
+from types import CodeType
 from typing import Union, Any, Dict, Callable, List, Optional
 
+from checkov.common.util.bounded_cache import BoundedCache
 from checkov.terraform.parser_functions import tonumber, FUNCTION_FAILED, create_map, tobool, tostring
 
 """
@@ -329,13 +331,40 @@ SAFE_EVAL_DICT["timeadd"] = timeadd
 SAFE_EVAL_DICT["formatdate"] = formatdate
 
 
+COMPILED_EXPRESSIONS_CACHE_MAX_SIZE = 16384
+compiled_expressions_cache: BoundedCache[str, Optional[CodeType]] = BoundedCache(
+    max_size=COMPILED_EXPRESSIONS_CACHE_MAX_SIZE
+)
+
+
 def evaluate(input_str: str) -> Any:
     if "__" in input_str:
         logging.debug(f"got a substring with double underscore, which is not allowed. origin string: {input_str}")
         return input_str
-    evaluated = eval(input_str, {"__builtins__": None}, SAFE_EVAL_DICT)  # nosec
+    evaluated = eval(compile_expression(input_str), {"__builtins__": None}, SAFE_EVAL_DICT)  # nosec
     return evaluated if not isinstance(evaluated, str) else remove_unicode_null(evaluated)
 
 
+def compile_expression(input_str: str) -> CodeType:
+    """Returns the compiled code object of the expression, raises a SyntaxError for an invalid one
+
+    The same expressions are evaluated many times while rendering, therefore the compilation results,
+    including the failed ones, are cached.
+    """
+
+    code = compiled_expressions_cache.get_or_compute(input_str, _try_compile)
+    if code is None:
+        raise SyntaxError(f"invalid expression {input_str}")
+    return code
+
+
+def _try_compile(input_str: str) -> Optional[CodeType]:
+    try:
+        # like eval, ignore leading spaces and tabs
+        return compile(input_str.lstrip(" \t"), "<string>", "eval")
+    except (SyntaxError, ValueError):
+        return None
+
+
 def remove_unicode_null(input_str: str) -> str:
     return input_str.replace("\u0000", "\\0")
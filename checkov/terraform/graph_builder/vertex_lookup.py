@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from checkov.terraform.graph_builder.graph_components.block_types import BlockType
+
+if TYPE_CHECKING:
+    from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
+
+# (module dependency, module dependency number)
+ModuleDependencyKey = Tuple[str, str]
+
+
+class PathTrie:
+    """
+    Trie of the real paths of vertices, which resolves the vertex with the longest common path prefix to a given path.
+
+    Each node keeps the first added vertex passing through it, therefore ties are resolved in the order
+    the vertices were added.
+    """
+
+    def __init__(self) -> None:
+        self.children: Dict[str, PathTrie] = {}
+        self.vertex_index = -1
+
+    def add(self, path: str, vertex_index: int) -> None:
+        node = self
+        for part in path.split(os.sep):
+            node = node.children.setdefault(part, PathTrie())
+            if node.vertex_index == -1:
+                node.vertex_index = vertex_index
+
+    def find_longest_match(self, path: str) -> int:
+        """Returns the index of the vertex with the longest common path prefix or -1, if none share a prefix"""
+
+        node = self
+        for part in path.split(os.sep):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+        return node.vertex_index
+
+
+class TerraformVertexLookup:
+    """
+    Lookup of the vertices by their block type, name, module dependency and directory.
+
+    It is built once per graph and replaces scanning the vertices of a module dependency for every reference
+    while creating the edges.
+    """
+
+    def __init__(self, local_graph: TerraformLocalGraph) -> None:
+        self.local_graph = local_graph
+        self.candidates: Dict[Tuple[ModuleDependencyKey, str, str, str], List[int]] = defaultdict(list)
+        # maps the index of a module vertex to the module dependency it is part of
+        self.module_dependency_keys: Dict[int, ModuleDependencyKey] = {}
+        self.path_tries: Dict[Tuple[ModuleDependencyKey, str, str, str], PathTrie] = {}
+        self.realpath_cache: Dict[str, str] = {}
+
+        for module_dependency_key, vertices_by_block_type in local_graph.vertices_by_module_dependency_by_name.items():
+            for block_type, vertices_by_name in vertices_by_block_type.items():
+                for name, vertex_indices in vertices_by_name.items():
+                    for vertex_index in vertex_indices:
+                        dir_name = local_graph.get_dirname(local_graph.vertices[vertex_index].path)
+                        self.candidates[(module_dependency_key, block_type, name, dir_name)].append(vertex_index)
+                        if block_type == BlockType.MODULE:
+                            self.module_dependency_keys.setdefault(vertex_index, module_dependency_key)
+
+        # convert to a plain dict to not create new entries while looking up unknown vertices
+        self.candidates = dict(self.candidates)
+
+    def find_vertex_index(
+        self,
+        block_type: str,
+        name: str,
+        block_path: str,
+        module_path: str,
+        module_num: str,
+        relative_module_idx: Optional[int] = None,
+    ) -> int:
+        if relative_module_idx is not None:
+            module_dependency_key = self.module_dependency_keys.get(relative_module_idx)
+            if module_dependency_key is None:
+                return -1
+        else:
+            module_dependency_key = (module_path, module_num)
+
+        key = (module_dependency_key, block_type, name, self.local_graph.get_dirname(block_path))
+        candidates = self.candidates.get(key)
+        if not candidates:
+            return -1
+        if len(candidates) == 1:
+            return candidates[0]
+
+        path_trie = self.path_tries.get(key)
+        if path_trie is None:
+            path_trie = PathTrie()
+            for vertex_index in candidates:
+                path_trie.add(self.get_realpath(self.local_graph.vertices[vertex_index].path), vertex_index)
+            self.path_tries[key] = path_trie
+
+        return path_trie.find_longest_match(self.get_realpath(block_path))
+
+    def get_realpath(self, path: str) -> str:
+        real_path = self.realpath_cache.get(path)
+        if real_path is None:
+            real_path = os.path.realpath(path)
+            self.realpath_cache[path] = real_path
+        return real_path
@@ -28,6 +28,7 @@ class TerraformGraphManager(GraphManager[TerraformLocalGraph, "dict[str, dict[st
         excluded_paths: list[str] | None = None,
         vars_files: list[str] | None = None,
         create_graph: bool = True,
+        parse_cache_dir: str | None = None,
     ) -> tuple[TerraformLocalGraph | None, dict[str, dict[str, Any]]]:
         logging.info("Parsing HCL files in source dir")
         module, tf_definitions = self.parser.parse_hcl_module(
@@ -39,6 +40,7 @@ class TerraformGraphManager(GraphManager[TerraformLocalGraph, "dict[str, dict[st
             excluded_paths=excluded_paths,
             vars_files=vars_files,
             create_graph=create_graph,
+            parse_cache_dir=parse_cache_dir,
         )
 
         local_graph = None
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+from checkov.common.bridgecrew.severities import Severity, get_severity
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.extra_resource import ExtraResource
+from checkov.common.output.graph_record import GraphRecord
+from checkov.common.output.record import Record
+from checkov.common.util.content_cache import compute_content_hash
+from checkov.common.util.parser_utils import get_tf_definition_key_from_module_dependency
+from checkov.version import version as checkov_version
+
+if TYPE_CHECKING:
+    from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
+
+INCREMENTAL_STATE_FILE_NAME = "terraform_incremental_state.json"
+TERRAFORM_FILE_SUFFIXES = (".tf", ".hcl", ".tfvars", ".tfvars.json")
+
+
+@dataclass
+class DefinitionScanResults:
+    """The additions of scanning a single definition to the report"""
+
+    records: list[Record] = field(default_factory=list)
+    extra_resources: list[ExtraResource] = field(default_factory=list)
+
+
+class IncrementalScanState:
+    """
+    Keeps the state of a previous Terraform scan to only re-run the Python checks on definitions,
+    which are impacted by changed files.
+
+    A definition is impacted, if one of its vertices lives in a changed directory or references (directly
+    or transitively) a vertex, which lives in a changed directory. Directories are compared by the content
+    hashes of their Terraform files, therefore the same state can be reused across branches and commits.
+
+    The state directory is usually a restored CI cache, which can be written by other branches. Therefore
+    the state is stored as plain JSON data and loading it never executes code. Definitions, whose results
+    can't be represented as JSON data, are not stored and scanned again by the next run.
+    """
+
+    def __init__(self, state_dir: str, fingerprint: str) -> None:
+        self.state_dir = state_dir
+        self.state_file_path = os.path.join(state_dir, INCREMENTAL_STATE_FILE_NAME)
+        self.fingerprint = compute_content_hash(f"{checkov_version}|{fingerprint}".encode("utf-8"))
+
+        self.previous_dir_hashes: dict[str, dict[str, str]] = {}
+        self.previous_results: dict[str, DefinitionScanResults] = {}
+
+        self.dir_hashes: dict[str, dict[str, str]] = {}
+        self.results: dict[str, DefinitionScanResults] = {}
+        self.impacted_definition_keys: set[str] = set()
+
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.state_file_path, "r", encoding="utf-8") as f:
+                state = json.load(f, object_hook=_from_json_data)
+
+            if state.get("fingerprint") != self.fingerprint:
+                logging.info("The scan configuration changed since the previous incremental scan, running a full scan")
+                return
+
+            previous_dir_hashes = state["dir_hashes"]
+            previous_results = {
+                definition_key: _definition_results_from_json(results)
+                for definition_key, results in state["results"].items()
+            }
+        except FileNotFoundError:
+            logging.info("No previous incremental scan state found, running a full scan")
+            return
+        except Exception:
+            logging.info(f"Failed to load the incremental scan state {self.state_file_path}, running a full scan", exc_info=True)
+            return
+
+        self.previous_dir_hashes = previous_dir_hashes
+        self.previous_results = previous_results
+
+    def save(self) -> None:
+        results = {}
+        for definition_key, definition_results in self.results.items():
+            try:
+                results[definition_key] = _definition_results_to_json(definition_results)
+            except TypeError:
+                logging.debug(f"Skipping the results of {definition_key}, they can't be stored as JSON", exc_info=True)
+
+        state = {
+            "fingerprint": self.fingerprint,
+            "dir_hashes": self.dir_hashes,
+            "results": results,
+        }
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file_path)
+        except Exception:
+            logging.warning(f"Failed to save the incremental scan state to {self.state_dir}", exc_info=True)
+
+    def compute_impacted_definitions(self, local_graph: TerraformLocalGraph) -> None:
+        """Calculates the definition keys, which need to be scanned again"""
+
+        vertex_dirs = {os.path.dirname(vertex.path) for vertex in local_graph.vertices}
+        changed_dirs = self._compute_changed_dirs(vertex_dirs)
+
+        impacted_vertices = deque(
+            idx for idx, vertex in enumerate(local_graph.vertices) if os.path.dirname(vertex.path) in changed_dirs
+        )
+        visited_vertices = set(impacted_vertices)
+        # edges point from the referencing vertex to the referenced one, so walk them backwards
+        while impacted_vertices:
+            vertex_idx = impacted_vertices.popleft()
+            for edge in local_graph.in_edges.get(vertex_idx, []):
+                if edge.origin not in visited_vertices:
+                    visited_vertices.add(edge.origin)
+                    impacted_vertices.append(edge.origin)
+
+        for vertex_idx in visited_vertices:
+            vertex = local_graph.vertices[vertex_idx]
+            definition_key = vertex.path
+            if vertex.module_dependency:
+                definition_key = get_tf_definition_key_from_module_dependency(
+                    vertex.path, vertex.module_dependency, vertex.module_dependency_num
+                )
+            self.impacted_definition_keys.add(definition_key)
+
+        logging.info(
+            f"Incremental scan found {len(changed_dirs)} changed directories "
+            f"and {len(self.impacted_definition_keys)} impacted definitions"
+        )
+
+    def get_reusable_results(self, definition_key: str) -> DefinitionScanResults | None:
+        """Returns the results of the previous scan, if the definition is not impacted by any change"""
+
+        if definition_key in self.impacted_definition_keys:
+            return None
+
+        results = self.previous_results.get(definition_key)
+        if results is not None:
+            self.results[definition_key] = results
+        return results
+
+    def set_results(self, definition_key: str, results: DefinitionScanResults) -> None:
+        self.results[definition_key] = results
+
+    def _compute_changed_dirs(self, dirs: set[str]) -> set[str]:
+        changed_dirs = set()
+        for directory in dirs:
+            dir_file_hashes = _hash_terraform_files(directory)
+            self.dir_hashes[directory] = dir_file_hashes
+
+            if not dir_file_hashes or dir_file_hashes != self.previous_dir_hashes.get(directory):
+                changed_dirs.add(directory)
+
+        return changed_dirs
+
+
+def _hash_terraform_files(directory: str) -> dict[str, str]:
+    file_hashes = {}
+    try:
+        for entry in os.scandir(directory):
+            if entry.name.endswith(TERRAFORM_FILE_SUFFIXES) and entry.is_file():
+                with open(entry.path, "rb") as f:
+                    file_hashes[entry.path] = compute_content_hash(f.read())
+    except OSError:
+        logging.debug(f"Failed to hash the files of directory {directory}", exc_info=True)
+
+    return file_hashes
+
+
+def _definition_results_to_json(results: DefinitionScanResults) -> dict[str, Any]:
+    return {
+        "records": [_to_json_data(record.to_dict()) for record in results.records],
+        "extra_resources": [
+            _to_json_data({attribute: getattr(resource, attribute) for attribute in ExtraResource.__slots__})
+            for resource in results.extra_resources
+        ],
+    }
+
+
+def _definition_results_from_json(results: dict[str, Any]) -> DefinitionScanResults:
+    records = []
+    for record_attributes in results["records"]:
+        record_class = GraphRecord if "breadcrumbs" in record_attributes else Record
+        record = record_class.__new__(record_class)
+        for attribute, value in record_attributes.items():
+            setattr(record, attribute, value)
+        records.append(record)
+
+    extra_resources = [ExtraResource(**resource_attributes) for resource_attributes in results["extra_resources"]]
+    return DefinitionScanResults(records=records, extra_resources=extra_resources)
+
+
+def _to_json_data(value: Any) -> Any:
+    """Converts the value to JSON data, the types, which JSON can't represent, are tagged for _from_json_data()
+
+    Raises a TypeError for values, which can't be restored as they are.
+    """
+
+    value_type = type(value)
+    if value is None or value_type in (str, int, float, bool):
+        return value
+    if value_type is list:
+        return [_to_json_data(item) for item in value]
+    if value_type is dict:
+        if any(type(key) is not str for key in value):
+            raise TypeError("Only dicts with str keys can be stored")
+        return {key: _to_json_data(item) for key, item in value.items()}
+    if value_type is tuple:
+        return {"__tuple__": [_to_json_data(item) for item in value]}
+    if value_type is CheckResult:
+        return {"__check_result__": value.name}
+    if value_type is Severity:
+        return {"__severity__": value.name}
+
+    raise TypeError(f"Values of type {value_type} can't be stored")
+
+
+def _from_json_data(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__tuple__" in obj:
+            return tuple(obj["__tuple__"])
+        if "__check_result__" in obj:
+            return CheckResult[obj["__check_result__"]]
+        if "__severity__" in obj:
+            return get_severity(obj["__severity__"])
+    return obj
+
+
+def build_scan_fingerprint(*values: Any) -> str:
+    """Creates a fingerprint of the scan configuration, which influences the scan results"""
+
+    return "|".join(repr(value) for value in values)
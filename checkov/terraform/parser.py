@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import re
+import sys
 from collections.abc import Sequence
 from collections import defaultdict
 from copy import deepcopy
@@ -16,8 +17,10 @@ import deep_merge
 import hcl2
 from lark import Tree
 
+from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.common.runners.base_runner import filter_ignored_paths, IGNORE_HIDDEN_DIRECTORY_ENV, strtobool
 from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR, RESOLVED_MODULE_ENTRY_NAME
+from checkov.common.util.content_cache import ContentCache, compute_content_hash, DEFAULT_CACHE_MAX_SIZE
 from checkov.common.util.json_utils import CustomJSONEncoder
 from checkov.common.util.type_forcers import force_list
 from checkov.common.variables.context import EvaluationContext
@@ -32,6 +35,12 @@ from checkov.terraform.module_loading.registry import module_loader_registry as
 from checkov.common.util.parser_utils import eval_string, find_var_blocks, is_nested, \
     get_tf_definition_key_from_module_dependency, \
     get_module_from_full_path, get_abs_path, TERRAFORM_NESTED_MODULE_PATH_ENDING, TERRAFORM_NESTED_MODULE_PATH_PREFIX
+from checkov.version import version as checkov_version
+
+if sys.version_info >= (3, 8):
+    from importlib.metadata import version as meta_version
+else:
+    from importlib_metadata import version as meta_version
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
@@ -41,6 +50,8 @@ _Hcl2Payload: TypeAlias = "dict[str, list[dict[str, Any]]]"
 
 external_modules_download_path = os.environ.get('EXTERNAL_MODULES_DIR', DEFAULT_EXTERNAL_MODULES_DIR)
 GOOD_BLOCK_TYPES = {BlockType.LOCALS, BlockType.TERRAFORM}  # used for cleaning bad tf definitions
+PARALLEL_PARSING_MIN_FILES = int(os.getenv('CHECKOV_PARALLEL_PARSING_MIN_FILES', '100'))
+PARSE_CACHE_MAX_SIZE = int(os.getenv('CHECKOV_PARSE_CACHE_MAX_SIZE', DEFAULT_CACHE_MAX_SIZE))
 
 ENTITY_NAME_PATTERN = re.compile(r"[^\W0-9][\w-]*")
 RESOLVED_MODULE_PATTERN = re.compile(r"\[.+\#.+\]")
@@ -60,6 +71,7 @@ class Parser:
         self.external_modules_source_map: Dict[Tuple[str, str], str] = {}
         self.module_address_map: Dict[Tuple[str, str], str] = {}
         self.loaded_files_map = {}
+        self.parse_cache: ContentCache | None = None
 
         # This ensures that we don't try to double-load modules
         # Tuple is <file>, <module_index>, <name> (see _load_modules)
@@ -74,7 +86,8 @@ class Parser:
               download_external_modules: bool,
               external_modules_download_path: str,
               excluded_paths: Optional[List[str]] = None,
-              tf_var_files: Optional[List[str]] = None):
+              tf_var_files: Optional[List[str]] = None,
+              parse_cache_dir: Optional[str] = None):
         self.directory = directory
         self.out_definitions = out_definitions
         self.out_evaluations_context = out_evaluations_context
@@ -86,6 +99,7 @@ class Parser:
         self.module_address_map = {}
         self.tf_var_files = tf_var_files
         self.dirname_cache = {}
+        self.parse_cache = create_parse_cache(parse_cache_dir) if parse_cache_dir else None
 
         if self.out_evaluations_context is None:
             self.out_evaluations_context = {}
@@ -113,9 +127,11 @@ class Parser:
                         external_modules_download_path: str = DEFAULT_EXTERNAL_MODULES_DIR,
                         excluded_paths: Optional[List[str]] = None,
                         vars_files: Optional[List[str]] = None,
-                        external_modules_content_cache: Optional[Dict[str, ModuleContent]] = None):
+                        external_modules_content_cache: Optional[Dict[str, ModuleContent]] = None,
+                        parse_cache_dir: Optional[str] = None):
         self._init(directory, out_definitions, out_evaluations_context, out_parsing_errors, env_vars,
-                   download_external_modules, external_modules_download_path, excluded_paths)
+                   download_external_modules, external_modules_download_path, excluded_paths,
+                   parse_cache_dir=parse_cache_dir)
         self._parsed_directories.clear()
         default_ml_registry.root_dir = directory
         default_ml_registry.download_external_modules = download_external_modules
@@ -125,14 +141,14 @@ class Parser:
         self._parse_directory(dir_filter=lambda d: self._check_process_dir(d), vars_files=vars_files)
         if self.enable_nested_modules:
             self._update_resolved_modules()
+        if self.parse_cache:
+            logging.info(f"HCL parse cache stats: {self.parse_cache.get_stats()}")
 
     def parse_file(self, file: str, parsing_errors: Optional[Dict[str, Exception]] = None) -> Optional[Dict[str, Any]]:
         if file.endswith(".tf") or file.endswith(".tf.json") or file.endswith(".hcl"):
             parse_result = _load_or_die_quietly(file, parsing_errors)
             if parse_result:
-                parse_result = self._serialize_definitions(parse_result)
-                parse_result = self._clean_parser_types(parse_result)
-                return parse_result
+                return self._normalize_definitions(parse_result)
 
         return None
 
@@ -167,6 +183,7 @@ class Parser:
         keys_referenced_as_modules: Set[str] = set()
 
         if include_sub_dirs:
+            self._preload_files()
             for sub_dir, d_names, _ in os.walk(self.directory):
                 # filter subdirectories for future iterations (we filter files while iterating the directory)
                 _filter_ignored_paths(sub_dir, d_names, self.excluded_paths)
@@ -341,31 +358,76 @@ class Parser:
                 # load, forcing things through without complete resolution.
                 force_final_module_load = True
 
-    def _load_files(self, files: list[os.DirEntry]):
+    def _preload_files(self) -> None:
+        """
+        Parses the Terraform files of all sub directories in one parallel run and stores them in `loaded_files_map`.
+        This way a single big directory or file doesn't serialize the parsing, like it would by going directory
+        by directory. Files, which failed to parse, are picked up again by the regular directory load.
+        """
+
+        files_to_load: list[os.DirEntry] = []
+        for sub_dir, d_names, _ in os.walk(self.directory):
+            _filter_ignored_paths(sub_dir, d_names, self.excluded_paths)
+            dir_contents = list(os.scandir(sub_dir))
+            if self.excluded_paths or IGNORE_HIDDEN_DIRECTORY_ENV:
+                filter_ignored_paths(sub_dir, dir_contents, self.excluded_paths)
+
+            for file in dir_contents:
+                if (file.name.endswith(".tf") or file.name.endswith(".hcl")) and _is_accessible_file(file):
+                    files_to_load.append(file)
+
+        if len(files_to_load) < PARALLEL_PARSING_MIN_FILES:
+            # not worth the overhead of starting new processes
+            return
+
+        logging.info(f"Parsing {len(files_to_load)} files in parallel")
+        self._load_files(files_to_load, run_parallel=True)
+
+    def _load_files(self, files: list[os.DirEntry], run_parallel: bool = False):
         def _load_file(file: os.DirEntry):
             parsing_errors = {}
             result = _load_or_die_quietly(file, parsing_errors)
-            # the exceptions type can un-pickleable
+            # the exceptions type can un-pickleable so we need to cast them to Exception
             for path, e in parsing_errors.items():
-                parsing_errors[path] = e
+                parsing_errors[path] = Exception(e.__repr__())
 
             return (file.path, result), parsing_errors
 
         files_to_data = []
         files_to_parse = []
+        file_to_cache_key: dict[str, str] = {}
         for file in files:
             data = self.loaded_files_map.get(file.path)
             if data:
                 files_to_data.append((file.path, data))
-            else:
-                files_to_parse.append(file)
+                continue
+
+            if self.parse_cache:
+                cache_key = _get_file_cache_key(file.path)
+                if cache_key:
+                    data = self.parse_cache.get(cache_key)
+                    if data is not None:
+                        files_to_data.append((file.path, data))
+                        self.loaded_files_map[file.path] = data
+                        continue
+                    file_to_cache_key[file.path] = cache_key
+
+            files_to_parse.append(file)
 
-        results = [_load_file(f) for f in files_to_parse]
-        for result, parsing_errors in results:
+        if run_parallel:
+            results = parallel_runner.run_function(_load_file, files_to_parse, item_weight=_get_file_size)
+        else:
+            results = [_load_file(f) for f in files_to_parse]
+        for file_result in results:
+            if not file_result:
+                continue
+            result, parsing_errors = file_result
             self.out_parsing_errors.update(parsing_errors)
             files_to_data.append(result)
             if result[0] not in self.loaded_files_map:
                 self.loaded_files_map[result[0]] = result[1]
+            if self.parse_cache and result[1] is not None and result[0] in file_to_cache_key:
+                self.parse_cache.put(file_to_cache_key[result[0]], result[1])
         return files_to_data
 
     def _load_modules(self, root_dir: str, module_loader_registry: ModuleLoaderRegistry,
@@ -553,15 +615,16 @@ class Parser:
         vars_files: list[str] | None = None,
         external_modules_content_cache: dict[str, ModuleContent] | None = None,
         create_graph: bool = True,
+        parse_cache_dir: str | None = None,
     ) -> tuple[Module | None, dict[str, dict[str, Any]]]:
         tf_definitions: dict[str, dict[str, Any]] = {}
         self.parse_directory(directory=source_dir, out_definitions=tf_definitions, out_evaluations_context={},
                              out_parsing_errors=parsing_errors if parsing_errors is not None else {},
                              download_external_modules=download_external_modules,
                              external_modules_download_path=external_modules_download_path, excluded_paths=excluded_paths,
-                             vars_files=vars_files, external_modules_content_cache=external_modules_content_cache)
-        tf_definitions = self._clean_parser_types(tf_definitions)
-        tf_definitions = self._serialize_definitions(tf_definitions)
+                             vars_files=vars_files, external_modules_content_cache=external_modules_content_cache,
+                             parse_cache_dir=parse_cache_dir)
+        tf_definitions = self._normalize_definitions(tf_definitions)
 
         module = None
         if create_graph:
@@ -691,6 +754,17 @@ class Parser:
     def _serialize_definitions(tf_definitions: dict[str, _Hcl2Payload]) -> dict[str, _Hcl2Payload]:
         return loads(dumps(tf_definitions, cls=CustomJSONEncoder))
 
+    @staticmethod
+    def _normalize_definitions(tf_definitions: dict[str, _Hcl2Payload]) -> dict[str, _Hcl2Payload]:
+        """
+        Converts the parsed definitions into their canonical form in a single pass.
+
+        The result is equal to `_clean_parser_types(_serialize_definitions(tf_definitions))`, but without
+        the intermediate JSON string and the additional copy of the whole definitions tree.
+        """
+
+        return _normalize_dict(tf_definitions)
+
     @staticmethod
     def get_next_vertices(evaluated_files: list[str], unevaluated_files: list[str]) -> tuple[list[str], list[str]]:
         """
@@ -871,6 +945,121 @@ Load JSON or HCL, depending on filename.
         return None
 
 
+_json_encoder = CustomJSONEncoder()
+_JSON_NATIVE_TYPES = (int, float, bool, type(None))
+
+
+def _to_json_key(key: Any) -> str:
+    """Mimics the conversion of dict keys done by the json module"""
+
+    key_type = type(key)
+    if key_type is str:
+        return key
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key_type.__name__}")
+
+
+def _normalize_value(value: Any, clean: bool = True) -> Any:
+    value_type = type(value)
+    if value_type is str:
+        if clean:
+            if value == "true":
+                return True
+            if value == "false":
+                return False
+        return value
+    if value_type in _JSON_NATIVE_TYPES:
+        return value
+    if isinstance(value, dict):
+        return _normalize_dict(value, clean=clean)
+    if isinstance(value, (list, tuple)):
+        return _normalize_list(value, clean=clean)
+    if isinstance(value, str):
+        return _normalize_value(str.__str__(value), clean=clean)
+    if isinstance(value, int):
+        return int(int.__repr__(value))
+    if isinstance(value, float):
+        return float(float.__repr__(value))
+
+    # fallback to the custom encoder used for the json round trip, ex. for sets or lark trees
+    return _normalize_value(_json_encoder.default(value), clean=clean)
+
+
+def _normalize_dict(conf: dict[Any, Any], clean: bool = True) -> dict[str, Any]:
+    if not all(type(key) is str for key in conf):
+        conf = {_to_json_key(key): value for key, value in conf.items()}
+
+    if not clean:
+        return {key: _normalize_value(value, clean=False) for key, value in conf.items()}
+
+    # the 'alias' value is kept as is, besides making it json compatible
+    return {key: _normalize_value(conf[key], clean=key != "alias") for key in sorted(conf)}
+
+
+def _normalize_list(values: list[Any] | tuple[Any, ...], clean: bool = True) -> list[Any]:
+    if not clean:
+        return [_normalize_value(value, clean=False) for value in values]
+
+    # non string values are kept in their order, followed by the sorted string values
+    str_values = []
+    result_values = []
+    for value in values:
+        value = _normalize_value(value)
+        if type(value) is str:
+            str_values.append(value)
+        else:
+            result_values.append(value)
+    str_values.sort()
+    result_values.extend(str_values)
+    return result_values
+
+
+def create_parse_cache(cache_dir: str) -> ContentCache:
+    """Creates a parse cache, which is invalidated, when either checkov or python-hcl2 change their version"""
+
+    try:
+        hcl2_version = meta_version("bc-python-hcl2")
+    except Exception:
+        hcl2_version = "unknown"
+
+    namespace = ContentCache.build_namespace("hcl", checkov_version, hcl2_version)
+    return ContentCache(cache_dir=cache_dir, namespace=namespace, max_size=PARSE_CACHE_MAX_SIZE)
+
+
+def _is_accessible_file(file: os.DirEntry) -> bool:
+    try:
+        return file.is_file()
+    except OSError:
+        return False
+
+
+def _get_file_size(file: os.DirEntry) -> int:
+    try:
+        return file.stat().st_size
+    except OSError:
+        return 0
+
+
+def _get_file_cache_key(file_path: str) -> str | None:
+    try:
+        with open(file_path, "rb") as f:
+            return compute_content_hash(f.read())
+    except OSError:
+        logging.debug(f"Failed to read file {file_path} for computing its cache key", exc_info=True)
+        return None
+
+
 def _is_valid_block(block: Any) -> bool:
     if not isinstance(block, dict):
         return True
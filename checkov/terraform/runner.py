@@ -29,6 +29,7 @@ from checkov.common.util.parser_utils import get_module_from_full_path, get_abs_
     get_tf_definition_key_from_module_dependency, TERRAFORM_NESTED_MODULE_PATH_PREFIX, \
     TERRAFORM_NESTED_MODULE_PATH_ENDING, TERRAFORM_NESTED_MODULE_PATH_SEPARATOR_LENGTH
 from checkov.common.util.secrets import omit_secret_value_from_checks, omit_secret_value_from_graph_checks
+from checkov.common.util.suppression_index import SuppressionIndex
 from checkov.common.variables.context import EvaluationContext
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.checks.data.registry import data_registry
@@ -44,6 +45,7 @@ from checkov.terraform.graph_builder.graph_to_tf_definitions import convert_grap
 from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
 from checkov.terraform.graph_manager import TerraformGraphManager
 from checkov.terraform.image_referencer.manager import TerraformImageReferencerManager
+from checkov.terraform.incremental_scan import DefinitionScanResults, IncrementalScanState, build_scan_fingerprint
 from checkov.terraform.parser import Parser
 from checkov.terraform.plan_utils import get_resource_id_without_nested_modules
 from checkov.terraform.tag_providers import get_resource_tags
@@ -112,6 +114,7 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
         parsing_errors: dict[str, Exception] = {}
         self.load_external_checks(external_checks_dir)
         local_graph = None
+        incremental_state = None
 
         if self.context is None or self.definitions is None or self.breadcrumbs is None:
             self.definitions = {}
@@ -128,7 +131,14 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
                     excluded_paths=runner_filter.excluded_paths,
                     vars_files=runner_filter.var_files,
                     create_graph=CHECKOV_CREATE_GRAPH,
+                    parse_cache_dir=runner_filter.parse_cache_dir,
                 )
+                if runner_filter.incremental_state_dir and local_graph:
+                    incremental_state = IncrementalScanState(
+                        state_dir=runner_filter.incremental_state_dir,
+                        fingerprint=self._get_scan_fingerprint(root_folder, external_checks_dir, runner_filter, collect_skip_comments),
+                    )
+                    incremental_state.compute_impacted_definitions(local_graph)
             elif files:
                 files = [os.path.abspath(file) for file in files]
                 root_folder = os.path.split(os.path.commonprefix(files))[0]
@@ -157,7 +167,9 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
             logging.info("Scanning root folder using existing tf_definitions")
 
         self.pbar.initiate(len(self.definitions))
-        self.check_tf_definition(report, root_folder, runner_filter, collect_skip_comments)
+        self.check_tf_definition(report, root_folder, runner_filter, collect_skip_comments, incremental_state)
+        if incremental_state:
+            incremental_state.save()
 
         report.add_parsing_errors(parsing_errors.keys())
 
@@ -180,6 +192,30 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
 
         return report
 
+    def _get_scan_fingerprint(
+        self,
+        root_folder: str,
+        external_checks_dir: list[str] | None,
+        runner_filter: RunnerFilter,
+        collect_skip_comments: bool,
+    ) -> str:
+        return build_scan_fingerprint(
+            root_folder,
+            external_checks_dir,
+            collect_skip_comments,
+            self.enable_nested_modules,
+            runner_filter.checks,
+            runner_filter.skip_checks,
+            runner_filter.check_threshold,
+            runner_filter.skip_check_threshold,
+            dict(runner_filter.skip_checks_regex_patterns),
+            runner_filter.enforcement_rule_configs,
+            runner_filter.filtered_policy_ids,
+            runner_filter.evaluate_variables,
+            runner_filter.var_files,
+            dict(runner_filter.resource_attr_to_omit),
+        )
+
     def load_external_checks(self, external_checks_dir: list[str] | None) -> None:
         if external_checks_dir:
             for directory in external_checks_dir:
@@ -211,6 +247,8 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
     def get_graph_checks_report(self, root_folder: str, runner_filter: RunnerFilter) -> Report:
         report = Report(self.check_type)
         checks_results = self.run_graph_checks_results(runner_filter, self.check_type)
+        # the contexts are kept in self.context, therefore their ids are stable while the report is created
+        suppressions_by_context_id: dict[int, SuppressionIndex] = {}
 
         for check, check_results in checks_results.items():
             for check_result in check_results:
@@ -218,12 +256,18 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
                 entity_context, entity_evaluations = self.get_entity_context_and_evaluations(entity)
                 if entity_context:
                     full_file_path = entity[CustomAttributes.FILE_PATH]
-                    copy_of_check_result = copy.deepcopy(check_result)
-                    for skipped_check in entity_context.get('skipped_checks', []):
-                        if skipped_check['id'] == check.id:
-                            copy_of_check_result['result'] = CheckResult.SKIPPED
-                            copy_of_check_result['suppress_comment'] = skipped_check['suppress_comment']
-                            break
+                    # the entity is replaced by its config below, therefore copying it is not needed
+                    copy_of_check_result = {
+                        key: None if key == 'entity' else copy.deepcopy(value) for key, value in check_result.items()
+                    }
+                    suppressions = suppressions_by_context_id.get(id(entity_context))
+                    if suppressions is None:
+                        suppressions = SuppressionIndex(entity_context.get('skipped_checks'))
+                        suppressions_by_context_id[id(entity_context)] = suppressions
+                    skipped_check = suppressions.get(check.id)
+                    if skipped_check:
+                        copy_of_check_result['result'] = CheckResult.SKIPPED
+                        copy_of_check_result['suppress_comment'] = skipped_check['suppress_comment']
                     copy_of_check_result['entity'] = entity.get(CustomAttributes.CONFIG)
                     connected_node_data = self.get_connected_node(entity, root_folder)
                     if platform.system() == "Windows":
@@ -310,13 +354,10 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
         return entity_context, entity_evaluations
 
     def check_tf_definition(self, report: Report, root_folder: Path, runner_filter: RunnerFilter,
-                            collect_skip_comments=True) -> None:
+                            collect_skip_comments=True, incremental_state: IncrementalScanState | None = None) -> None:
         parser_registry.reset_definitions_context()
         if not self.context:
-            definitions_context = {}
-            for definition in self.definitions.items():
-                definitions_context = parser_registry.enrich_definitions_context(definition, collect_skip_comments)
-            self.context = definitions_context
+            self.context = parser_registry.enrich_definitions_contexts(self.definitions, collect_skip_comments)
             logging.debug('Created definitions context')
 
         if self.enable_nested_modules:
@@ -329,9 +370,28 @@ class Runner(ImageReferencerMixin[None], BaseRunner[TerraformGraphManager]):
             else:
                 abs_scanned_file, abs_referrer = self._strip_module_referrer(full_file_path)
             scanned_file = f"/{os.path.relpath(abs_scanned_file, root_folder)}"
-            logging.debug(f"Scanning file: {scanned_file}")
-            self.run_all_blocks(definition, self.context, full_file_path, root_folder, report,
-                                scanned_file, runner_filter, abs_referrer)
+            if incremental_state:
+                results = incremental_state.get_reusable_results(full_file_path)
+                if results is not None:
+                    logging.debug(f"Reusing the results of the previous scan for file: {scanned_file}")
+                else:
+                    file_report = Report(self.check_type)
+                    logging.debug(f"Scanning file: {scanned_file}")
+                    self.run_all_blocks(definition, self.context, full_file_path, root_folder, file_report,
+                                        scanned_file, runner_filter, abs_referrer)
+                    results = DefinitionScanResults(
+                        records=file_report.get_all_records(),
+                        extra_resources=list(file_report.extra_resources),
+                    )
+                    incremental_state.set_results(full_file_path, results)
+
+                for record in results.records:
+                    report.add_record(record=record)
+                report.extra_resources.update(results.extra_resources)
+            else:
+                logging.debug(f"Scanning file: {scanned_file}")
+                self.run_all_blocks(definition, self.context, full_file_path, root_folder, report,
+                                    scanned_file, runner_filter, abs_referrer)
             self.pbar.update()
         self.pbar.close()
 
@@ -6,6 +6,7 @@ from checkov.common.checks.base_check import BaseCheck
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
 from checkov.common.models.enums import CheckResult
 from checkov.common.typing import _SkippedCheck, _ScannerCallableAlias
+from checkov.common.util.suppression_index import SuppressionIndex
 from checkov.runner_filter import RunnerFilter
 from checkov.yaml_doc.enums import BlockType
 import jmespath
@@ -123,8 +124,9 @@ class Registry(BaseCheckRegistry):
             entity_type: str,
             results: Dict[str, Any],
     ) -> None:
+        suppressions = SuppressionIndex(skipped_checks)
         for check in checks:
-            skip_info = ([x for x in skipped_checks if (x["id"] == check.id and entity[STARTLINE_MARK] <= x['line_number'] <= entity[ENDLINE_MARK])] or [{}])[0]
+            skip_info = suppressions.get(check.id, start_line=entity[STARTLINE_MARK], end_line=entity[ENDLINE_MARK])
 
             if runner_filter.should_run_check(check=check, report_type=self.report_type):
                 scanner = self._scanner.get(check.block_type, self._scan_yaml_document)
@@ -2,6 +2,8 @@ from typing import Any
 
 
 class TestSuite:
+    test_cases: list[TestCase]
+
     def __init__(
         self,
         name: str,
@@ -20,6 +22,9 @@ class TestSuite:
 
 
 class TestCase:
+    elapsed_sec: float | None
+    is_enabled: bool
+
     def __init__(
         self,
         name: str,
@@ -48,5 +53,9 @@ class TestCase:
 
     def add_skipped_info(self, message: str | None = ..., output: str | None = ...) -> None: ...
 
+    def is_failure(self) -> bool: ...
+
+    def is_error(self) -> bool: ...
+
 
 def to_xml_report_string(test_suites: list[TestSuite], prettyprint: bool = ..., encoding: str | None = ...) -> str: ...
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from checkov.kubernetes.graph_builder.graph_components.blocks import (
+    KubernetesBlock,
+    KubernetesBlockMetadata,
+    KubernetesSelector,
+)
+from checkov.kubernetes.graph_builder.graph_components.edge_builders.KeywordEdgeBuilder import KeywordEdgeBuilder
+from checkov.kubernetes.graph_builder.graph_components.edge_builders.LabelSelectorEdgeBuilder import (
+    LabelSelectorEdgeBuilder,
+)
+from checkov.kubernetes.graph_builder.graph_components.edge_builders.NetworkPolicyEdgeBuilder import (
+    NetworkPolicyEdgeBuilder,
+)
+from checkov.kubernetes.graph_builder.local_graph import KubernetesLocalGraph
+
+OBJECTS_NUMBER = 100_000
+EDGE_BUILDERS = (LabelSelectorEdgeBuilder, KeywordEdgeBuilder, NetworkPolicyEdgeBuilder)
+
+
+def create_block(kind, name, attributes, labels=None, match_labels=None):
+    attributes = {"kind": kind, "resource_type": kind, "metadata.name": name, **attributes}
+    return KubernetesBlock(
+        block_name=f"{kind}.default.{name}",
+        resource_type=kind,
+        config={},
+        path="/generated/manifests.yaml",
+        attributes=attributes,
+        metadata=KubernetesBlockMetadata(KubernetesSelector(match_labels), labels, name),
+    )
+
+
+def create_synthetic_vertices(objects_number):
+    # mimics rendered Helm charts, where every app consists of a few objects connected by labels and names
+    vertices = []
+    for idx in range(objects_number):
+        app_idx = idx // 6
+        app = f"app-{app_idx}"
+        labels = {"app": app, "tier": f"tier-{idx % 3}", "release": "prod"}
+        kind_idx = idx % 6
+        if kind_idx == 0:
+            vertices.append(create_block("Deployment", f"deployment-{idx}", {}, labels, {"app": app}))
+        elif kind_idx == 1:
+            vertices.append(create_block("Pod", f"pod-{idx}", {"spec.serviceAccountName": f"sa-{app}"}, labels))
+        elif kind_idx == 2:
+            vertices.append(create_block("Service", f"service-{idx}", {}, labels, {"app": app, "tier": "tier-1"}))
+        elif kind_idx == 3:
+            # a few network policies without labels apply to all pods
+            match_labels = {"app": app} if app_idx % 10_000 else {}
+            attributes = {"spec": {"podSelector": {"matchLabels": match_labels}}}
+            vertices.append(create_block("NetworkPolicy", f"policy-{idx}", attributes, labels))
+        elif kind_idx == 4:
+            vertices.append(create_block("ServiceAccount", f"sa-{app}", {}, labels))
+        else:
+            attributes = {
+                "roleRef.name": f"role-{app}",
+                "roleRef.kind": "Role",
+                "subjects": [{"name": f"sa-{app}", "kind": "ServiceAccount", "namespace": "default"}],
+                "subjects.0.name": f"sa-{app}",
+                "subjects.0.kind": "ServiceAccount",
+                "subjects.0.namespace": "default",
+            }
+            vertices.append(create_block("RoleBinding", f"binding-{idx}", attributes, labels))
+
+    return vertices
+
+
+def create_edges(vertices):
+    local_graph = KubernetesLocalGraph({})
+    local_graph.vertices = vertices
+    local_graph._create_edges()
+    return local_graph.edges
+
+
+def test_indexed_connections_equal_find_connections():
+    vertices = create_synthetic_vertices(3_000)
+
+    for edge_builder in EDGE_BUILDERS:
+        index = edge_builder.create_index(vertices)
+        for vertex in vertices:
+            if edge_builder.should_search_for_edges(vertex):
+                expected = edge_builder.find_connections(vertex, vertices)
+                assert edge_builder.find_indexed_connections(vertex, vertices, index) == expected
+
+
+@pytest.mark.benchmark(
+    group="kubernetes-edges-performance-tests",
+    min_rounds=1,
+    warmup=False,
+    timer=time.time,
+)
+def test_create_edges_performance(benchmark):
+    vertices = create_synthetic_vertices(OBJECTS_NUMBER)
+
+    edges = benchmark(create_edges, vertices)
+    assert edges
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import CodeBlockReference, Record
+from checkov.common.output.report import Report
+
+FILES_NUMBER = 1_000
+RESOURCES_PER_FILE = 100
+CHECKS_PER_RESOURCE = 10  # results in 1M records
+RESOURCE_LINES = 10
+
+
+@pytest.fixture(scope="module")
+def source_files(tmp_path_factory: pytest.TempPathFactory) -> list[str]:
+    source_dir = tmp_path_factory.mktemp("record_memory")
+    resource = 'resource "aws_s3_bucket" "bucket" {\n  bucket = "bucket"\n  acl    = "private"\n}\n'
+    resource += "\n" * (RESOURCE_LINES - resource.count("\n"))
+
+    file_paths = []
+    for idx in range(FILES_NUMBER):
+        file_path = source_dir / f"main_{idx}.tf"
+        file_path.write_text(resource * RESOURCES_PER_FILE)
+        file_paths.append(str(file_path))
+    return file_paths
+
+
+def create_report(file_paths: list[str]) -> Report:
+    report = Report("terraform")
+    for file_path in file_paths:
+        for resource_idx in range(RESOURCES_PER_FILE):
+            start_line = resource_idx * RESOURCE_LINES + 1
+            for check_idx in range(CHECKS_PER_RESOURCE):
+                report.add_record(
+                    Record(
+                        check_id=f"CKV_AWS_{check_idx}",
+                        bc_check_id=f"BC_AWS_{check_idx}",
+                        check_name=f"Ensure check {check_idx} passes",
+                        check_result={"result": CheckResult.FAILED, "evaluated_keys": ["acl"]},
+                        code_block=CodeBlockReference(file_path, start_line, start_line + 3),
+                        file_path=f"/{Path(file_path).name}",
+                        file_line_range=[start_line, start_line + 3],
+                        resource=f"aws_s3_bucket.bucket_{resource_idx}",
+                        evaluations=None,
+                        check_class=f"checkov.terraform.checks.resource.aws.Check{check_idx}",
+                        file_abs_path=os.path.abspath(file_path),
+                    )
+                )
+    return report
+
+
+def test_record_memory(source_files: list[str]):
+    tracemalloc.start()
+    start = time.perf_counter()
+    report = create_report(source_files)
+    duration = time.perf_counter() - start
+    current_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"created {len(report.failed_checks)} records: {duration:.3f}s, memory {current_memory / 1024 / 1024:.1f} MB")
+    assert report.failed_checks[0].code_block[0] == (1, 'resource "aws_s3_bucket" "bucket" {\n')
+
+
+@pytest.mark.benchmark(
+    group="record-performance-tests",
+    min_rounds=1,
+    warmup=False,
+    timer=time.time,
+)
+def test_record_performance(benchmark, source_files: list[str]):
+    benchmark(create_report, source_files)
@@ -0,0 +1,92 @@
+import copy
+import time
+import tracemalloc
+
+import pytest
+
+from checkov.terraform.parser import Parser
+
+RESOURCES_NUMBER = 5_000
+
+
+def create_large_tf_definitions():
+    # mimics a big generated .tf.json file, which mainly consists of resources with nested policy documents
+    resources = []
+    for idx in range(RESOURCES_NUMBER):
+        resources.append(
+            {
+                "aws_iam_policy": {
+                    f"policy_{idx}": {
+                        "name": [f"policy-{idx}"],
+                        "tags": [{"Name": f"policy-{idx}", "Environment": "prod", "Generated": "true"}],
+                        "policy": [
+                            {
+                                "Version": "2012-10-17",
+                                "Statement": [
+                                    {
+                                        "Effect": "Allow",
+                                        "Action": ["s3:PutObject", "s3:GetObject", "s3:ListBucket"],
+                                        "Resource": [f"arn:aws:s3:::bucket-{idx}", f"arn:aws:s3:::bucket-{idx}/*"],
+                                        "Condition": {"Bool": {"aws:SecureTransport": "false"}},
+                                    }
+                                ],
+                            }
+                        ],
+                        "__start_line__": idx * 20 + 1,
+                        "__end_line__": idx * 20 + 20,
+                    }
+                }
+            }
+        )
+
+    return {"/generated/main.tf.json": {"resource": resources}}
+
+
+def serialize_and_clean(tf_definitions):
+    return Parser._clean_parser_types(Parser._serialize_definitions(tf_definitions))
+
+
+def measure(func, tf_definitions):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(tf_definitions)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak_memory
+
+
+def test_normalize_definitions_equals_serialize_and_clean():
+    tf_definitions = create_large_tf_definitions()
+
+    expected, old_duration, old_peak_memory = measure(serialize_and_clean, copy.deepcopy(tf_definitions))
+    actual, new_duration, new_peak_memory = measure(Parser._normalize_definitions, copy.deepcopy(tf_definitions))
+
+    print(
+        f"serialize and clean: {old_duration:.3f}s, peak memory {old_peak_memory / 1024 / 1024:.1f} MB\n"
+        f"normalize: {new_duration:.3f}s, peak memory {new_peak_memory / 1024 / 1024:.1f} MB"
+    )
+    assert actual == expected
+    assert new_peak_memory < old_peak_memory
+
+
+@pytest.mark.benchmark(
+    group="terraform-normalization-performance-tests",
+    min_rounds=5,
+    warmup=False,
+)
+def test_serialize_and_clean_performance(benchmark):
+    tf_definitions = create_large_tf_definitions()
+
+    benchmark(serialize_and_clean, tf_definitions)
+
+
+@pytest.mark.benchmark(
+    group="terraform-normalization-performance-tests",
+    min_rounds=5,
+    warmup=False,
+)
+def test_normalize_definitions_performance(benchmark):
+    tf_definitions = create_large_tf_definitions()
+
+    benchmark(Parser._normalize_definitions, tf_definitions)
@@ -0,0 +1,83 @@
+import time
+import tracemalloc
+
+import pytest
+
+from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.terraform.graph_manager import TerraformGraphManager
+
+RESOURCES_NUMBER = 1_000
+
+
+def create_tf_definitions():
+    # mimics a big generated module, where every resource has a nested policy document with rendered references
+    resources = []
+    for idx in range(RESOURCES_NUMBER):
+        resources.append(
+            {
+                "aws_iam_policy": {
+                    f"policy_{idx}": {
+                        "name": [f"${{var.prefix}}-policy-{idx}"],
+                        "tags": [{"Name": f"policy-{idx}", "Environment": "${var.environment}", "Generated": "true"}],
+                        "policy": [
+                            {
+                                "Version": "2012-10-17",
+                                "Statement": [
+                                    {
+                                        "Effect": "Allow",
+                                        "Action": ["s3:PutObject", "s3:GetObject", "s3:ListBucket"],
+                                        "Resource": [f"arn:aws:s3:::bucket-{idx}", f"arn:aws:s3:::bucket-{idx}/*"],
+                                        "Condition": {"Bool": {"aws:SecureTransport": "false"}},
+                                    }
+                                    for _ in range(10)
+                                ],
+                            }
+                        ],
+                        "__start_line__": idx * 20 + 1,
+                        "__end_line__": idx * 20 + 20,
+                    }
+                }
+            }
+        )
+
+    return {
+        "/generated/main.tf": {
+            "variable": [
+                {"prefix": {"default": ["generated"], "__start_line__": 1, "__end_line__": 3}},
+                {"environment": {"default": ["prod"], "__start_line__": 4, "__end_line__": 6}},
+            ],
+            "resource": resources,
+        }
+    }
+
+
+def build_graph(tf_definitions):
+    return TerraformGraphManager(db_connector=NetworkxConnector()).build_graph_from_definitions(tf_definitions)
+
+
+def test_build_graph_memory():
+    tf_definitions = create_tf_definitions()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    local_graph = build_graph(tf_definitions)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"build and render graph: {duration:.3f}s, peak memory {peak_memory / 1024 / 1024:.1f} MB")
+    resource = next(vertex for vertex in local_graph.vertices if vertex.name == "aws_iam_policy.policy_0")
+    assert resource.attributes["name"] == ["generated-policy-0"]
+    assert resource.attributes["tags"] == {"Name": "policy-0", "Environment": "prod", "Generated": "true"}
+
+
+@pytest.mark.benchmark(
+    group="terraform-rendering-performance-tests",
+    min_rounds=1,
+    warmup=False,
+    timer=time.time,
+)
+def test_build_graph_performance(benchmark):
+    tf_definitions = create_tf_definitions()
+
+    benchmark(build_graph, tf_definitions)
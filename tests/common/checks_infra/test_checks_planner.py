@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from checkov.common.checks_infra.checks_planner import GraphChecksPlan
+from checkov.common.checks_infra.registry import get_graph_checks_registry
+from checkov.common.graph.db_connectors.igraph.igraph_db_connector import IgraphConnector
+from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.common.graph.graph_builder import CustomAttributes
+from checkov.terraform.graph_manager import TerraformGraphManager
+
+RESOURCES_DIR = Path(__file__).parent.parent.parent / "terraform/graph/resources"
+
+
+@pytest.fixture(scope="module")
+def terraform_checks():
+    registry = get_graph_checks_registry("terraform")
+    registry.load_checks()
+    return registry.checks
+
+
+def build_graph(db_connector):
+    graph_manager = TerraformGraphManager(db_connector=db_connector)
+    local_graph, _ = graph_manager.build_graph_from_source_directory(str(RESOURCES_DIR / "public_virtual_machines"))
+    return graph_manager.save_graph(local_graph)
+
+
+def get_ids(results):
+    return [[vertex[CustomAttributes.ID] for vertex in vertices] for vertices in results]
+
+
+@pytest.mark.parametrize("db_connector_class", [NetworkxConnector, IgraphConnector])
+def test_plan_results_equal_single_check_runs(terraform_checks, db_connector_class):
+    # given
+    graph = build_graph(db_connector_class())
+    plan = GraphChecksPlan(terraform_checks)
+
+    # when
+    plan_results = plan.run(graph)
+
+    # then
+    assert plan.vertex_checks
+    assert plan.other_checks
+    assert len(plan.vertex_checks) + len(plan.other_checks) == len(terraform_checks)
+    assert any(any(results) for results in plan_results.values())
+    for check in plan.vertex_checks:
+        # the networkx solvers don't keep the vertex order, because they evaluate the vertices in threads
+        expected = [sorted(ids) for ids in get_ids(check.run(graph))]
+        assert [sorted(ids) for ids in get_ids(plan_results[check])] == expected, check.id
+
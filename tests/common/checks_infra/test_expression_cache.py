@@ -0,0 +1,118 @@
+import re
+
+import pytest
+
+from checkov.common.checks_infra.checks_parser import GraphCheckParser
+from checkov.common.checks_infra.expression_cache import ExpressionCache, expression_cache
+
+
+def test_get_regex_is_cached():
+    # given
+    cache = ExpressionCache()
+
+    # when
+    first = cache.get_regex("^abc.*$")
+    second = cache.get_regex("^abc.*$")
+
+    # then
+    assert first is second
+    assert cache.get_stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_invalid_regex_is_not_cached():
+    # given
+    cache = ExpressionCache()
+
+    # when/then
+    with pytest.raises(re.error):
+        cache.get_regex("[abc")
+    assert cache.get_stats()["size"] == 0
+
+
+def test_cache_is_bounded():
+    # given
+    cache = ExpressionCache(max_size=2)
+
+    # when
+    cache.get_regex("a")
+    cache.get_regex("b")
+    cache.get_regex("a")
+    cache.get_regex("c")
+
+    # then
+    stats = cache.get_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    # "b" was the least recently used one
+    cache.get_regex("a")
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_attribute_patterns():
+    # given
+    cache = ExpressionCache()
+
+    # when
+    pattern_with_index, pattern_without_index = cache.get_attribute_patterns("tags.*.key")
+
+    # then
+    assert cache.is_wildcard_attribute("tags.*.key")
+    assert not cache.is_wildcard_attribute("tags.key")
+    assert pattern_with_index.match("tags.0.key")
+    assert pattern_without_index.match("tags.key")
+
+
+def test_parser_compiles_solver_expressions():
+    # given
+    raw_check = {
+        "metadata": {"id": "CUSTOM_1", "name": "test", "category": "GENERAL_SECURITY"},
+        "definition": {
+            "cond_type": "attribute",
+            "resource_types": ["aws_s3_bucket"],
+            "attribute": "bucket",
+            "operator": "regex_match",
+            "value": "^compiled-by-parser-[0-9]+$",
+        },
+    }
+
+    # when
+    GraphCheckParser().parse_raw_check(raw_check)
+
+    # then
+    misses = expression_cache.get_stats()["misses"]
+    expression_cache.get_regex("^compiled-by-parser-[0-9]+$")
+    assert expression_cache.get_stats()["misses"] == misses
+
+
+def test_solver_evaluation_uses_compiled_expressions():
+    # given
+    raw_check = {
+        "metadata": {"id": "CUSTOM_2", "name": "test", "category": "GENERAL_SECURITY"},
+        "definition": {
+            "cond_type": "attribute",
+            "resource_types": ["aws_s3_bucket"],
+            "attribute": "tags.*",
+            "operator": "regex_match",
+            "value": "^team-[a-z]+$",
+        },
+    }
+    check = GraphCheckParser().parse_raw_check(raw_check)
+    solver = check.solver
+    vertex = {
+        "resource_type": "aws_s3_bucket",
+        "block_type_": "resource",
+        "source_": "Terraform",
+        "tags": ["team-a"],
+        "tags.0": "team-a",
+    }
+
+    # when
+    stats = expression_cache.get_stats()
+    result = solver.get_operation(vertex)
+
+    # then
+    assert result is True
+    assert solver.regex is not None
+    assert solver.is_wildcard_attribute is True
+    assert solver.attribute_patterns is not None
+    assert expression_cache.get_stats() == stats
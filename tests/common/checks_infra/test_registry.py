@@ -1,8 +1,18 @@
 import os
 import unittest
+from pathlib import Path
+from unittest import mock
 
-from checkov.common.checks_infra.registry import Registry
+from checkov.common.checks_infra.registry import Registry, get_graph_checks_registry
 from checkov.common.checks_infra.checks_parser import GraphCheckParser
+from checkov.common.checks_infra.checks_planner import GraphChecksPlan
+from checkov.common.graph.checks_infra.registry import BaseRegistry
+from checkov.common.graph.db_connectors.igraph.igraph_db_connector import IgraphConnector
+from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.common.graph.graph_builder import CustomAttributes
+from checkov.common.parallelizer.parallel_runner import ParallelRunner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.graph_manager import TerraformGraphManager
 
 
 class TestRegistry(unittest.TestCase):
@@ -17,3 +27,56 @@ class TestRegistry(unittest.TestCase):
         test_files_dir = current_dir + "/test-registry-data/valid-yaml-invalid-check"
         r = Registry(checks_dir=test_files_dir, parser=GraphCheckParser())
         r.load_checks()
+
+    def test_run_checks_multiprocess(self):
+        source_dir = Path(__file__).parent.parent.parent / "terraform/graph/resources/public_virtual_machines"
+        registry = get_graph_checks_registry("terraform")
+        registry.load_checks()
+        runner_filter = RunnerFilter(framework=["terraform"])
+
+        for db_connector in (NetworkxConnector(), IgraphConnector()):
+            graph_manager = TerraformGraphManager(db_connector=db_connector)
+            local_graph, _ = graph_manager.build_graph_from_source_directory(str(source_dir))
+            graph = graph_manager.save_graph(local_graph)
+
+            thread_results = BaseRegistry.run_checks(registry, graph, runner_filter, "terraform")
+            with mock.patch.dict(os.environ, {"RUN_GRAPH_CHECKS_MULTIPROCESS": "true"}):
+                multiprocess_results = registry.run_checks(graph, runner_filter, "terraform")
+
+            self.assertEqual(self._get_results(thread_results), self._get_results(multiprocess_results))
+            # the results of the forked processes are resolved to the vertices of the graph
+            graph_vertices = list(graph.vs["attr"]) if isinstance(db_connector, IgraphConnector) \
+                else [data for _, data in graph.nodes(data=True)]
+            vertex_ids = {id(vertex) for vertex in graph_vertices}
+            for results in multiprocess_results.values():
+                for result in results:
+                    self.assertIn(id(result["entity"]), vertex_ids)
+
+    def test_run_plan_multiprocess_with_vertex_shards(self):
+        source_dir = Path(__file__).parent.parent.parent / "terraform/graph/resources/public_virtual_machines"
+        registry = get_graph_checks_registry("terraform")
+        registry.load_checks()
+        graph_manager = TerraformGraphManager(db_connector=NetworkxConnector())
+        local_graph, _ = graph_manager.build_graph_from_source_directory(str(source_dir))
+        graph = graph_manager.save_graph(local_graph)
+        plan = GraphChecksPlan(registry.checks)
+
+        with mock.patch("checkov.common.checks_infra.registry.PARALLEL_EVALUATION_MIN_VERTICES", 1), \
+                mock.patch("checkov.common.checks_infra.registry.parallel_runner", ParallelRunner(workers_number=3)):
+            sharded_results = Registry.run_plan_multiprocess(plan, graph)
+
+        self.assertEqual(
+            {check.id: self._get_vertex_ids(results) for check, results in sharded_results.items()},
+            {check.id: self._get_vertex_ids(results) for check, results in plan.run(graph).items()},
+        )
+
+    @staticmethod
+    def _get_vertex_ids(results):
+        return [[vertex[CustomAttributes.ID] for vertex in vertices] for vertices in results]
+
+    @staticmethod
+    def _get_results(check_results):
+        return {
+            check.id: sorted((result["result"].name, result["entity"][CustomAttributes.ID]) for result in results)
+            for check, results in check_results.items()
+        }
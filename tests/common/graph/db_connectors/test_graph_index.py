@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from checkov.common.checks_infra.solvers import (
+    ConnectionExistsSolver,
+    EqualsAttributeSolver,
+    ExistsAttributeSolver,
+    OrSolver,
+)
+from checkov.common.graph.db_connectors.graph_index import GRAPH_INDEX_ATTRIBUTE, get_graph_index
+from checkov.common.graph.db_connectors.igraph.igraph_db_connector import IgraphConnector
+from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.common.graph.graph_builder import CustomAttributes
+from checkov.terraform.graph_manager import TerraformGraphManager
+
+RESOURCES_DIR = Path(__file__).parent.parent.parent.parent / "terraform/graph/resources"
+
+
+def build_graph(db_connector, source_dir):
+    graph_manager = TerraformGraphManager(db_connector=db_connector)
+    local_graph, _ = graph_manager.build_graph_from_source_directory(str(source_dir), render_variables=True)
+    return graph_manager.save_graph(local_graph)
+
+
+def remove_graph_index(graph):
+    if isinstance(graph, nx.DiGraph):
+        del graph.graph[GRAPH_INDEX_ATTRIBUTE]
+    else:
+        del graph[GRAPH_INDEX_ATTRIBUTE]
+
+
+def get_ids(vertices):
+    return sorted(vertex[CustomAttributes.BLOCK_NAME] for vertex in vertices)
+
+
+@pytest.mark.parametrize("db_connector_class", [NetworkxConnector, IgraphConnector])
+def test_graph_index_lookup(db_connector_class):
+    # given
+    graph = build_graph(db_connector_class(), RESOURCES_DIR / "output_example")
+
+    # when
+    graph_index = get_graph_index(graph)
+
+    # then
+    assert graph_index is not None
+    assert get_ids(graph_index.get_vertices(resource_types=["aws_subnet"])) == ["aws_subnet.my_subnet"]
+    assert get_ids(graph_index.get_vertices(resource_types=["aws_subnet", "unknown"], block_types=["resource"])) == [
+        "aws_subnet.my_subnet"
+    ]
+    assert graph_index.get_vertices(resource_types=["aws_subnet"], block_types=["output"]) == []
+    assert get_ids(graph_index.get_vertices(block_types=["module"])) == ["submodule"]
+    assert len(graph_index.get_vertices()) == len(graph_index.vertices)
+
+
+@pytest.mark.parametrize("db_connector_class", [NetworkxConnector, IgraphConnector])
+def test_graph_index_is_not_used_for_subgraphs(db_connector_class):
+    # given
+    graph = build_graph(db_connector_class(), RESOURCES_DIR / "output_example")
+    graph_index = get_graph_index(graph)
+
+    # when
+    subgraph = graph.subgraph(graph_index.get_vertex_keys(resource_types=["aws_subnet"]))
+
+    # then
+    assert get_graph_index(subgraph) is None
+
+
+@pytest.mark.parametrize("db_connector_class", [NetworkxConnector, IgraphConnector])
+@pytest.mark.parametrize(
+    "solver",
+    [
+        EqualsAttributeSolver(["aws_subnet"], "map_public_ip_on_launch", True),
+        ExistsAttributeSolver([], "vpc_id", None),
+        OrSolver(
+            [
+                ExistsAttributeSolver(["aws_instance"], "subnet_id", None),
+                ExistsAttributeSolver(["aws_instance"], "security_groups", None),
+            ],
+            ["aws_instance"],
+        ),
+        ConnectionExistsSolver(["aws_instance"], ["aws_security_group"]),
+        ConnectionExistsSolver(["aws_instance"], ["aws_db_security_group"]),
+    ],
+    ids=["attribute", "attribute_without_resource_types", "complex", "connection", "missing_connection"],
+)
+def test_solvers_with_graph_index_equal_full_scan(db_connector_class, solver):
+    # given
+    graph = build_graph(db_connector_class(), RESOURCES_DIR / "public_virtual_machines")
+    assert get_graph_index(graph) is not None
+
+    # when
+    indexed_results = solver.run(graph)
+    remove_graph_index(graph)
+    full_scan_results = solver.run(graph)
+
+    # then
+    assert [get_ids(vertices) for vertices in indexed_results] == [get_ids(vertices) for vertices in full_scan_results]
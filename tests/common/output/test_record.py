@@ -1,6 +1,10 @@
+import pickle
+from pathlib import Path
+
 import pytest
 
-from checkov.common.output.record import Record
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import CodeBlockReference, Record
 
 
 @pytest.mark.parametrize(
@@ -15,3 +19,28 @@ from checkov.common.output.record import Record
 )
 def test_determine_repo_file_path(input_path: str, expected_path: str):
     assert Record._determine_repo_file_path(input_path) == expected_path
+
+
+def test_code_block_reference():
+    # given
+    test_file = Path(__file__).parent / "fixtures/main.tf"
+    record = Record(
+        check_id="CKV_AWS_21",
+        check_name="Ensure all data stored in the S3 bucket have versioning enabled",
+        check_result={"result": CheckResult.FAILED},
+        code_block=CodeBlockReference(str(test_file), 1, 2),
+        file_path="/main.tf",
+        file_line_range=[1, 2],
+        resource="aws_s3_bucket.destination",
+        evaluations=None,
+        check_class="checkov.terraform.checks.resource.aws.S3Versioning",
+        file_abs_path=str(test_file),
+    )
+
+    # then
+    lines = test_file.read_text().splitlines(keepends=True)
+    assert record.code_block == [(1, lines[0]), (2, lines[1])]
+    assert record.to_dict()["code_block"] == [(1, lines[0]), (2, lines[1])]
+
+    # the code block is kept when the record is sent to another process
+    assert pickle.loads(pickle.dumps(record)).code_block == record.code_block
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from checkov.common.output.report import Report
+from checkov.common.output.report_writer import JsonReportWriter, JUnitXmlReportWriter, ReportWriter, \
+    SarifReportWriter
+from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.runner import Runner as TerraformRunner
+
+
+@pytest.fixture(scope="module")
+def reports() -> list[Report]:
+    test_file = Path(__file__).parent / "fixtures/main.tf"
+    checks = ["CKV_AWS_18", "CKV_AWS_19", "CKV_AWS_21"]  # 1 pass, 1 fail, 1 skip
+    report = TerraformRunner().run(root_folder="", files=[str(test_file)], runner_filter=RunnerFilter(checks=checks))
+
+    other_report = Report("terraform")
+    other_report.failed_checks = report.failed_checks[:]
+    other_report.skipped_checks = report.skipped_checks[:]
+
+    return [report, other_report]
+
+
+def write_reports(writer: ReportWriter, reports: list[Report]) -> str:
+    for report in reports:
+        writer.write_report(report)
+    writer.close()
+
+    return writer.stream.getvalue()
+
+
+@pytest.mark.parametrize("reports_number", [0, 1, 2])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_json_report_writer(reports: list[Report], reports_number: int, indent: int | None):
+    # given
+    reports = reports[:reports_number]
+
+    # when
+    output = write_reports(JsonReportWriter(stream=io.StringIO(), reports_number=reports_number, indent=indent), reports)
+
+    # then
+    expected_output = [report.get_dict() for report in reports]
+    if reports_number == 0:
+        expected_output = Report("").get_summary()
+    elif reports_number == 1:
+        expected_output = expected_output[0]
+    assert output == json.dumps(expected_output, indent=indent, cls=CustomJSONEncoder)
+
+
+def test_json_report_writer_compact(reports: list[Report]):
+    # when
+    output = write_reports(JsonReportWriter(stream=io.StringIO(), reports_number=2, compact=True), reports)
+
+    # then
+    for report_json in json.loads(output):
+        for result in report_json["results"].values():
+            assert all(check["code_block"] is None for check in result)
+
+
+@pytest.mark.parametrize("reports_number", [0, 1, 2])
+def test_junit_xml_report_writer(reports: list[Report], reports_number: int):
+    # given
+    reports = reports[:reports_number]
+    properties = {"framework": "terraform"}
+
+    # when
+    output = write_reports(JUnitXmlReportWriter(stream=io.StringIO(), properties=properties), reports)
+
+    # then
+    test_suites = [report.get_test_suite(properties=properties) for report in reports]
+    if not test_suites:
+        test_suites = [Report("").get_test_suite(properties=properties)]
+    assert output == Report.get_junit_xml_string(test_suites)
+
+
+def test_sarif_report_writer(reports: list[Report]):
+    # when
+    output = write_reports(SarifReportWriter(stream=io.StringIO(), tool="Checkov"), reports)
+
+    # then
+    sarif_json = json.loads(output)
+    run = sarif_json["runs"][0]
+    expected_run = reports[0].get_sarif_json("Checkov")["runs"][0]
+
+    assert sarif_json["version"] == "2.1.0"
+    assert run["tool"] == expected_run["tool"]
+    assert run["results"] == expected_run["results"] * 2
@@ -0,0 +1,28 @@
+from checkov.common.parallelizer.parallel_runner import ParallelRunner
+
+
+def test_group_items_by_weight():
+    # given
+    items = [1, 2, 3, 4, 5, 100]
+
+    # when
+    groups = ParallelRunner._group_items_by_weight(items, item_weight=lambda item: item, groups_number=3)
+
+    # then
+    assert groups == [[100], [5, 2, 1], [4, 3]]
+
+
+def test_group_items_by_weight_with_less_items_than_groups():
+    # when
+    groups = ParallelRunner._group_items_by_weight([1, 2], item_weight=lambda item: item, groups_number=4)
+
+    # then
+    assert groups == [[2], [1]]
+
+
+def test_run_function_with_item_weight():
+    # when
+    results = ParallelRunner(workers_number=2).run_function(lambda x: x * 2, [1, 2, 3, 40], item_weight=lambda x: x)
+
+    # then
+    assert sorted(results) == [2, 4, 6, 80]
@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+
+from checkov.common.util.content_cache import ContentCache, compute_content_hash
+
+
+def test_get_and_put(tmp_path: Path):
+    # given
+    cache = ContentCache(cache_dir=str(tmp_path), namespace=ContentCache.build_namespace("test", "1.0"))
+    key = compute_content_hash(b"resource {}")
+
+    # when
+    missing = cache.get(key)
+    cache.put(key, {"resource": [{"aws_s3_bucket": {"example": {}}}]})
+    found = cache.get(key)
+
+    # then
+    assert missing is None
+    assert found == {"resource": [{"aws_s3_bucket": {"example": {}}}]}
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_stale_namespace_is_removed(tmp_path: Path):
+    # given
+    old_cache = ContentCache(cache_dir=str(tmp_path), namespace=ContentCache.build_namespace("test", "1.0"))
+    old_cache.put("abc", [1, 2, 3])
+
+    # when
+    new_cache = ContentCache(cache_dir=str(tmp_path), namespace=ContentCache.build_namespace("test", "2.0"))
+
+    # then
+    assert not os.path.exists(old_cache.namespace_dir)
+    assert new_cache.get("abc") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path):
+    # given
+    cache = ContentCache(cache_dir=str(tmp_path), namespace="test-1", max_size=1000)
+    cache.put("first", "a" * 400)
+    cache.put("second", "b" * 400)
+    os.utime(cache._get_entry_path("first"), (1, 1))  # make it the oldest entry
+
+    # when
+    cache.put("third", "c" * 400)
+
+    # then
+    assert cache.get("first") is None
+    assert cache.get("second") == "b" * 400
+    assert cache.get("third") == "c" * 400
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["size"] <= 1000
+
+
+def test_corrupted_entry_is_treated_as_miss(tmp_path: Path):
+    # given
+    cache = ContentCache(cache_dir=str(tmp_path), namespace="test-1")
+    Path(cache._get_entry_path("broken")).write_bytes(b"not a json")
+
+    # when
+    payload = cache.get("broken")
+
+    # then
+    assert payload is None
+    assert not os.path.exists(cache._get_entry_path("broken"))
+
+
+def test_non_json_payload_is_not_cached(tmp_path: Path):
+    # given
+    cache = ContentCache(cache_dir=str(tmp_path), namespace="test-1")
+
+    # when
+    cache.put("tuple", {"resource": ("a", "b")})
+    cache.put("object", {"resource": object()})
+
+    # then
+    assert cache.get("tuple") is None
+    assert cache.get("object") is None
+    assert cache.get_stats()["size"] == 0
@@ -0,0 +1,68 @@
+import json
+import pickle
+from pathlib import Path
+
+from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.common.util.source_file_store import CodeBlockReference, SourceFileStore, source_file_store
+
+
+def test_get_lines_like_text_mode(tmp_path: Path):
+    # given
+    test_file = tmp_path / "main.tf"
+    test_file.write_bytes(b'resource "aws_s3_bucket" "example" {\r\n  bucket = "b\xc3\xbccket"\r\n\n}')
+    store = SourceFileStore()
+
+    # when
+    lines = store.get_file_lines(str(test_file))
+
+    # then
+    with open(test_file, encoding="utf-8") as file:
+        expected_lines = [(idx + 1, line) for idx, line in enumerate(file.readlines())]
+    assert lines == expected_lines
+    assert store.get_lines(str(test_file), 2, 3) == expected_lines[1:3]
+    assert store.get_lines(str(test_file), 3, 10) == expected_lines[2:]
+    assert store.get_lines(str(test_file), 3, 2) == []
+
+
+def test_get_lines_of_empty_and_missing_files(tmp_path: Path):
+    # given
+    empty_file = tmp_path / "empty.tf"
+    empty_file.write_text("")
+    store = SourceFileStore()
+
+    # then
+    assert store.get_file_lines(str(empty_file)) == []
+    assert store.get_lines(str(tmp_path / "missing.tf"), 1, 5) == []
+
+
+def test_modified_file_is_reindexed(tmp_path: Path):
+    # given
+    test_file = tmp_path / "main.tf"
+    test_file.write_text("locals {\n}\n")
+    store = SourceFileStore(max_open_files=1)
+    store.get_file_lines(str(test_file))
+
+    # when
+    test_file.write_text("locals {\n  a = 1\n}\n")
+
+    # then
+    assert store.get_file_lines(str(test_file)) == [(1, "locals {\n"), (2, "  a = 1\n"), (3, "}\n")]
+
+
+def test_code_block_reference(tmp_path: Path):
+    # given
+    test_file = tmp_path / "main.tf"
+    test_file.write_text('resource "aws_s3_bucket" "example" {\n  bucket = "bucket"\n}\n')
+    reference = CodeBlockReference(str(test_file), 2, 3)
+    expected_lines = [(2, '  bucket = "bucket"\n'), (3, "}\n")]
+
+    # then
+    assert reference == expected_lines
+    assert list(reference) == expected_lines
+    assert len(reference) == 2
+    assert reference[-1] == (3, "}\n")
+    assert reference[:1] == expected_lines[:1]
+    assert not CodeBlockReference(str(test_file), 1, 0)
+    assert pickle.loads(pickle.dumps(reference)) == reference
+    assert json.loads(json.dumps(reference, cls=CustomJSONEncoder)) == [list(line) for line in expected_lines]
+    assert source_file_store.get_line_count(str(test_file)) == 3
@@ -195,6 +195,33 @@ class TestKubernetesLocalGraph(TestGraph):
         self.assertEqual(0, len(local_graph.vertices))
         self.assertEqual(0, len(local_graph.edges))
 
+    def test_indexed_connections_equal_find_connections(self) -> None:
+        resources_dir = os.path.join(TEST_DIRNAME, "resources")
+        definitions = {}
+        for relative_file_path in (
+            "Keyword/clusterrolebinding.yaml",
+            "Keyword/network-policy-attached.yaml",
+            "Keyword/pod_service_account.yaml",
+            "LabelSelector/label_selector_match.yaml",
+            "LabelSelector/label_selector_multiple_resources.yaml",
+            "LabelSelector/label_selector_non_match.yaml",
+            "faulty_resources/incompatible_clusterrolebinding.yaml",
+            "faulty_resources/incompatible_selector.yaml",
+        ):
+            (definitions[relative_file_path], _) = parse(os.path.join(resources_dir, relative_file_path))
+        graph_flags = K8sGraphFlags(create_complex_vertices=True, create_edges=False)
+
+        local_graph = KubernetesLocalGraph(definitions)
+        local_graph.build_graph(render_variables=False, graph_flags=graph_flags)
+        for edge_builder in local_graph.edge_builders:
+            index = edge_builder.create_index(local_graph.vertices)
+            for vertex in local_graph.vertices:
+                if edge_builder.should_search_for_edges(vertex):
+                    self.assertEqual(
+                        edge_builder.find_connections(vertex, local_graph.vertices),
+                        edge_builder.find_indexed_connections(vertex, local_graph.vertices, index),
+                    )
+
     def test_custom_resource_should_not_extract_pod(self) -> None:
         relative_file_path = "resources/custom_resource.yaml"
         definitions = {}
@@ -0,0 +1,14 @@
+# checkov:skip=CKV_AWS_18:outside of any block
+resource "aws_s3_bucket" "first" {
+  # checkov:skip=CKV_AWS_19:first bucket
+  bucket = "first" # checkov:skip=CKV_AWS_20 checkov:skip=CKV_AWS_21
+}
+
+resource "aws_s3_bucket" "second" {
+  bucket = "second"
+}
+
+variable "name" {
+  # bridgecrew:skip=CKV_AWS_52
+  default = "name"
+}
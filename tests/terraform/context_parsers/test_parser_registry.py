@@ -1,6 +1,10 @@
 import unittest
+from pathlib import Path
+from unittest import mock
 
+from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.terraform.context_parsers.registry import parser_registry
+from checkov.terraform.parser import Parser
 from tests.terraform.context_parsers.mock_context_parser import MockContextParser
 import os
 
@@ -21,6 +25,54 @@ class TestScannerRegistry(unittest.TestCase):
         definition_context = parser_registry.enrich_definitions_context(mock_definition)
         self.assertIsNotNone(definition_context[mock_definition[0]]['mock']['mock_type']['mock_name'])
 
+    def test_enrich_definitions_contexts_skip_comments(self):
+        # given
+        test_dir = Path(__file__).parent / "resources/skip_comments"
+        definitions = {}
+        Parser().parse_directory(directory=str(test_dir), out_definitions=definitions)
+        tf_file = str(test_dir / "main.tf")
+
+        # when
+        parser_registry.reset_definitions_context()
+        definitions_context = parser_registry.enrich_definitions_contexts(definitions)
+
+        # then
+        file_context = definitions_context[tf_file]
+        self.assertEqual(
+            file_context["resource"]["aws_s3_bucket"]["first"]["skipped_checks"],
+            [
+                {"id": "CKV_AWS_19", "suppress_comment": "first bucket"},
+                {"id": "CKV_AWS_20", "suppress_comment": "No comment provided"},
+            ],
+        )
+        self.assertEqual(file_context["resource"]["aws_s3_bucket"]["second"]["skipped_checks"], [])
+        self.assertEqual(
+            file_context["variable"]["name"]["skipped_checks"],
+            [{"id": "CKV_AWS_52", "suppress_comment": "No comment provided"}],
+        )
+        self.assertEqual(
+            file_context["resource"]["aws_s3_bucket"]["second"]["code_lines"],
+            [(7, 'resource "aws_s3_bucket" "second" {\n'), (8, '  bucket = "second"\n'), (9, "}\n")],
+        )
+
+    def test_enrich_definitions_contexts_in_parallel(self):
+        # given
+        test_dir = Path(__file__).parent.parent / "runner/resources/example"
+        definitions = {}
+        Parser().parse_directory(directory=str(test_dir), out_definitions=definitions)
+
+        parser_registry.reset_definitions_context()
+        expected_context = parser_registry.enrich_definitions_contexts(definitions)
+
+        # when
+        parser_registry.reset_definitions_context()
+        with mock.patch("checkov.terraform.context_parsers.registry.PARALLEL_CONTEXT_MIN_FILES", 1), \
+                mock.patch.object(parallel_runner, "workers_number", 2):
+            definitions_context = parser_registry.enrich_definitions_contexts(definitions)
+
+        # then
+        self.assertEqual(definitions_context, expected_context)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -44,6 +44,20 @@ class TestParser(TestCase):
         expected = {'enabled_metrics': [[True, False, 'a'], True, False, 'b'], 'example_set': 'Tree(\'data\', [\'child1\', \'child2\'])'}
         self.assertDictEqual(expected, actual)
 
+    def test_normalize_definitions_equals_serialize_and_clean(self):
+        conf = {
+            'enabled_metrics': [['a', 'true', 'false'], 'b', 'true', ('c', 'false')],
+            'example_set': [{'1', '2', '3'}],
+            'example_tree': Tree("data", ["child1", "child2"]),
+            'alias': ['true', 'b', 'a'],
+            'nested': [{'z': 'false', 'a': [1, 'y', 'x', None]}],
+            1: 'int_key',
+        }
+        expected = Parser._clean_parser_types(Parser._serialize_definitions(conf))
+        actual = Parser._normalize_definitions(conf)
+        self.assertEqual(expected, actual)
+        self.assertEqual(list(expected.keys()), list(actual.keys()))
+
     def test_hcl_parsing_consistent_old_new(self):
         cur_dir = os.path.dirname(os.path.realpath(__file__))
         tf_dir = f'{cur_dir}/../resources/tf_parsing_comparison/tf_regular'
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from checkov.terraform.graph_builder.graph_components.block_types import BlockType
+from checkov.terraform.graph_builder.graph_components.blocks import TerraformBlock
+from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
+from checkov.terraform.graph_builder.vertex_lookup import PathTrie, TerraformVertexLookup
+
+
+class TestPathTrie(TestCase):
+    def test_find_longest_match(self):
+        path_trie = PathTrie()
+        path_trie.add("/repo/main.tf", 0)
+        path_trie.add("/repo/modules/s3/main.tf", 1)
+        path_trie.add("/repo/modules/s3/variables.tf", 2)
+
+        self.assertEqual(path_trie.find_longest_match("/repo/modules/s3/variables.tf"), 2)
+        # ties are resolved by the order the vertices were added
+        self.assertEqual(path_trie.find_longest_match("/repo/modules/s3/outputs.tf"), 1)
+        self.assertEqual(path_trie.find_longest_match("/repo/outputs.tf"), 0)
+        self.assertEqual(path_trie.find_longest_match("/other/main.tf"), 0)
+        self.assertEqual(path_trie.find_longest_match("relative/main.tf"), -1)
+
+
+class TestTerraformVertexLookup(TestCase):
+    def test_find_vertex_index(self):
+        local_graph = TerraformLocalGraph(None)
+        for name, path in (
+            ("bucket", "/repo/main.tf"),
+            ("bucket", "/repo/modules/s3/main.tf"),
+            ("bucket", "/repo/modules/s3/other.tf"),
+        ):
+            vertex_index = len(local_graph.vertices)
+            local_graph.vertices.append(
+                TerraformBlock(name=name, config={}, path=path, block_type=BlockType.VARIABLE, attributes={})
+            )
+            local_graph.vertices_by_module_dependency_by_name[("", "")][BlockType.VARIABLE][name].append(vertex_index)
+
+        vertex_lookup = TerraformVertexLookup(local_graph)
+
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.VARIABLE, "bucket", "/repo/outputs.tf", "", ""), 0)
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.VARIABLE, "bucket", "/repo/modules/s3/other.tf", "", ""), 2)
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.VARIABLE, "bucket", "/repo/modules/s3/outputs.tf", "", ""), 1)
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.VARIABLE, "bucket", "/repo/modules/main.tf", "", ""), -1)
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.VARIABLE, "other", "/repo/main.tf", "", ""), -1)
+        self.assertEqual(vertex_lookup.find_vertex_index(BlockType.LOCALS, "bucket", "/repo/main.tf", "", ""), -1)
@@ -2,7 +2,9 @@ import pprint
 from typing import List, Tuple
 from unittest import TestCase
 
+from checkov.common.graph.graph_builder import Edge
 from checkov.common.graph.graph_builder.graph_components.attribute_names import CustomAttributes
+from checkov.common.graph.graph_builder.utils import get_strongly_connected_components
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
 from checkov.terraform.graph_builder.utils import get_referenced_vertices_in_value, \
     replace_map_attribute_access_with_dot, generate_possible_strings_from_wildcards, \
@@ -65,6 +67,18 @@ class TestUtils(TestCase):
         actual_config = update_dictionary_attribute(origin_config, key_to_update, new_value)
         self.assertEqual(expected_config, actual_config, f'failed to update config.\nexpected: {expected_config}\ngot: {actual_config}')
 
+    def test_update_dictionary_attribute_copy_on_write(self):
+        origin_config = {'aws_s3_bucket': {'destination': {'bucket': ['tf-test-bucket-destination-12345'], 'acl': ['${var.acl}'], 'versioning': [{'enabled': ['${var.is_enabled}']}]}}}
+        key_to_update = 'versioning.enabled'
+        new_value = [False]
+        expected_origin_config = {'aws_s3_bucket': {'destination': {'bucket': ['tf-test-bucket-destination-12345'], 'acl': ['${var.acl}'], 'versioning': [{'enabled': ['${var.is_enabled}']}]}}}
+        actual_config = update_dictionary_attribute(origin_config, key_to_update, new_value)
+        self.assertEqual(expected_origin_config, origin_config)
+        self.assertEqual([{'enabled': [False]}], actual_config['aws_s3_bucket']['destination']['versioning'])
+        # unchanged attributes are shared with the original config
+        self.assertIs(origin_config['aws_s3_bucket']['destination']['bucket'], actual_config['aws_s3_bucket']['destination']['bucket'])
+        self.assertIs(origin_config['aws_s3_bucket']['destination']['acl'], actual_config['aws_s3_bucket']['destination']['acl'])
+
     def test_update_dictionary_locals(self):
         origin_config = {'aws_s3_bucket': {'destination': {'bucket': ['tf-test-bucket-destination-12345'], 'acl': ['${var.acl}'], 'versioning': [{'enabled': ['${var.is_enabled}']}]}}}
         key_to_update = 'acl'
@@ -73,6 +87,18 @@ class TestUtils(TestCase):
         actual_config = update_dictionary_attribute(origin_config, key_to_update, new_value)
         self.assertEqual(expected_config, actual_config, f'failed to update config.\nexpected: {expected_config}\ngot: {actual_config}')
 
+    def test_get_strongly_connected_components(self):
+        out_edges = {
+            0: [Edge(0, 1, "a")],
+            1: [Edge(1, 2, "a"), Edge(1, 3, "b")],
+            2: [Edge(2, 1, "a")],
+            3: [],
+            4: [Edge(4, 4, "a")],
+        }
+
+        # components are returned in reverse topological order
+        self.assertEqual([[3], [1, 2], [0], [4]], get_strongly_connected_components(out_edges))
+
     def test_generate_possible_strings_from_wildcards(self):
         origin_string = "a.*.b.*.c.*"
         expected_results = [
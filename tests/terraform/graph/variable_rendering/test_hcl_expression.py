@@ -0,0 +1,107 @@
+import pytest
+
+from checkov.terraform.graph_builder.variable_rendering.evaluate_terraform import evaluate_terraform, \
+    _evaluate_by_string_rewriting
+from checkov.terraform.graph_builder.variable_rendering.hcl_expression_interpreter import UNEVALUATED, \
+    evaluate_terraform_expression
+from checkov.terraform.graph_builder.variable_rendering.hcl_expression_parser import HclParseError, \
+    BinaryOperation, Literal, parse_hcl_expression
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    [
+        "1 + 2 * 3",
+        "${1 + 2 * 3}",
+        "10 / 4",
+        "7 % 3",
+        "${-5}",
+        '${1 == 1 ? "a" : "b"}',
+        'upper("abc")',
+        '${lower("ABC")}',
+        "${length([1, 2, 3])}",
+        "${max(1, 5, 3)}",
+        "${concat([1], [2, 3])}",
+        '${merge({"a" = 1}, {"b" = 2})}',
+        '${join("-", ["a", "b"])}',
+        '${split(",", "a,b")}',
+        "${[1, 2, 3][1]}",
+        '${{"a" = "x"}["a"]}',
+        '${format("%s-%s", "a", "b")}',
+        '${contains(["a"], "a")}',
+        '${lookup({"a" = 1}, "a", 0)}',
+        '${substr("hello", 1, 3)}',
+        "${tostring(1)}",
+        'replace("1 + 2 + 3", "+", "-")',
+        '${coalesce("", "b")}',
+        "${flatten([[1], [2]])}",
+        '${element(["a", "b"], 1)}',
+        '${jsonencode({"a" = 1})}',
+        '${"%{if true}yes%{else}no%{endif}"}',
+    ],
+)
+def test_same_result_as_string_rewriting(input_str: str) -> None:
+    # when
+    result = evaluate_terraform(input_str)
+
+    # then
+    expected = _evaluate_by_string_rewriting(input_str, False)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "input_str,expected",
+    [
+        # the string rewriting keeps these expressions as they are or evaluates them wrongly
+        ("${2 > 1}", True),
+        ("${true ? 1 : 2}", 1),
+        ("${!true}", False),
+        ("${1 < 2 && 3 > 2}", True),
+        ("${false || true}", True),
+        ("${[for x in [1, 2]: x * 2]}", [2, 4]),
+        ('${{for k, v in {"a" = 1}: k => v}}', {"a": 1}),
+        ('${[{"a" = 1}, {"a" = 2}][*].a}', [1, 2]),
+        ("abc-${1 + 1}", "abc-2"),
+        ("%{ for x in [1, 2] }${x}%{ endfor }", "12"),
+    ],
+)
+def test_evaluate_expressions_unsupported_by_string_rewriting(input_str: str, expected: object) -> None:
+    assert evaluate_terraform(input_str) == expected
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    [
+        "var.x",
+        "${var.x}-suffix",
+        '"5"',
+        "true",
+        '${1 == "1"}',
+        "${unknown_function(1)}",
+        "${1 +}",
+    ],
+)
+def test_unevaluated_expressions(input_str: str) -> None:
+    assert evaluate_terraform_expression(input_str) is UNEVALUATED
+
+
+def test_parse_operator_precedence() -> None:
+    # when
+    node = parse_hcl_expression("1 + 2 * 3")
+
+    # then
+    assert node == BinaryOperation(
+        operator="+",
+        left=Literal(1),
+        right=BinaryOperation(operator="*", left=Literal(2), right=Literal(3)),
+    )
+
+
+def test_parse_error() -> None:
+    with pytest.raises(HclParseError):
+        parse_hcl_expression("[1, 2")
+
+    # cached failures raise as well
+    with pytest.raises(HclParseError):
+        parse_hcl_expression("[1, 2")
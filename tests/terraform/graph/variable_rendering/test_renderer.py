@@ -5,7 +5,9 @@ from unittest import mock
 from unittest.case import TestCase
 
 from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.common.graph.graph_builder import Edge
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
+from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
 from checkov.terraform.graph_manager import TerraformGraphManager
 from checkov.terraform.graph_builder.variable_rendering.renderer import TerraformVariableRenderer
 from checkov.terraform.graph_builder.graph_to_tf_definitions import convert_graph_vertices_to_tf_definitions
@@ -419,3 +421,23 @@ class TestRenderer(TestCase):
         resources_vertex = list(filter(lambda v: v.block_type == BlockType.RESOURCE, local_graph.vertices))
         assert resources_vertex[0].attributes.get('identity').get('identity_ids') == 'null'
         assert resources_vertex[0].attributes.get('identity').get('type') == 'SystemAssigned'
+
+    def test_get_edges_by_rendering_level(self):
+        # resource 0 -> local 1 -> variable 2, local 3 <-> local 4 is a cycle and resource 5 -> local 3 depends on it
+        local_graph = TerraformLocalGraph(module=mock.MagicMock())
+        local_graph.vertices = [mock.MagicMock() for _ in range(6)]
+        edges = [
+            Edge(0, 1, "bucket"),
+            Edge(1, 2, "name"),
+            Edge(3, 4, "name"),
+            Edge(4, 3, "name"),
+            Edge(4, 2, "prefix"),
+            Edge(5, 3, "bucket"),
+        ]
+        for edge in edges:
+            local_graph.out_edges[edge.origin].append(edge)
+            local_graph.in_edges[edge.dest].append(edge)
+
+        levels = TerraformVariableRenderer(local_graph).get_edges_by_rendering_level()
+
+        self.assertEqual([[edges[1], edges[4]], [edges[0]]], levels)
@@ -3,7 +3,8 @@ from unittest import TestCase, mock
 from datetime import datetime
 
 from checkov.terraform.graph_builder.variable_rendering.evaluate_terraform import evaluate_terraform, replace_string_value, \
-    remove_interpolation
+    remove_interpolation, evaluated_terraform_cache
+from checkov.terraform.graph_builder.variable_rendering.safe_eval_functions import compiled_expressions_cache
 
 
 class TestTerraformEvaluation(TestCase):
@@ -447,3 +448,26 @@ class TestTerraformEvaluation(TestCase):
         input_str = 'formatdate("HH \'Hours and \'M \'Minute(s)\'", "2018-01-02T23:12:01Z")'
         expected = "11 Hours and 1 Minute(s)"
         self.assertEqual(expected, evaluate_terraform(input_str))
+
+    def test_evaluation_is_cached(self):
+        input_str = 'concat(["cached-a"], ["cached-b"])'
+        evaluated_terraform_cache.clear()
+
+        first = evaluate_terraform(input_str)
+        first.append("changed")
+        second = evaluate_terraform(input_str)
+
+        # the cached value is not affected by changes of the callers
+        self.assertEqual(["cached-a", "cached-b"], second)
+        self.assertEqual(1, evaluated_terraform_cache.get_stats()["hits"])
+
+    def test_invalid_expression_compilation_is_cached(self):
+        input_str = 'invalid-expression-${'
+        compiled_expressions_cache.clear()
+
+        self.assertEqual(input_str, evaluate_terraform(input_str))
+        misses = compiled_expressions_cache.get_stats()["misses"]
+        evaluated_terraform_cache.clear()
+        self.assertEqual(input_str, evaluate_terraform(input_str))
+
+        self.assertEqual(misses, compiled_expressions_cache.get_stats()["misses"])
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from checkov.common.util.parser_utils import eval_string
-from checkov.terraform.parser import _load_or_die_quietly
+from checkov.terraform.parser import Parser, _load_or_die_quietly
 
 
 def test_eval_string_to_list():
@@ -54,3 +54,35 @@ def test__load_or_die_quietly_without_bom():
             }
         ]
     }
+
+
+def test_parse_cache_skips_parsing_of_unchanged_files(tmp_path, mocker):
+    # given
+    source_dir = Path(__file__).parent / "resources/parse_file_vs_dir"
+    cache_dir = str(tmp_path / "cache")
+    _, cold_definitions = Parser().parse_hcl_module(str(source_dir), "terraform", parse_cache_dir=cache_dir)
+
+    # when
+    hcl2_load = mocker.patch("checkov.terraform.parser.hcl2.load")
+    warm_parser = Parser()
+    _, warm_definitions = warm_parser.parse_hcl_module(str(source_dir), "terraform", parse_cache_dir=cache_dir)
+
+    # then
+    hcl2_load.assert_not_called()
+    assert warm_definitions == cold_definitions
+    assert warm_parser.parse_cache.get_stats()["hits"] == 1
+
+
+def test_parallel_parsing_matches_serial_parsing(mocker):
+    # given
+    source_dir = str(Path(__file__).parent / "resources/parser_scenarios")
+    _, serial_definitions = Parser().parse_hcl_module(source_dir, "terraform", create_graph=False)
+
+    # when
+    mocker.patch("checkov.terraform.parser.PARALLEL_PARSING_MIN_FILES", 0)
+    parallel_parser = Parser()
+    _, parallel_definitions = parallel_parser.parse_hcl_module(source_dir, "terraform", create_graph=False)
+
+    # then
+    assert parallel_definitions == serial_definitions
+    assert len(parallel_parser.loaded_files_map) > 1
@@ -0,0 +1,133 @@
+import json
+from pathlib import Path
+
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.incremental_scan import INCREMENTAL_STATE_FILE_NAME
+from checkov.terraform.runner import Runner
+
+BUCKET_RESOURCE = """
+resource "aws_s3_bucket" "bucket" {
+  bucket = "example"
+  acl    = var.acl
+}
+"""
+
+NO_CHECKS_RESOURCE = """
+resource "null_resource" "noop" {}
+"""
+
+ACL_VARIABLE = """
+variable "acl" {
+  default = "%s"
+}
+"""
+
+
+def create_project(root: Path) -> None:
+    for name in ("app", "other"):
+        (root / name).mkdir()
+        (root / name / "main.tf").write_text(BUCKET_RESOURCE)
+        (root / name / "variables.tf").write_text(ACL_VARIABLE % "private")
+
+
+def get_results(report):
+    return sorted(
+        (record.check_id, record.file_path, record.resource, record.check_result["result"].name)
+        for record in report.get_all_records()
+    )
+
+
+def test_incremental_scan_only_rescans_impacted_files(tmp_path: Path, mocker):
+    # given
+    root = tmp_path / "project"
+    root.mkdir()
+    create_project(root)
+    runner_filter = RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"], incremental_state_dir=str(tmp_path / "state"))
+
+    Runner().run(root_folder=str(root), runner_filter=runner_filter)
+    (root / "app" / "variables.tf").write_text(ACL_VARIABLE % "public-read")
+
+    # when
+    run_all_blocks_spy = mocker.spy(Runner, "run_all_blocks")
+    incremental_report = Runner().run(root_folder=str(root), runner_filter=runner_filter)
+
+    # then
+    scanned_files = {call.args[3] for call in run_all_blocks_spy.call_args_list}
+    assert scanned_files == {str(root / "app" / "main.tf"), str(root / "app" / "variables.tf")}
+
+    full_report = Runner().run(root_folder=str(root), runner_filter=RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"]))
+    assert get_results(incremental_report) == get_results(full_report)
+    assert get_results(incremental_report) == [
+        ("CKV_AWS_20", "/app/main.tf", "aws_s3_bucket.bucket", "FAILED"),
+        ("CKV_AWS_20", "/other/main.tf", "aws_s3_bucket.bucket", "PASSED"),
+    ]
+
+
+def get_report_data(report):
+    return {
+        "records": get_results(report),
+        "extra_resources": sorted((resource.file_path, resource.resource) for resource in report.extra_resources),
+        "resources": sorted(report.resources),
+        "summary": report.get_summary(),
+    }
+
+
+def test_incremental_scan_report_equals_full_report(tmp_path: Path):
+    # given
+    root = tmp_path / "project"
+    root.mkdir()
+    create_project(root)
+    (root / "other" / "noop.tf").write_text(NO_CHECKS_RESOURCE)
+    runner_filter = RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"], incremental_state_dir=str(tmp_path / "state"))
+    full_runner_filter = RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"])
+
+    # when
+    first_report = Runner().run(root_folder=str(root), runner_filter=runner_filter)
+    (root / "app" / "variables.tf").write_text(ACL_VARIABLE % "public-read")
+    incremental_report = Runner().run(root_folder=str(root), runner_filter=runner_filter)
+    full_report = Runner().run(root_folder=str(root), runner_filter=full_runner_filter)
+
+    # then
+    assert ("/other/noop.tf", "null_resource.noop") in get_report_data(full_report)["extra_resources"]
+    assert get_report_data(incremental_report) == get_report_data(full_report)
+    assert get_report_data(first_report)["extra_resources"] == get_report_data(full_report)["extra_resources"]
+
+
+def test_incremental_scan_runs_full_scan_on_changed_configuration(tmp_path: Path, mocker):
+    # given
+    root = tmp_path / "project"
+    root.mkdir()
+    create_project(root)
+    state_dir = str(tmp_path / "state")
+
+    Runner().run(root_folder=str(root), runner_filter=RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"], incremental_state_dir=state_dir))
+
+    # when
+    run_all_blocks_spy = mocker.spy(Runner, "run_all_blocks")
+    Runner().run(root_folder=str(root), runner_filter=RunnerFilter(framework=["terraform"], checks=["CKV_AWS_21"], incremental_state_dir=state_dir))
+
+    # then
+    assert run_all_blocks_spy.call_count == 4
+
+
+def test_incremental_scan_state_is_plain_json(tmp_path: Path, mocker):
+    # given
+    root = tmp_path / "project"
+    root.mkdir()
+    create_project(root)
+    state_dir = tmp_path / "state"
+    runner_filter = RunnerFilter(framework=["terraform"], checks=["CKV_AWS_20"], incremental_state_dir=str(state_dir))
+
+    full_report = Runner().run(root_folder=str(root), runner_filter=runner_filter)
+    state = json.loads((state_dir / INCREMENTAL_STATE_FILE_NAME).read_text())
+    reused_report = Runner().run(root_folder=str(root), runner_filter=runner_filter)
+
+    # when
+    (state_dir / INCREMENTAL_STATE_FILE_NAME).write_bytes(b"\x80\x04not a json state")
+    run_all_blocks_spy = mocker.spy(Runner, "run_all_blocks")
+    Runner().run(root_folder=str(root), runner_filter=runner_filter)
+
+    # then
+    assert len(state["results"]) == 4
+    assert [record.to_dict() for record in reused_report.get_all_records()] == [record.to_dict() for record in full_report.get_all_records()]
+    assert run_all_blocks_spy.call_count == 4